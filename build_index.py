@@ -0,0 +1,91 @@
+"""
+Compiles node_data into the prebuilt node index loaded by the server at startup.
+
+Usage:
+    python main.py build-index [--output PATH]
+    python build_index.py [--output PATH]
+
+Rebuild the index whenever the classification files or node definition
+folders change; the server ignores an index built from different
+classification files, skips the entries of any folder that changed since
+the build, and falls back to reading node_data directly.
+"""
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from config import CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH, NODE_INDEX_PATH
+from mcp_components.node_catalog import NodeCatalog
+from mcp_components.node_files import NodeManifestIndex, available_versions
+from mcp_components.node_index import file_sha256, folder_fingerprint, folder_key, write_node_index
+from mcp_components.node_schema import SCHEMA_EXTRACTOR_VERSION, NodeSchemaCache, index_key
+
+def build_node_index(output_path: str) -> dict[str, Any]:
+    """Scan node_data, extract every node schema and write the index file (blocking)."""
+    started = time.monotonic()
+    catalog = NodeCatalog(CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH)
+    catalog.load()
+
+    manifests = NodeManifestIndex()
+    manifests.build(catalog.node_folders())
+    schemas = NodeSchemaCache()
+
+    entries: dict[str, Any] = {
+        "catalog": {
+            "category_data": catalog.category_data,
+            "class_data": catalog.class_data,
+            "type_folders": {node_type: folder_key(folder) for node_type, folder in catalog.type_folders.items()}
+        }
+    }
+    schema_count = 0
+    for folder in catalog.node_folders():
+        manifest = manifests.peek(folder)
+        if manifest is not None:
+            entries[f"manifest:{folder_key(folder)}"] = manifest
+            entries[f"fingerprint:{folder_key(folder)}"] = folder_fingerprint(folder)
+    for node_type, folder in catalog.type_folders.items():
+        manifest = manifests.peek(folder)
+        if manifest is None:
+            continue
+        for version in available_versions(manifest) or [None]:
+            try:
+                entries[index_key(node_type, version)] = schemas.compute(node_type, folder, version, manifest)
+                schema_count += 1
+            except Exception as e:
+                logging.warning(f"Skipping schema of {node_type} (version {version}): {e}")
+
+    summary = {
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "category_sha256": file_sha256(CATEGORY_CLASSIFICATION_FILE_PATH),
+        "class_sha256": file_sha256(CLASS_CLASSIFICATION_FILE_PATH),
+        "schema_extractor_version": SCHEMA_EXTRACTOR_VERSION,
+        "node_types": len(catalog.type_folders),
+        "folders": len(catalog.node_folders()),
+        "schemas": schema_count
+    }
+    entries["meta"] = summary
+    size = write_node_index(output_path, entries)
+    return {**summary, "path": output_path, "bytes": size, "seconds": round(time.monotonic() - started, 2)}
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="build-index", description="Compile node_data into a prebuilt node index.")
+    parser.add_argument("--output", default=NODE_INDEX_PATH, help=f"Index file to write (default: {NODE_INDEX_PATH})")
+    args = parser.parse_args(argv)
+    try:
+        summary = build_node_index(args.output)
+    except Exception as e:
+        print(f"Failed to build node index: {e}")
+        logging.error(f"Failed to build node index: {e}", exc_info=True)
+        return 1
+    print(
+        f"Node index written to {summary['path']}: {summary['node_types']} node types, "
+        f"{summary['folders']} folders, {summary['schemas']} schemas, "
+        f"{summary['bytes']} bytes in {summary['seconds']}s"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -34,6 +34,17 @@ logging.basicConfig(
 N8N_BASE_URL: str = os.getenv("N8N_BASE_URL", "http://localhost:5678")
 N8N_API_KEY: Optional[str] = os.getenv("N8N_API_KEY")
 
+# Shared HTTP pool of the n8n client: pool limits, keep-alive, HTTP/2 (needs the 'h2'
+# package) and per-request connect/read/write/pool-wait timeouts
+N8N_HTTP_MAX_CONNECTIONS: int = int(os.getenv("N8N_HTTP_MAX_CONNECTIONS", "32"))
+N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS", "16"))
+N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+N8N_HTTP2: bool = os.getenv("N8N_HTTP2", "false").strip().lower() in ("1", "true", "yes", "on")
+N8N_HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("N8N_HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+N8N_HTTP_READ_TIMEOUT_SECONDS: float = float(os.getenv("N8N_HTTP_READ_TIMEOUT_SECONDS", "30"))
+N8N_HTTP_WRITE_TIMEOUT_SECONDS: float = float(os.getenv("N8N_HTTP_WRITE_TIMEOUT_SECONDS", "30"))
+N8N_HTTP_POOL_TIMEOUT_SECONDS: float = float(os.getenv("N8N_HTTP_POOL_TIMEOUT_SECONDS", "10"))
+
 # Create n8n client instance (to be shared)
 n8n_client: Optional[N8nClient] = None
 try:
@@ -54,13 +65,60 @@ CLASS_CLASSIFICATION_FILE_PATH: str = os.getenv(
     "CLASS_CLASSIFICATION_PATH",
     os.path.join(NODE_DATA_BASE_PATH, "class_classification_result.json")
 )
+NODE_ALL_NODES_PATH_BASE: str = os.getenv("NODE_ALL_NODES_PATH", os.path.join(NODE_DATA_BASE_PATH, "all_nodes"))
 NODE_CATEGORIES_PATH_BASE: str = os.path.join(NODE_DATA_BASE_PATH, "categories")
 NODE_CLASSES_PATH_BASE: str = os.path.join(NODE_DATA_BASE_PATH, "classes")
+NODE_FILE_READ_WORKERS: int = int(os.getenv("NODE_FILE_READ_WORKERS", "8"))
+NODE_SCHEMA_CACHE_PATH: str = os.getenv("NODE_SCHEMA_CACHE_PATH", os.path.join(os.getcwd(), ".cache", "node_schemas"))
+NODE_INDEX_PATH: str = os.getenv("NODE_INDEX_PATH", os.path.join(NODE_DATA_BASE_PATH, "node_index.bin"))
+
+# Workflow Cache Configuration (a TTL of 0 disables caching)
+WORKFLOW_CACHE_TTL_SECONDS: float = float(os.getenv("WORKFLOW_CACHE_TTL_SECONDS", "30"))
+WORKFLOW_CACHE_MAX_BYTES: int = int(os.getenv("WORKFLOW_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Local Workflow Mirror (a sync interval of 0 disables the background sync)
+WORKFLOW_MIRROR_PATH: str = os.getenv("WORKFLOW_MIRROR_PATH", os.path.join(os.getcwd(), ".cache", "workflow_mirror.sqlite3"))
+WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS: float = float(os.getenv("WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS", "300"))
+WORKFLOW_MIRROR_SYNC_CONCURRENCY: int = int(os.getenv("WORKFLOW_MIRROR_SYNC_CONCURRENCY", "4"))
+
+# Upper bound on workflows returned by one list_workflows call (pages are followed up to it)
+LIST_WORKFLOWS_MAX_ITEMS: int = int(os.getenv("LIST_WORKFLOWS_MAX_ITEMS", "1000"))
+
+# Upper bound on executions one list_workflow_executions call returns or aggregates
+EXECUTION_LIST_MAX_ITEMS: int = int(os.getenv("EXECUTION_LIST_MAX_ITEMS", "5000"))
+
+# Chunked get_execution: items per chunk and approximate JSON size bound of a chunk
+EXECUTION_CHUNK_ITEMS: int = int(os.getenv("EXECUTION_CHUNK_ITEMS", "100"))
+EXECUTION_CHUNK_MAX_BYTES: int = int(os.getenv("EXECUTION_CHUNK_MAX_BYTES", str(256 * 1024)))
+
+# execution_overview: parallel requests and how long an overview is reused
+EXECUTION_OVERVIEW_CONCURRENCY: int = int(os.getenv("EXECUTION_OVERVIEW_CONCURRENCY", "8"))
+EXECUTION_OVERVIEW_CACHE_TTL_SECONDS: float = float(os.getenv("EXECUTION_OVERVIEW_CACHE_TTL_SECONDS", "60"))
+
+# summarize_execution: number of finished-execution summaries kept in memory
+EXECUTION_SUMMARY_CACHE_SIZE: int = int(os.getenv("EXECUTION_SUMMARY_CACHE_SIZE", "256"))
+
+# Finished-execution cache: memory budget (0 disables the cache), compressed on-disk
+# store and its size budget (0 keeps executions in memory only)
+EXECUTION_CACHE_MAX_BYTES: int = int(os.getenv("EXECUTION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+EXECUTION_CACHE_SPILL_PATH: str = os.getenv("EXECUTION_CACHE_SPILL_PATH", os.path.join(os.getcwd(), ".cache", "executions"))
+EXECUTION_CACHE_SPILL_MAX_BYTES: int = int(os.getenv("EXECUTION_CACHE_SPILL_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# prune_executions: most executions deleted per call and delete rate limit (0 for none)
+EXECUTION_PRUNE_MAX_ITEMS: int = int(os.getenv("EXECUTION_PRUNE_MAX_ITEMS", "10000"))
+EXECUTION_PRUNE_REQUESTS_PER_SECOND: float = float(os.getenv("EXECUTION_PRUNE_REQUESTS_PER_SECOND", "20"))
+
+# Bulk Operation Configuration
+BULK_ACTION_CONCURRENCY: int = int(os.getenv("BULK_ACTION_CONCURRENCY", "8"))
+BULK_ACTION_MAX_RETRIES: int = int(os.getenv("BULK_ACTION_MAX_RETRIES", "2"))
+BULK_ACTION_RETRY_BACKOFF_SECONDS: float = float(os.getenv("BULK_ACTION_RETRY_BACKOFF_SECONDS", "0.5"))
 
 # Log configured paths for verification
 logging.debug(f"NODE_DATA_BASE_PATH: {NODE_DATA_BASE_PATH}")
 logging.debug(f"CATEGORY_CLASSIFICATION_FILE_PATH: {CATEGORY_CLASSIFICATION_FILE_PATH}")
 logging.debug(f"CLASS_CLASSIFICATION_FILE_PATH: {CLASS_CLASSIFICATION_FILE_PATH}")
+logging.debug(f"NODE_ALL_NODES_PATH_BASE: {NODE_ALL_NODES_PATH_BASE}")
+logging.debug(f"NODE_INDEX_PATH: {NODE_INDEX_PATH}")
 
 # Ensure critical configurations are present
 if not N8N_BASE_URL:
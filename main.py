@@ -3,6 +3,7 @@ Main entry point for the n8n MCP Server.
 Imports the application instance and component modules to trigger decorator-based registration.
 """
 import os
+import sys
 import logging
 
 # Import the FastMCP application instance from mcp_server.py
@@ -18,6 +19,11 @@ from config import n8n_client, CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFI
 
 # Main execution block
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "build-index":
+        # Compile node_data into the prebuilt node index instead of starting the server
+        import build_index
+        sys.exit(build_index.main(sys.argv[2:]))
+
     logging.info(f"Starting n8n MCP Server ({app.name})...")
     
     if not n8n_client:
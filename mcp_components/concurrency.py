@@ -0,0 +1,66 @@
+'''
+Helpers for fanning out n8n API calls with bounded concurrency and retries.
+'''
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+from n8n_sdk_python.utils.errors import N8nAPIError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether an n8n API failure is transient: a transport error, 429 or a 5xx response."""
+    if not isinstance(error, N8nAPIError):
+        return False
+    return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+
+async def call_with_retries(
+    call: Callable[[], Awaitable[T]],
+    max_retries: int,
+    backoff_seconds: float,
+    description: str = "n8n API call"
+) -> T:
+    """Await call(), retrying transient failures with exponential backoff; re-raises the last error."""
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable_error(e):
+                raise
+            delay = backoff_seconds * (2 ** attempt)
+            attempt += 1
+            logging.warning(f"{description} failed ({e}); retry {attempt}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def map_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int,
+    min_interval: Optional[float] = None
+) -> list[R]:
+    """
+    Run worker over items with at most `concurrency` calls in flight; results keep input order.
+
+    If min_interval is given, calls are also started at least that many
+    seconds apart, which caps the request rate at 1 / min_interval per second.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    rate_lock = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def run(item: T) -> R:
+        nonlocal next_start
+        async with semaphore:
+            if min_interval:
+                async with rate_lock:
+                    delay = next_start - loop.time()
+                    next_start = max(next_start, loop.time()) + min_interval
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
@@ -0,0 +1,262 @@
+'''
+Cache of finished executions fetched from the n8n API.
+
+An execution that has stopped (succeeded, failed, crashed or was canceled)
+never changes again, so it can be reused without a TTL. Entries are held in
+memory under a byte budget and written, gzip-compressed, to a bounded
+on-disk store, which keeps them available after they are evicted from
+memory and across restarts. Running and waiting executions are never cached.
+
+Execution ids are only unique per n8n instance, so the on-disk store lives
+in a subdirectory keyed by a hash of N8N_BASE_URL. Cached executions carry
+full run data, so the directory and its files are private to the user.
+'''
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from n8n_sdk_python.models.executions import Execution
+
+from config import n8n_client, N8N_BASE_URL, EXECUTION_CACHE_MAX_BYTES, EXECUTION_CACHE_SPILL_PATH, EXECUTION_CACHE_SPILL_MAX_BYTES
+from mcp_components.execution_stats import execution_finished
+from mcp_components.node_files import run_blocking
+
+# (execution_id, include_data) as passed to n8n_client.get_execution
+CacheKey = tuple[str, bool]
+
+_SPILL_SUFFIX = ".json.gz"
+
+def instance_directory(base_path: str, base_url: str) -> str:
+    """Per-instance subdirectory of base_path, so executions of different n8n instances never collide."""
+    digest = hashlib.sha256(base_url.strip().rstrip("/").encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base_path, digest)
+
+def _spill_name(key: CacheKey) -> str:
+    digest = hashlib.sha256(f"{key[0]}\0{int(key[1])}".encode("utf-8")).hexdigest()
+    return f"{digest}{_SPILL_SUFFIX}"
+
+class _SpillStore:
+    """
+    Directory of gzip-compressed execution JSON files with a total size budget.
+
+    Files are tracked in least recently used order (initially by mtime) and
+    the oldest are removed once the budget is exceeded. All methods block and
+    are meant to run on the file I/O pool.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._files: Optional[OrderedDict[str, int]] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _scan(self) -> OrderedDict[str, int]:
+        if self._files is None:
+            entries: list[tuple[float, str, int]] = []
+            try:
+                with os.scandir(self.path) as scan:
+                    for entry in scan:
+                        if entry.is_file() and entry.name.endswith(_SPILL_SUFFIX):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, entry.name, stat.st_size))
+            except FileNotFoundError:
+                pass
+            self._files = OrderedDict((name, size) for _, name, size in sorted(entries))
+            self._size = sum(self._files.values())
+        return self._files
+
+    def _unlink(self, name: str) -> None:
+        self._size -= self._scan().pop(name, 0)
+        try:
+            os.remove(os.path.join(self.path, name))
+        except FileNotFoundError:
+            pass
+
+    def read(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            files = self._scan()
+            if name not in files:
+                return None
+            try:
+                with open(os.path.join(self.path, name), "rb") as f:
+                    data = gzip.decompress(f.read())
+            except (OSError, EOFError) as e:
+                logging.warning(f"Ignoring unreadable execution cache file {name}: {e}")
+                self._unlink(name)
+                return None
+            files.move_to_end(name)
+            return data
+
+    def write(self, name: str, data: bytes) -> None:
+        compressed = gzip.compress(data, compresslevel=6)
+        if len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            files = self._scan()
+            try:
+                os.makedirs(self.path, mode=0o700, exist_ok=True)
+                # makedirs honours the umask and leaves existing directories as they are
+                os.chmod(self.path, 0o700)
+                file_path = os.path.join(self.path, name)
+                temp_file = f"{file_path}.{os.getpid()}.tmp"
+                descriptor = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(compressed)
+                os.replace(temp_file, file_path)
+            except OSError as e:
+                logging.warning(f"Could not write execution cache file {name}: {e}")
+                return
+            self._size -= files.pop(name, 0)
+            files[name] = len(compressed)
+            self._size += len(compressed)
+            while self._size > self.max_bytes and files:
+                self._unlink(next(iter(files)))
+
+    def remove(self, names: list[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._unlink(name)
+
+class ExecutionCache:
+    """
+    Async-safe, two-level cache of finished Execution models.
+
+    The memory level is an LRU sized by serialized JSON length; every stored
+    execution is also written to the compressed spill store in the background,
+    and a memory miss checks that store before going to the API. A request
+    without data is answered from a cached copy with data when there is one.
+    Concurrent misses for the same key share a single upstream request.
+
+    Cached models are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int, spill_path: str, spill_max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, tuple[Execution, int]] = OrderedDict()
+        self._size = 0
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        self._spill = _SpillStore(spill_path, spill_max_bytes) if spill_max_bytes > 0 else None
+        # Keeps background spill writes referenced until they finish
+        self._writes: set[asyncio.Future] = set()
+        # Bumped by invalidate() so in-flight fetches of a deleted execution are not cached
+        self._epochs: dict[str, int] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def _remember(self, key: CacheKey, execution: Execution, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (execution, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def peek(self, key: CacheKey) -> Optional[Execution]:
+        """Return a cached execution from memory without fetching, or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        if not key[1]:
+            with_data = self._entries.get((key[0], True))
+            if with_data is not None:
+                self._entries.move_to_end((key[0], True))
+                return with_data[0].model_copy(update={"data": None})
+        return None
+
+    def put(self, key: CacheKey, execution: Execution) -> None:
+        """Store a finished execution in memory and the spill store; unfinished ones are ignored."""
+        if not self.enabled or not execution_finished(execution):
+            return
+        # Serialized without exclude_none so the spilled copy keeps the execution data intact
+        data = execution.model_dump_json().encode("utf-8")
+        self._remember(key, execution, len(data))
+        if self._spill is not None:
+            write = asyncio.ensure_future(run_blocking(self._spill.write, _spill_name(key), data))
+            self._writes.add(write)
+            write.add_done_callback(self._writes.discard)
+
+    async def _load(self, key: CacheKey, fetch: Callable[[], Awaitable[Execution]], epoch: int) -> Execution:
+        if self._spill is not None:
+            data = await run_blocking(self._spill.read, _spill_name(key))
+            if data is not None:
+                execution = Execution.model_validate_json(data)
+                self.disk_hits += 1
+                self._remember(key, execution, len(data))
+                return execution
+        self.misses += 1
+        execution = await fetch()
+        if self._epochs.get(key[0], 0) == epoch:
+            self.put(key, execution)
+        return execution
+
+    async def get(self, key: CacheKey, fetch: Callable[[], Awaitable[Execution]]) -> Execution:
+        """Return the cached execution for key, reading the spill store or calling fetch() once on a miss."""
+        if not self.enabled:
+            return await fetch()
+        execution = self.peek(key)
+        if execution is not None:
+            self.hits += 1
+            return execution
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, fetch, self._epochs.get(key[0], 0)))
+            self._inflight[key] = pending
+
+            def _done(future: asyncio.Future) -> None:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+            pending.add_done_callback(_done)
+        else:
+            self.hits += 1
+        # Shield the shared load so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(pending)
+
+    async def invalidate(self, execution_id: str) -> None:
+        """Forget a deleted execution, in memory and on disk."""
+        self._epochs[execution_id] = self._epochs.get(execution_id, 0) + 1
+        if self._writes:
+            # Let pending spill writes land first so they cannot resurrect the execution
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        keys = [(execution_id, include_data) for include_data in (False, True)]
+        for key in keys:
+            self._remove(key)
+            self._inflight.pop(key, None)
+        if self._spill is not None:
+            await run_blocking(self._spill.remove, [_spill_name(key) for key in keys])
+
+# Shared cache used by the execution tools (EXECUTION_CACHE_MAX_BYTES=0 disables it)
+execution_cache = ExecutionCache(
+    EXECUTION_CACHE_MAX_BYTES,
+    instance_directory(EXECUTION_CACHE_SPILL_PATH, N8N_BASE_URL),
+    EXECUTION_CACHE_SPILL_MAX_BYTES
+)
+
+async def get_execution_cached(execution_id: str, include_data: bool = False) -> Execution:
+    """Fetch an execution through the shared cache; raises like n8n_client.get_execution."""
+    if not n8n_client:
+        raise RuntimeError("n8n_client is not initialized.")
+    return await execution_cache.get(
+        (execution_id, bool(include_data)),
+        lambda: n8n_client.get_execution(execution_id=execution_id, include_data=include_data)
+    )
@@ -0,0 +1,222 @@
+'''
+Chunked traversal of an execution's runData.
+
+runData maps each node name to its runs; every run holds, per connection
+type ("main", "ai_tool", ...), a list of outputs, each a list of items.
+A position in that tree is (node, run, output, item), where outputs of all
+connection types of a run are numbered in order. Chunks are read from a
+position without copying the rest of the data, and positions are handed
+to clients as opaque continuation cursors. summarize_run_data() condenses
+the same tree to per-node statistics.
+'''
+import json
+from typing import Any, Optional
+
+# (node index, run index, output index, item index)
+Position = tuple[int, int, int, int]
+
+_RUN_INFO_KEYS: tuple[str, ...] = ("startTime", "executionTime", "executionStatus", "error")
+
+def run_data_of(data: Optional[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Return resultData.runData of an execution's data, or an empty mapping."""
+    result_data = (data or {}).get("resultData") or {}
+    run_data = result_data.get("runData")
+    return run_data if isinstance(run_data, dict) else {}
+
+def _run_outputs(run: dict[str, Any]) -> list[tuple[str, int, list[Any]]]:
+    """Flatten a run's outputs to (connection type, output index, items)."""
+    outputs: list[tuple[str, int, list[Any]]] = []
+    for connection_type, connection_outputs in ((run or {}).get("data") or {}).items():
+        for output_index, items in enumerate(connection_outputs or []):
+            outputs.append((connection_type, output_index, items or []))
+    return outputs
+
+def encode_position(position: Position) -> str:
+    return ".".join(str(part) for part in position)
+
+def decode_position(cursor: Optional[str]) -> Position:
+    """Parse a continuation cursor; raises ValueError if it is malformed."""
+    if not cursor:
+        return (0, 0, 0, 0)
+    parts = cursor.split(".")
+    if len(parts) != 4 or not all(part.isdigit() for part in parts):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return tuple(int(part) for part in parts)  # type: ignore[return-value]
+
+def run_data_overview(run_data: dict[str, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Per node: number of runs and output items, without touching the items themselves."""
+    overview = []
+    for node_name, runs in run_data.items():
+        items = sum(len(output_items) for run in runs or [] for _, _, output_items in _run_outputs(run))
+        errors = sum(1 for run in runs or [] if (run or {}).get("error"))
+        overview.append({"node": node_name, "runs": len(runs or []), "items": items, "errors": errors})
+    return overview
+
+def items_before(run_data: dict[str, list[dict[str, Any]]], position: Position) -> int:
+    """Number of items that precede a position, for progress reporting."""
+    count = 0
+    for node_index, runs in enumerate(run_data.values()):
+        if node_index > position[0]:
+            break
+        for run_index, run in enumerate(runs or []):
+            if node_index == position[0] and run_index > position[1]:
+                break
+            for output_index, (_, _, items) in enumerate(_run_outputs(run)):
+                if (node_index, run_index) == position[:2]:
+                    if output_index > position[2]:
+                        break
+                    if output_index == position[2]:
+                        count += min(position[3], len(items))
+                        break
+                count += len(items)
+    return count
+
+def read_chunk(
+    run_data: dict[str, list[dict[str, Any]]],
+    position: Position,
+    max_items: int,
+    max_bytes: int,
+    node_name: Optional[str] = None
+) -> tuple[list[dict[str, Any]], int, Optional[Position]]:
+    """
+    Read up to max_items items (and roughly max_bytes of JSON) starting at position.
+
+    Returns the chunk as groups of consecutive items of one output, the number
+    of items read and the position to continue from (None when done). With
+    node_name, only that node is read. A single item larger than max_bytes is
+    still returned on its own so the reader always makes progress.
+    """
+    node_names = list(run_data)
+    if node_name is not None:
+        if node_name not in run_data:
+            raise KeyError(f"Node '{node_name}' has no run data in this execution")
+        only = node_names.index(node_name)
+        if position[0] < only:
+            position = (only, 0, 0, 0)
+        last_node = only
+    else:
+        last_node = len(node_names) - 1
+
+    groups: list[dict[str, Any]] = []
+    count = 0
+    size = 0
+    start_node, start_run, start_output, start_item = position
+    for node_index in range(start_node, last_node + 1):
+        runs = run_data[node_names[node_index]] or []
+        for run_index in range(start_run if node_index == start_node else 0, len(runs)):
+            run = runs[run_index] or {}
+            outputs = _run_outputs(run)
+            first_output = start_output if (node_index, run_index) == (start_node, start_run) else 0
+            run_info = {key: run[key] for key in _RUN_INFO_KEYS if run.get(key) is not None}
+            if not outputs and first_output == 0:
+                # Runs without output (typically failed ones) still report their status
+                groups.append({"node": node_names[node_index], "run": run_index, "items": [], "run_info": run_info})
+            for output_position in range(first_output, len(outputs)):
+                connection_type, output_index, items = outputs[output_position]
+                first_item = start_item if (node_index, run_index, output_position) == position[:3] else 0
+                group: dict[str, Any] = {
+                    "node": node_names[node_index],
+                    "run": run_index,
+                    "type": connection_type,
+                    "output": output_index,
+                    "start": first_item,
+                    "total_items": len(items),
+                    "items": []
+                }
+                if first_item == 0 and output_position == 0:
+                    group["run_info"] = run_info
+                groups.append(group)
+                for item_index in range(first_item, len(items)):
+                    item_size = len(json.dumps(items[item_index], default=str, ensure_ascii=False))
+                    if count >= max_items or (count > 0 and size + item_size > max_bytes):
+                        if not group["items"]:
+                            groups.pop()
+                        return groups, count, (node_index, run_index, output_position, item_index)
+                    group["items"].append(items[item_index])
+                    count += 1
+                    size += item_size
+    return groups, count, None
+
+# Longest error stack returned by summarize_run_data
+_STACK_MAX_CHARS = 2000
+
+def _error_summary(error: Any, include_stack: bool) -> Optional[dict[str, Any]]:
+    """Pick the useful fields of an n8n error object."""
+    if not isinstance(error, dict):
+        return {"message": str(error)} if error else None
+    summary = {
+        key: error[key] for key in ("message", "description", "name", "httpCode") if error.get(key) not in (None, "")
+    }
+    node = error.get("node")
+    if isinstance(node, dict) and node.get("name"):
+        summary["node"] = node["name"]
+    if include_stack and isinstance(error.get("stack"), str):
+        stack = error["stack"]
+        summary["stack"] = stack if len(stack) <= _STACK_MAX_CHARS else stack[:_STACK_MAX_CHARS] + "..."
+    return summary
+
+def _sample(item: Any) -> Any:
+    """An item's JSON without its binary payload."""
+    if isinstance(item, dict) and "json" in item:
+        sample = {"json": item["json"]}
+        if item.get("binary"):
+            sample["binary"] = sorted(item["binary"])
+        return sample
+    return item
+
+def summarize_run_data(data: Optional[dict[str, Any]], sample_items: int, include_stack: bool) -> dict[str, Any]:
+    """
+    Condense execution data to per-node run counts, item counts, timings, errors and samples.
+
+    Nodes are listed in the order they first ran; item counts are per connection
+    type and output, and samples come from the first non-empty output of the first run.
+    """
+    result_data = (data or {}).get("resultData") or {}
+    nodes = []
+    for node_name, runs in run_data_of(data).items():
+        runs = runs or []
+        items: dict[str, list[int]] = {}
+        samples: list[Any] = []
+        errors = []
+        statuses: dict[str, int] = {}
+        for run in runs:
+            run = run or {}
+            for connection_type, output_index, output_items in _run_outputs(run):
+                counts = items.setdefault(connection_type, [])
+                while len(counts) <= output_index:
+                    counts.append(0)
+                counts[output_index] += len(output_items)
+                if not samples and output_items and sample_items > 0:
+                    samples = [_sample(item) for item in output_items[:sample_items]]
+            status = run.get("executionStatus")
+            if status:
+                statuses[status] = statuses.get(status, 0) + 1
+            error = _error_summary(run.get("error"), include_stack)
+            if error:
+                errors.append(error)
+        start_times = [run.get("startTime") for run in runs if isinstance((run or {}).get("startTime"), (int, float))]
+        node_summary: dict[str, Any] = {
+            "node": node_name,
+            "runs": len(runs),
+            "items": items,
+            "execution_time_ms": sum(
+                run.get("executionTime") or 0 for run in runs if isinstance((run or {}).get("executionTime"), (int, float))
+            ),
+            "started_at_ms": min(start_times) if start_times else None
+        }
+        if statuses:
+            node_summary["statuses"] = statuses
+        if errors:
+            node_summary["errors"] = errors
+        if samples:
+            node_summary["samples"] = samples
+        nodes.append(node_summary)
+    nodes.sort(key=lambda node: (node["started_at_ms"] is None, node["started_at_ms"] or 0))
+
+    failed = [node["node"] for node in nodes if node.get("errors")]
+    return {
+        "last_node_executed": result_data.get("lastNodeExecuted"),
+        "error": _error_summary(result_data.get("error"), include_stack),
+        "failed_nodes": failed,
+        "nodes": nodes
+    }
@@ -0,0 +1,112 @@
+'''
+Status derivation and aggregate statistics for n8n executions.
+'''
+import math
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from n8n_sdk_python.models.executions import Execution, ExecutionShort
+
+# Statuses reported by execution_status()
+EXECUTION_STATUSES: tuple[str, ...] = ("success", "error", "running", "waiting")
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp ('Z' accepted, naive values are UTC); raises ValueError."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def execution_status(execution: Execution | ExecutionShort) -> str:
+    """
+    Derive an execution's status from its fields.
+
+    The SDK models do not carry n8n's status field. An execution parked on a
+    Wait node has waitTill set (and, in n8n, also stoppedAt), so that is
+    checked first. n8n only sets `finished` for successful runs, so a stopped
+    execution that did not finish failed (errored, crashed or was canceled).
+    """
+    if execution.waitTill is not None:
+        return "waiting"
+    if execution.stoppedAt is None:
+        return "running"
+    return "success" if execution.finished else "error"
+
+def execution_finished(execution: Execution | ExecutionShort) -> bool:
+    """Whether an execution reached a terminal state and can no longer change (not running or waiting)."""
+    return execution.waitTill is None and execution.stoppedAt is not None
+
+def execution_duration_ms(execution: Execution | ExecutionShort) -> Optional[float]:
+    """Wall-clock duration in milliseconds, or None while the execution is running or waiting."""
+    if execution.waitTill is not None or execution.stoppedAt is None or execution.startedAt is None:
+        return None
+    return max(0.0, (execution.stoppedAt - execution.startedAt).total_seconds() * 1000)
+
+def percentile(sorted_values: list[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list, or None if it is empty."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class ExecutionStats:
+    """Running counts, error rate and duration percentiles over a set of executions."""
+
+    def __init__(self):
+        self.total = 0
+        self.by_status: dict[str, int] = {status: 0 for status in EXECUTION_STATUSES}
+        self.by_mode: dict[str, int] = {}
+        self.durations: list[float] = []
+        self.first_started_at: Optional[datetime] = None
+        self.last_started_at: Optional[datetime] = None
+
+    def add(self, execution: Execution | ExecutionShort) -> None:
+        self.total += 1
+        self.by_status[execution_status(execution)] += 1
+        self.by_mode[execution.mode] = self.by_mode.get(execution.mode, 0) + 1
+        duration = execution_duration_ms(execution)
+        if duration is not None:
+            self.durations.append(duration)
+        started_at = execution.startedAt
+        if started_at is not None:
+            if self.first_started_at is None or started_at < self.first_started_at:
+                self.first_started_at = started_at
+            if self.last_started_at is None or started_at > self.last_started_at:
+                self.last_started_at = started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        durations = sorted(self.durations)
+        completed = self.by_status["success"] + self.by_status["error"]
+        return {
+            "total": self.total,
+            "by_status": self.by_status,
+            "by_mode": self.by_mode,
+            # Share of completed executions that failed; running and waiting ones are not counted
+            "error_rate": round(self.by_status["error"] / completed, 4) if completed else None,
+            "duration_ms": {
+                "p50": percentile(durations, 0.50),
+                "p95": percentile(durations, 0.95),
+                "p99": percentile(durations, 0.99),
+                "max": durations[-1] if durations else None,
+                "mean": round(sum(durations) / len(durations), 1) if durations else None
+            },
+            "first_started_at": self.first_started_at.isoformat() if self.first_started_at else None,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None
+        }
+
+class ExecutionSummary:
+    """Execution statistics overall and per workflow, accumulated one execution at a time."""
+
+    def __init__(self):
+        self.overall = ExecutionStats()
+        self.per_workflow: dict[str, ExecutionStats] = {}
+
+    def add(self, execution: Execution | ExecutionShort) -> None:
+        self.overall.add(execution)
+        self.per_workflow.setdefault(execution.workflowId, ExecutionStats()).add(execution)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "overall": self.overall.to_dict(),
+            "workflows": {workflow_id: stats.to_dict() for workflow_id, stats in self.per_workflow.items()}
+        }
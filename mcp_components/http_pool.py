@@ -0,0 +1,185 @@
+'''
+Shared, tuned HTTP connection pool for the n8n API client.
+
+The n8n SDK opens a new httpx.AsyncClient for every request, so each call
+pays for a fresh TCP (and TLS) connection. install() rebinds the request
+method of every SDK sub-client to one long-lived AsyncClient whose pool
+limits, keep-alive expiry, HTTP/2 and timeouts come from config.py, so all
+tools share warm connections. The lifespan handler in mcp_server.py
+installs the pool at startup and closes it on shutdown.
+
+The SDK offers no way to pass in an HTTP client, so install() replaces its
+private request method. It only does so for the SDK versions and the
+_request signature the replacement was written against; otherwise the SDK
+is left alone and keeps opening a client per request.
+'''
+import importlib.metadata
+import inspect
+import logging
+import re
+import types
+from typing import Any, Optional
+
+import httpx
+from n8n_sdk_python.client import N8nClient
+from n8n_sdk_python.client.base import BaseClient
+from n8n_sdk_python.utils.errors import N8nAPIError
+
+from config import (
+    N8N_HTTP_MAX_CONNECTIONS, N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS, N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    N8N_HTTP2, N8N_HTTP_CONNECT_TIMEOUT_SECONDS, N8N_HTTP_READ_TIMEOUT_SECONDS,
+    N8N_HTTP_WRITE_TIMEOUT_SECONDS, N8N_HTTP_POOL_TIMEOUT_SECONDS
+)
+
+# SDK releases the pooled request mirrors: at least the first, below the second
+_SUPPORTED_SDK_VERSIONS: tuple[tuple[int, ...], tuple[int, ...]] = ((0, 1, 2), (0, 2))
+# Parameters of BaseClient._request in those releases
+_REQUEST_PARAMETERS: tuple[str, ...] = ("self", "method", "endpoint", "params", "json_payload", "headers", "timeout")
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r"\d+", version.split("+")[0])[:3])
+
+def sdk_incompatibility() -> Optional[str]:
+    """Why the installed n8n SDK cannot take the pooled request, or None if it can."""
+    try:
+        version = importlib.metadata.version("n8n-sdk-python")
+    except importlib.metadata.PackageNotFoundError:
+        return "n8n-sdk-python package metadata not found"
+    low, high = _SUPPORTED_SDK_VERSIONS
+    if not low <= _version_tuple(version) < high:
+        return f"n8n-sdk-python {version} is outside the supported range"
+    parameters = tuple(inspect.signature(BaseClient._request).parameters)
+    if parameters != _REQUEST_PARAMETERS:
+        return f"BaseClient._request has an unexpected signature {parameters}"
+    return None
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class HttpPool:
+    """
+    One httpx.AsyncClient shared by every n8n SDK sub-client.
+
+    The client is created on first use, inside the running event loop, and
+    recreated if a request arrives after aclose(). An explicit per-call
+    timeout from the SDK only replaces the read timeout, so connect and pool
+    timeouts always apply.
+    """
+
+    def __init__(self, limits: httpx.Limits, timeout: httpx.Timeout, http2: bool):
+        self.limits = limits
+        self.timeout = timeout
+        if http2 and not _http2_available():
+            logging.warning("N8N_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections; a later request opens a new pool."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def request(
+        self,
+        sdk_client: BaseClient,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        json_payload: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[int] = None
+    ) -> Any:
+        """BaseClient._request on the shared client, with the SDK's response handling and errors."""
+        url = f"{sdk_client.base_url}/api/{endpoint.lstrip('/')}"
+        request_kwargs: dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "params": params,
+            "headers": {**sdk_client.headers, **(headers or {})}
+        }
+        if timeout:
+            request_kwargs["timeout"] = httpx.Timeout(
+                connect=self.timeout.connect, read=timeout, write=self.timeout.write, pool=self.timeout.pool
+            )
+        if json_payload is not None:
+            request_kwargs["json"] = json_payload
+        elif method in ("POST", "PUT", "PATCH"):
+            request_kwargs["content"] = b""
+
+        try:
+            response = await self.client.request(**request_kwargs)
+        except httpx.RequestError as e:
+            raise N8nAPIError(
+                message=f"Request error: {str(e)}",
+                details={"endpoint": endpoint, "method": method}
+            )
+
+        if response.content:
+            try:
+                response_data = response.json()
+            except ValueError:
+                response_data = response.text
+        else:
+            response_data = None
+
+        if response.is_error:
+            error_msg = f"n8n API error: {response.status_code}"
+            if isinstance(response_data, dict) and "message" in response_data:
+                error_msg = f"{error_msg} - {response_data['message']}"
+            raise N8nAPIError(
+                message=error_msg,
+                status_code=response.status_code,
+                response_body=response.text,
+                details={"endpoint": endpoint, "method": method}
+            )
+        return response_data
+
+    def install(self, n8n_client: N8nClient) -> bool:
+        """Route every request of the client's sub-clients through this pool; False if the SDK is unsupported."""
+        reason = sdk_incompatibility()
+        if reason is not None:
+            logging.warning(f"n8n HTTP pool not installed ({reason}); the SDK opens a connection per request.")
+            return False
+        pool = self
+
+        async def pooled_request(sdk_client: BaseClient, *args: Any, **kwargs: Any) -> Any:
+            return await pool.request(sdk_client, *args, **kwargs)
+
+        installed = 0
+        for sub_client in vars(n8n_client).values():
+            if isinstance(sub_client, BaseClient):
+                sub_client._request = types.MethodType(pooled_request, sub_client)
+                installed += 1
+        logging.info(
+            f"n8n HTTP pool installed on {installed} clients (max {self.limits.max_connections} connections, "
+            f"HTTP/2 {'on' if self.http2 else 'off'})"
+        )
+        return True
+
+# Shared pool for the n8n client, installed and closed by the lifespan handler
+n8n_http_pool = HttpPool(
+    limits=httpx.Limits(
+        max_connections=N8N_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=N8N_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=N8N_HTTP_KEEPALIVE_EXPIRY_SECONDS
+    ),
+    timeout=httpx.Timeout(
+        connect=N8N_HTTP_CONNECT_TIMEOUT_SECONDS,
+        read=N8N_HTTP_READ_TIMEOUT_SECONDS,
+        write=N8N_HTTP_WRITE_TIMEOUT_SECONDS,
+        pool=N8N_HTTP_POOL_TIMEOUT_SECONDS
+    ),
+    http2=N8N_HTTP2
+)
@@ -0,0 +1,231 @@
+'''
+Shared in-memory catalog of the local n8n node classification files.
+'''
+import logging
+import json
+import os
+from typing import Any, Callable, Optional
+
+from config import (
+    CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH,
+    NODE_ALL_NODES_PATH_BASE, NODE_CATEGORIES_PATH_BASE, NODE_CLASSES_PATH_BASE
+)
+from mcp_components.node_index import folder_path, node_index
+
+class NodeCatalog:
+    """
+    In-memory view of the category and class classification files.
+
+    The files are parsed once (normally from the server lifespan handler) and
+    kept in memory. Every access through refresh() compares the files'
+    modification times with the ones seen at load time and re-parses only
+    when either file has changed on disk. When a prebuilt node index built
+    from the same files is open, the data and folder index come from it.
+    """
+
+    def __init__(self, category_file_path: str, class_file_path: str):
+        self.category_file_path = category_file_path
+        self.class_file_path = class_file_path
+        self.category_data: dict[str, Any] = {}
+        self.class_data: dict[str, Any] = {}
+        self._mtimes: Optional[tuple[int, int]] = None
+        self._reload_hooks: list[Callable[["NodeCatalog"], None]] = []
+        self.generation: int = 0
+
+        # Lookup indexes rebuilt on every load; all keys are lowercased
+        self.category_keys: dict[str, str] = {}
+        self.class_keys: dict[str, str] = {}
+        self.type_categories: dict[str, list[str]] = {}
+        self.type_class: dict[str, str] = {}
+        self.category_types: dict[str, set[str]] = {}
+        self.class_types: dict[str, set[str]] = {}
+        self.type_origin: dict[str, tuple[dict[str, Any], str, str]] = {}
+        self.type_folders: dict[str, str] = {}
+
+    def _current_mtimes(self) -> tuple[int, int]:
+        """Stat both classification files; raises FileNotFoundError if either is missing."""
+        return (
+            os.stat(self.category_file_path).st_mtime_ns,
+            os.stat(self.class_file_path).st_mtime_ns
+        )
+
+    def load(self) -> None:
+        """Parse both classification files and replace the in-memory data."""
+        mtimes = self._current_mtimes()
+        indexed: Optional[dict[str, Any]] = None
+        if node_index.is_open:
+            if node_index.matches_catalog(self.category_file_path, self.class_file_path):
+                indexed = node_index.get("catalog")
+            else:
+                logging.warning("Node index is stale (classification files changed); rebuild it with 'python main.py build-index'")
+                node_index.close()
+
+        if indexed is not None:
+            category_data: dict[str, Any] = indexed["category_data"]
+            class_data: dict[str, Any] = indexed["class_data"]
+        else:
+            with open(self.category_file_path, 'r', encoding='utf-8') as f:
+                category_data = json.load(f)
+            with open(self.class_file_path, 'r', encoding='utf-8') as f:
+                class_data = json.load(f)
+
+        self.category_data = category_data
+        self.class_data = class_data
+        self._mtimes = mtimes
+        self._build_indexes()
+        if indexed is not None:
+            self.type_folders = {node_type: folder_path(key) for node_type, key in indexed["type_folders"].items()}
+        else:
+            self._build_folder_index()
+        self.generation += 1
+        logging.info(
+            f"Node catalog loaded{' from node index' if indexed is not None else ''}: "
+            f"{len(self.categories)} categories, {len(self.classes)} classes"
+        )
+        for hook in self._reload_hooks:
+            try:
+                hook(self)
+            except Exception as e:
+                logging.error(f"Node catalog reload hook {hook.__name__} failed: {e}", exc_info=True)
+
+    def add_reload_hook(self, hook: Callable[["NodeCatalog"], None]) -> None:
+        """Register a callable that derives data from the catalog; it runs after every load."""
+        self._reload_hooks.append(hook)
+        if self._mtimes is not None:
+            hook(self)
+
+    def _build_indexes(self) -> None:
+        """
+        Precompute the lowercase-keyed lookup tables used by the node tools.
+
+        Iteration follows file order and keeps the first match, which mirrors
+        the results of a linear scan over the classification data.
+        """
+        category_keys: dict[str, str] = {}
+        class_keys: dict[str, str] = {}
+        type_categories: dict[str, list[str]] = {}
+        type_class: dict[str, str] = {}
+        category_types: dict[str, set[str]] = {}
+        class_types: dict[str, set[str]] = {}
+        type_origin: dict[str, tuple[dict[str, Any], str, str]] = {}
+
+        for cat_key, nodes in self.categories.items():
+            category_keys.setdefault(cat_key.lower(), cat_key)
+            members = category_types.setdefault(cat_key, set())
+            for node in nodes:
+                node_type = node.get('type', '').lower()
+                members.add(node_type)
+                categories_for_type = type_categories.setdefault(node_type, [])
+                if cat_key not in categories_for_type:
+                    categories_for_type.append(cat_key)
+                type_origin.setdefault(node_type, (node, 'category', cat_key))
+
+        for class_key, nodes in self.classes.items():
+            class_keys.setdefault(class_key.lower(), class_key)
+            members = class_types.setdefault(class_key, set())
+            for node in nodes:
+                node_type = node.get('type', '').lower()
+                members.add(node_type)
+                type_class.setdefault(node_type, class_key)
+                type_origin.setdefault(node_type, (node, 'class', class_key))
+
+        self.category_keys = category_keys
+        self.class_keys = class_keys
+        self.type_categories = type_categories
+        self.type_class = type_class
+        self.category_types = category_types
+        self.class_types = class_types
+        self.type_origin = type_origin
+
+    def refresh(self) -> "NodeCatalog":
+        """Reload the classification files if they changed since the last load."""
+        if self._mtimes is None or self._current_mtimes() != self._mtimes:
+            self.load()
+        return self
+
+    @property
+    def categories(self) -> dict[str, list[dict[str, Any]]]:
+        return self.category_data.get('categories', {})
+
+    @property
+    def classes(self) -> dict[str, list[dict[str, Any]]]:
+        return self.class_data.get('classes', {})
+
+    def category_key(self, name: Optional[str]) -> Optional[str]:
+        """Resolve a case-insensitive category name to its key in the classification file."""
+        return self.category_keys.get(name.lower()) if name else None
+
+    def class_key(self, name: Optional[str]) -> Optional[str]:
+        """Resolve a case-insensitive class name to its key in the classification file."""
+        return self.class_keys.get(name.lower()) if name else None
+
+    def find_category(self, node_type: Optional[str]) -> Optional[str]:
+        """Return the first category listing the given node type."""
+        if not node_type:
+            return None
+        categories = self.type_categories.get(node_type.lower())
+        return categories[0] if categories else None
+
+    def find_class(self, node_type: Optional[str]) -> Optional[str]:
+        """Return the first class listing the given node type."""
+        return self.type_class.get(node_type.lower()) if node_type else None
+
+    def lookup(self, node_type: str) -> Optional[tuple[dict[str, Any], str, str]]:
+        """
+        Find a node entry by type identifier.
+
+        Returns a (node_entry, source_type, group_name) tuple, preferring the
+        category file over the class file, or None if the type is unknown.
+        """
+        return self.type_origin.get(node_type.lower())
+
+    def _build_folder_index(self) -> None:
+        """
+        Resolve the definition folder of every node type once.
+
+        Folders are looked up by the entry's 'path' under node_data/all_nodes
+        (case-insensitively), falling back to the legacy
+        categories/<category>/<path> and classes/<class>/<path> layouts.
+        """
+        all_nodes_dirs: dict[str, str] = {}
+        if os.path.isdir(NODE_ALL_NODES_PATH_BASE):
+            for name in sorted(os.listdir(NODE_ALL_NODES_PATH_BASE)):
+                folder = os.path.join(NODE_ALL_NODES_PATH_BASE, name)
+                if os.path.isdir(folder):
+                    all_nodes_dirs.setdefault(name.lower(), folder)
+
+        type_folders: dict[str, str] = {}
+        unresolved: list[str] = []
+        for node_type, (node_entry, _, _) in self.type_origin.items():
+            node_name_folder = node_entry.get('path')
+            if not node_name_folder:
+                continue
+            folder = all_nodes_dirs.get(node_name_folder.lower())
+            if folder is None:
+                candidates = [os.path.join(NODE_ALL_NODES_PATH_BASE, node_name_folder)]
+                candidates += [
+                    os.path.join(NODE_CATEGORIES_PATH_BASE, cat_key, node_name_folder)
+                    for cat_key in self.type_categories.get(node_type, [])
+                ]
+                if node_type in self.type_class:
+                    candidates.append(os.path.join(NODE_CLASSES_PATH_BASE, self.type_class[node_type], node_name_folder))
+                folder = next((c for c in candidates if os.path.isdir(c)), None)
+            if folder:
+                type_folders[node_type] = folder
+            else:
+                unresolved.append(node_name_folder)
+
+        self.type_folders = type_folders
+        if unresolved:
+            logging.warning(f"Node catalog: no definition folder found for {len(unresolved)} node(s): {unresolved}")
+
+    def node_folder(self, node_type: str) -> Optional[str]:
+        """Return the definition folder of a node type, or None if it could not be resolved."""
+        return self.type_folders.get(node_type.lower())
+
+    def node_folders(self) -> list[str]:
+        """Return the distinct definition folders of all node types in the catalog."""
+        return list(dict.fromkeys(self.type_folders.values()))
+
+# Shared catalog instance, loaded by the lifespan handler in mcp_server.py
+node_catalog = NodeCatalog(CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH)
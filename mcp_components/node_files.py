@@ -0,0 +1,322 @@
+'''
+Non-blocking access to local node definition files.
+'''
+import asyncio
+import base64
+import fnmatch
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from config import NODE_FILE_READ_WORKERS
+from mcp_components.node_catalog import NodeCatalog, node_catalog
+from mcp_components.node_index import folder_key, node_index
+
+T = TypeVar("T")
+
+# File kinds, in the order they are served when a byte budget applies
+NODE_FILE_KINDS: tuple[str, ...] = ("node.json", "description", "implementation", "other", "tests", "binary")
+
+BINARY_EXTENSIONS: frozenset[str] = frozenset({
+    ".jpg", ".jpeg", ".png", ".gif", ".ico", ".webp", ".bmp", ".pdf",
+    ".xls", ".xlsx", ".doc", ".docx", ".zip", ".gz", ".woff", ".woff2", ".ttf"
+})
+
+# Bytes inspected when sniffing whether a file is text
+_SNIFF_BYTES = 8192
+
+# Versioned subfolders such as 'V1', 'v2' or 'v2.1'
+_VERSION_DIR_PATTERN = re.compile(r"^v\d+(\.\d+)*$", re.IGNORECASE)
+
+# Bounded pool for filesystem work so node lookups never block the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=NODE_FILE_READ_WORKERS, thread_name_prefix="node-file-io")
+    return _executor
+
+def shutdown_executor() -> None:
+    """Release the file I/O worker threads; a new pool is created on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking filesystem call on the node file I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), func, *args)
+
+def classify_node_file(relative_path: str) -> str:
+    """Return the kind of a node definition file from its path relative to the node folder."""
+    normalized = relative_path.replace(os.sep, "/")
+    lowered = normalized.lower()
+    file_name = lowered.rsplit("/", 1)[-1]
+    directories = lowered.split("/")[:-1]
+
+    if os.path.splitext(file_name)[1] in BINARY_EXTENSIONS:
+        return "binary"
+    if (
+        any(d in ("test", "tests", "__tests__", "__snapshots__") for d in directories)
+        or ".test." in file_name or ".spec." in file_name or file_name.endswith(".snap")
+    ):
+        return "tests"
+    if file_name.endswith(".node.json"):
+        return "node.json"
+    if file_name.endswith(".node.ts") or file_name.endswith(".node.js"):
+        return "implementation"
+    if "descriptions" in directories or file_name.endswith("description.ts"):
+        return "description"
+    return "other"
+
+def _file_version(relative_path: str) -> Optional[str]:
+    """Return the innermost versioned directory a file lives in, lowercased, e.g. 'v2' for 'V2/actions/x.ts'."""
+    version: Optional[str] = None
+    for directory in relative_path.split("/")[:-1]:
+        if _VERSION_DIR_PATTERN.match(directory):
+            version = directory.lower()
+    return version
+
+def scan_node_folder(folder_path: str) -> Optional[list[dict[str, Any]]]:
+    """
+    Walk a node folder recursively and describe every regular file in it.
+
+    Returns None if the folder is not a directory, otherwise a list of
+    manifest entries with the file's relative path (using '/'), size in
+    bytes, kind and lowercased version subfolder (None for unversioned files).
+    """
+    if not os.path.isdir(folder_path):
+        return None
+    manifest: list[dict[str, Any]] = []
+    for dir_path, dir_names, file_names in os.walk(folder_path):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            file_path = os.path.join(dir_path, file_name)
+            if not os.path.isfile(file_path):
+                continue
+            relative_path = os.path.relpath(file_path, folder_path).replace(os.sep, "/")
+            manifest.append({
+                "path": relative_path,
+                "size": os.path.getsize(file_path),
+                "kind": classify_node_file(relative_path),
+                "version": _file_version(relative_path)
+            })
+    return manifest
+
+class NodeManifestIndex:
+    """
+    In-memory file manifests of node definition folders, keyed by folder path.
+
+    Manifests come from the prebuilt node index when one is open and the
+    folder has not changed since it was built, and are otherwise built for every catalog node at startup; a folder found in
+    neither is scanned on first use and cached.
+    """
+
+    def __init__(self):
+        self._manifests: dict[str, list[dict[str, Any]]] = {}
+
+    def clear(self) -> None:
+        """Forget every manifest; folders are read again on next use."""
+        self._manifests.clear()
+
+    def build(self, folder_paths: list[str]) -> int:
+        """Scan the given folders (blocking) and return the number indexed."""
+        manifests: dict[str, list[dict[str, Any]]] = {}
+        for folder_path in folder_paths:
+            manifest = scan_node_folder(folder_path)
+            if manifest is not None:
+                manifests[folder_path] = manifest
+        self._manifests.update(manifests)
+        logging.info(
+            f"Node manifest index built: {len(manifests)} folders, "
+            f"{sum(len(m) for m in manifests.values())} files"
+        )
+        return len(manifests)
+
+    def peek(self, folder_path: str) -> Optional[list[dict[str, Any]]]:
+        """Return the manifest of a folder if it is already indexed, without scanning."""
+        return self._manifests.get(folder_path)
+
+    async def get(self, folder_path: str) -> Optional[list[dict[str, Any]]]:
+        """Return the manifest of a folder, scanning it off the event loop if needed."""
+        manifest = self._manifests.get(folder_path)
+        if manifest is None and node_index.is_open and await run_blocking(node_index.folder_is_current, folder_path):
+            manifest = node_index.get(f"manifest:{folder_key(folder_path)}")
+            if manifest is not None:
+                self._manifests[folder_path] = manifest
+        if manifest is None:
+            manifest = await run_blocking(scan_node_folder, folder_path)
+            if manifest is not None:
+                self._manifests[folder_path] = manifest
+        return manifest
+
+# Shared manifest index, built by the lifespan handler in mcp_server.py
+node_manifests = NodeManifestIndex()
+
+def _clear_node_manifests(catalog: NodeCatalog) -> None:
+    # A reloaded catalog may map node types to other folders, so drop the manifests read so far
+    node_manifests.clear()
+
+node_catalog.add_reload_hook(_clear_node_manifests)
+
+def available_versions(manifest: list[dict[str, Any]]) -> list[str]:
+    """Return the distinct version subfolders present in a manifest."""
+    return sorted({entry["version"] for entry in manifest if entry["version"]})
+
+def _read_file(file_path: str, limit: Optional[int], allow_binary: bool) -> Optional[tuple[str, int]]:
+    """
+    Read up to `limit` bytes of a file as text.
+
+    Returns the content and the number of file bytes it covers, or None when
+    the content is not UTF-8 text, unless allow_binary is set, in which case
+    the raw bytes are returned base64-encoded.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read() if limit is None else f.read(limit)
+
+    if allow_binary and os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS:
+        return base64.b64encode(data).decode("ascii"), len(data)
+    if b"\x00" in data[:_SNIFF_BYTES]:
+        return (base64.b64encode(data).decode("ascii"), len(data)) if allow_binary else None
+    try:
+        return data.decode("utf-8"), len(data)
+    except UnicodeDecodeError as e:
+        # A read cut short by the byte budget may split a multi-byte character
+        if limit is not None and len(data) == limit and e.start >= len(data) - 3:
+            return data[:e.start].decode("utf-8"), e.start
+        return (base64.b64encode(data).decode("ascii"), len(data)) if allow_binary else None
+
+def _output_size(size: int, kind: str) -> int:
+    """Expected bytes of content returned for size bytes of a file; base64 adds a third to binary files."""
+    return 4 * -(-size // 3) if kind == "binary" else size
+
+def _read_limit(budget: int, kind: str) -> int:
+    """File bytes whose returned content fits in budget bytes."""
+    return budget // 4 * 3 if kind == "binary" else budget
+
+def _matches(relative_path: str, patterns: list[str]) -> bool:
+    file_name = relative_path.rsplit("/", 1)[-1]
+    return any(fnmatch.fnmatch(relative_path, p) or fnmatch.fnmatch(file_name, p) for p in patterns)
+
+async def read_node_folder(
+    folder_path: str,
+    include: Optional[list[str]] = None,
+    kinds: Optional[list[str]] = None,
+    max_bytes: Optional[int] = None,
+    include_binary: bool = False,
+    version: Optional[str] = None
+) -> Optional[dict[str, Any]]:
+    """
+    Read the selected files of a node folder, including subfolders, concurrently.
+
+    Files are taken from the folder's manifest and filtered by version
+    subtree, glob patterns and kinds, then served in kind order (node.json,
+    description, implementation, other, tests) until max_bytes is spent; a
+    file that does not fit is truncated with a marker. Non-text files are
+    skipped unless include_binary is set. The budget is charged with the
+    content actually returned, so base64-encoded binary files count at their
+    encoded size and files found not to be text cost nothing.
+
+    Returns None if the folder does not exist, otherwise a dict with:
+        - files: mapping of relative file path to content
+        - file_kinds: mapping of relative file path to its kind
+        - skipped_files: mapping of relative file path to the reason it was left out
+        - truncated_files: paths of files cut short by the byte budget
+        - total_bytes: bytes of file content returned, as encoded in files
+        - versions: version subfolders available in the node folder
+    """
+    manifest = await node_manifests.get(folder_path)
+    if manifest is None:
+        return None
+
+    selected: list[tuple[str, int, str]] = []
+    skipped_files: dict[str, str] = {}
+    for entry in manifest:
+        path, size, kind = entry["path"], entry["size"], entry["kind"]
+        if version and entry["version"] != version.lower():
+            continue
+        if include and not _matches(path, include):
+            continue
+        if kinds and kind not in kinds:
+            continue
+        if kind == "binary" and not include_binary:
+            skipped_files[path] = f"binary file ({size} bytes)"
+            continue
+        selected.append((path, size, kind))
+    selected.sort(key=lambda entry: (NODE_FILE_KINDS.index(entry[2]), entry[0]))
+
+    async def read_one(path: str, limit: Optional[int]) -> Optional[tuple[str, int]]:
+        file_path = os.path.join(folder_path, *path.split("/"))
+        try:
+            return await run_blocking(_read_file, file_path, limit, include_binary)
+        except Exception as e:
+            logging.warning(f"Error reading file {file_path}: {e}")
+            message = f"Error reading file: {str(e)}"
+            return message, len(message.encode("utf-8"))
+
+    files: dict[str, str] = {}
+    file_kinds: dict[str, str] = {}
+    truncated_files: list[str] = []
+    total_bytes = 0
+    pending = selected
+    while pending:
+        # Read, concurrently, the next files the remaining budget is expected to cover
+        batch: list[tuple[str, int, str, Optional[int]]] = []
+        budget = None if max_bytes is None else max_bytes - total_bytes
+        for path, size, kind in pending:
+            if budget is None:
+                batch.append((path, size, kind, None))
+                continue
+            limit = min(size, _read_limit(budget, kind))
+            if limit <= 0 and size > 0:
+                break
+            batch.append((path, size, kind, limit))
+            budget -= _output_size(limit, kind)
+        if not batch:
+            break
+        pending = pending[len(batch):]
+        contents = await asyncio.gather(*(read_one(path, limit) for path, _, _, limit in batch))
+
+        # Charge the budget with the bytes actually returned, in priority order
+        for position, ((path, size, kind, limit), result) in enumerate(zip(batch, contents)):
+            if result is None:
+                skipped_files[path] = f"binary file ({size} bytes)"
+                continue
+            content, covered = result
+            returned = len(content.encode("utf-8"))
+            if max_bytes is not None:
+                remaining = max_bytes - total_bytes
+                # Budget freed or overrun by earlier files of this batch changes what this file
+                # can have, so it and the rest of the batch are read again against the new budget
+                if position > 0 and (returned > remaining or (covered < size and _read_limit(remaining, kind) > limit)):
+                    pending = [(p, s, k) for p, s, k, _ in batch[position:]] + pending
+                    break
+                if returned > remaining:
+                    # Only base64 output can outgrow the planned read; keep whole 4-character groups
+                    content = content[:remaining // 4 * 4]
+                    covered = min(covered, len(content) // 4 * 3)
+                    returned = len(content)
+                    if not content:
+                        skipped_files[path] = f"byte budget exhausted ({size} bytes)"
+                        continue
+            total_bytes += returned
+            if covered < size:
+                content += f"\n... [truncated: {size - covered} of {size} bytes omitted]"
+                truncated_files.append(path)
+            files[path] = content
+            file_kinds[path] = kind
+    for path, size, _ in pending:
+        skipped_files[path] = f"byte budget exhausted ({size} bytes)"
+
+    return {
+        "files": files,
+        "file_kinds": file_kinds,
+        "skipped_files": skipped_files,
+        "truncated_files": truncated_files,
+        "total_bytes": total_bytes,
+        "versions": available_versions(manifest)
+    }
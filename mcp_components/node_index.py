@@ -0,0 +1,220 @@
+'''
+Prebuilt, memory-mapped index of the local node data.
+
+The index is a single binary file produced by `python main.py build-index`.
+It holds the node catalog, the file manifest of every node folder and the
+extracted parameter schemas, so the server can start without walking
+node_data. Each folder's entries are only trusted while the folder still
+matches the fingerprint recorded for it at build time; this is checked
+the first time the folder is used. Layout (all integers little-endian):
+
+    header   magic (8s), format version (I), entry count (I), table offset (Q)
+    values   JSON documents, one per entry
+    keys     UTF-8 entry keys
+    table    entry count records of key offset (Q), key length (I),
+             value offset (Q), value length (I), sorted by key bytes
+
+Lookups binary-search the table directly in the mapped file, so opening the
+index costs the same regardless of how many nodes it describes.
+'''
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Any, Optional
+
+from config import NODE_DATA_BASE_PATH, NODE_INDEX_PATH
+
+INDEX_MAGIC = b"N8NNODEX"
+INDEX_FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sIIQ")
+_RECORD = struct.Struct("<QIQI")
+
+def file_sha256(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def folder_fingerprint(folder_path: str) -> Optional[str]:
+    """
+    Return a digest of the relative path, size and mtime of every file in a folder tree.
+
+    Any file added, removed, renamed or rewritten changes the digest. Returns
+    None if the folder is not a directory.
+    """
+    if not os.path.isdir(folder_path):
+        return None
+    digest = hashlib.sha256()
+    for dir_path, dir_names, file_names in os.walk(folder_path):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            file_path = os.path.join(dir_path, file_name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            relative_path = os.path.relpath(file_path, folder_path).replace(os.sep, "/")
+            digest.update(f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def folder_key(folder_path: str) -> str:
+    """Return the portable index key of a node folder: its path relative to NODE_DATA_BASE_PATH."""
+    return os.path.relpath(folder_path, NODE_DATA_BASE_PATH).replace(os.sep, "/")
+
+def folder_path(key: str) -> str:
+    """Inverse of folder_key() for the current NODE_DATA_BASE_PATH."""
+    return os.path.normpath(os.path.join(NODE_DATA_BASE_PATH, *key.split("/")))
+
+def write_node_index(output_path: str, entries: dict[str, Any]) -> int:
+    """
+    Write entries (key -> JSON-serializable value) as an index file.
+
+    The file is written next to its destination and moved into place, so a
+    running server keeps reading its mapped copy until it reopens the index.
+    Returns the size of the written file in bytes.
+    """
+    encoded = sorted(
+        (key.encode("utf-8"), json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        for key, value in entries.items()
+    )
+    records: list[tuple[int, int, int, int]] = []
+    value_offsets: list[int] = []
+    offset = _HEADER.size
+    for _, value in encoded:
+        value_offsets.append(offset)
+        offset += len(value)
+    for (key, value), value_offset in zip(encoded, value_offsets):
+        records.append((offset, len(key), value_offset, len(value)))
+        offset += len(key)
+    table_offset = offset
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, INDEX_FORMAT_VERSION, len(encoded), table_offset))
+        for _, value in encoded:
+            f.write(value)
+        for key, _ in encoded:
+            f.write(key)
+        for record in records:
+            f.write(_RECORD.pack(*record))
+        size = f.tell()
+    os.replace(temp_path, output_path)
+    return size
+
+class NodeIndex:
+    """
+    Read-only view of a prebuilt node index file.
+
+    The file is memory-mapped on open() and entries are decoded on demand.
+    When the file is missing, malformed, or was built from different
+    classification files, the index stays closed and callers fall back to
+    reading node_data directly. Entries of a single folder that changed
+    since the build are rejected the same way, see folder_is_current().
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._table_offset = 0
+        self.meta: dict[str, Any] = {}
+        # Folder key -> whether the folder still matches its recorded fingerprint
+        self._current_folders: dict[str, bool] = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self._map is not None
+
+    def open(self) -> bool:
+        """Map the index file; returns whether it is usable."""
+        self.close()
+        if not os.path.isfile(self.index_path):
+            logging.info(f"No prebuilt node index at {self.index_path}; node data will be read directly")
+            return False
+        try:
+            self._file = open(self.index_path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, format_version, count, table_offset = _HEADER.unpack_from(self._map, 0)
+            if magic != INDEX_MAGIC or format_version != INDEX_FORMAT_VERSION:
+                raise ValueError(f"unsupported index format {magic!r} v{format_version}")
+            if table_offset + count * _RECORD.size != len(self._map):
+                raise ValueError("truncated index file")
+            self._count, self._table_offset = count, table_offset
+            self.meta = self.get("meta") or {}
+        except (OSError, ValueError, struct.error) as e:
+            logging.warning(f"Ignoring node index {self.index_path}: {e}")
+            self.close()
+            return False
+        logging.info(f"Node index mapped: {self.index_path} ({self._count} entries, built {self.meta.get('built_at')})")
+        return True
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+        self.meta = {}
+        self._current_folders = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded value stored under key, or None if absent or the index is closed."""
+        index_map = self._map
+        if index_map is None:
+            return None
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = _RECORD.unpack_from(
+                index_map, self._table_offset + middle * _RECORD.size
+            )
+            candidate = index_map[key_offset:key_offset + key_length]
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return json.loads(index_map[value_offset:value_offset + value_length])
+        return None
+
+    def matches_catalog(self, category_file_path: str, class_file_path: str) -> bool:
+        """Whether the index was built from the current contents of the classification files."""
+        if not self.is_open:
+            return False
+        return (
+            self.meta.get("category_sha256") == file_sha256(category_file_path)
+            and self.meta.get("class_sha256") == file_sha256(class_file_path)
+        )
+
+    def folder_is_current(self, folder_path: str) -> bool:
+        """
+        Whether the indexed manifest and schemas of a node folder still describe it (blocking).
+
+        The folder is fingerprinted on first use and the result is remembered
+        until the index is reopened.
+        """
+        if not self.is_open:
+            return False
+        key = folder_key(folder_path)
+        current = self._current_folders.get(key)
+        if current is None:
+            recorded = self.get(f"fingerprint:{key}")
+            current = recorded is not None and recorded == folder_fingerprint(folder_path)
+            if not current:
+                logging.warning(f"Node index entries for {key} are stale; reading the folder directly. Rebuild with 'python main.py build-index'")
+            self._current_folders[key] = current
+        return current
+
+# Shared index, opened by the lifespan handler in mcp_server.py
+node_index = NodeIndex(NODE_INDEX_PATH)
@@ -0,0 +1,636 @@
+'''
+Structured parameter-schema extraction from local node definition files.
+
+n8n node definitions are TypeScript modules whose interesting parts (the node
+description, its properties, resources, operations and credentials) are plain
+object literals. This module parses those literals with a small tolerant
+JavaScript literal parser, resolves spreads and references between files, and
+reduces the result to a compact schema. Extracted schemas are cached in memory
+and on disk, keyed by a hash of the source file contents.
+'''
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Optional
+
+from config import NODE_SCHEMA_CACHE_PATH
+from mcp_components.node_catalog import NodeCatalog, node_catalog
+from mcp_components.node_files import available_versions, node_manifests, run_blocking
+from mcp_components.node_index import node_index
+
+# Bump when the extraction output changes so stale disk entries are ignored
+SCHEMA_EXTRACTOR_VERSION = 1
+
+_SOURCE_EXTENSIONS = (".ts", ".js")
+_SOURCE_KINDS = ("description", "implementation", "other")
+
+_IDENTIFIER_START = re.compile(r"[A-Za-z_$]")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER = re.compile(r"-?(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)")
+_CONST_DECLARATION = re.compile(
+    r"\b(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(?::\s*[^=;]+?)?\s*=(?![=>])\s*(?=[\[{'\"`])"
+)
+_DESCRIPTION_ASSIGNMENT = re.compile(
+    r"\b(?:this\.)?description\s*(?::\s*[\w$.<>\[\]]+)?\s*=(?![=>])\s*(?=\{)"
+)
+
+class _Expr:
+    """A JavaScript expression the parser does not evaluate (identifier, call, arrow function...)."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+class _Spread:
+    """A '...expr' element inside an array or object literal."""
+
+    def __init__(self, expr: str):
+        self.expr = expr
+
+class _LiteralParser:
+    """
+    Tolerant parser for JavaScript object/array literals embedded in TypeScript.
+
+    Anything that is not a literal is captured as raw source text (_Expr)
+    instead of failing, so one unusual property does not lose the whole node.
+    """
+
+    def __init__(self, source: str):
+        self.src = source
+        self.length = len(source)
+
+    def _skip_ws(self, i: int) -> int:
+        src = self.src
+        while i < self.length:
+            c = src[i]
+            if c.isspace():
+                i += 1
+            elif src.startswith("//", i):
+                newline = src.find("\n", i)
+                i = self.length if newline < 0 else newline + 1
+            elif src.startswith("/*", i):
+                end = src.find("*/", i + 2)
+                i = self.length if end < 0 else end + 2
+            else:
+                break
+        return i
+
+    def _skip_string(self, i: int) -> int:
+        """Skip a quoted or template string starting at i; return the index after it."""
+        src = self.src
+        quote = src[i]
+        i += 1
+        while i < self.length:
+            c = src[i]
+            if c == "\\":
+                i += 2
+            elif c == quote:
+                return i + 1
+            elif quote == "`" and src.startswith("${", i):
+                i = self._skip_balanced(i + 1)
+            else:
+                i += 1
+        return i
+
+    def _skip_balanced(self, i: int) -> int:
+        """Skip a bracketed group starting at i; return the index after its closer."""
+        depth = 0
+        src = self.src
+        while i < self.length:
+            c = src[i]
+            if c in "'\"`":
+                i = self._skip_string(i)
+                continue
+            if src.startswith("//", i) or src.startswith("/*", i):
+                i = self._skip_ws(i)
+                continue
+            if c in "([{":
+                depth += 1
+            elif c in ")]}":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        return i
+
+    def _skip_expression(self, i: int) -> int:
+        """Skip an arbitrary expression up to the next ',' ';' or unmatched closer at depth 0."""
+        src = self.src
+        while i < self.length:
+            c = src[i]
+            if c in "'\"`":
+                i = self._skip_string(i)
+            elif src.startswith("//", i) or src.startswith("/*", i):
+                i = self._skip_ws(i)
+            elif c in "([{":
+                i = self._skip_balanced(i)
+            elif c in ")]},;":
+                return i
+            else:
+                i += 1
+        return i
+
+    def _parse_string(self, i: int) -> tuple[str, int]:
+        end = self._skip_string(i)
+        quote = self.src[i]
+        raw = self.src[i + 1:end - 1]
+        if quote == "`":
+            return raw, end
+        if quote == "'":
+            raw = re.sub(r'(?<!\\)"', '\\"', raw.replace("\\'", "'"))
+        try:
+            return json.loads(f'"{raw}"'), end
+        except ValueError:
+            return raw, end
+
+    def parse_value(self, i: int) -> tuple[Any, int]:
+        """Parse the value starting at i (after whitespace); return (value, next index)."""
+        start = i = self._skip_ws(i)
+        if i >= self.length:
+            return None, i
+        c = self.src[i]
+        value: Any
+        if c == "{":
+            value, i = self._parse_object(i)
+        elif c == "[":
+            value, i = self._parse_array(i)
+        elif c in "'\"`":
+            value, i = self._parse_string(i)
+        elif (number := _NUMBER.match(self.src, i)) and not _IDENTIFIER_START.match(self.src, number.end()):
+            text = number.group(0)
+            try:
+                value = int(text, 0)
+            except ValueError:
+                value = float(text)
+            i = number.end()
+        elif identifier := _IDENTIFIER.match(self.src, i):
+            word = identifier.group(0)
+            value = {"true": True, "false": False, "null": None, "undefined": None}.get(word, _Expr(word))
+            i = identifier.end()
+            # Member access chains such as NodeConnectionTypes.Main
+            while self.src.startswith(".", i) and (member := _IDENTIFIER.match(self.src, i + 1)):
+                value = _Expr(self.src[start:member.end()])
+                i = member.end()
+        else:
+            i = self._skip_expression(i)
+            return _Expr(self.src[start:i].strip()), i
+
+        # Handle what follows the literal: string concatenation, 'as' casts, or a larger expression
+        while True:
+            j = self._skip_ws(i)
+            if j >= self.length or self.src[j] in ",;)]}":
+                return value, i
+            if self.src[j] == "+" and isinstance(value, str):
+                following, k = self.parse_value(j + 1)
+                if isinstance(following, str):
+                    value, i = value + following, k
+                    continue
+            if re.match(r"(?:as|satisfies)\s", self.src[j:j + 10]):
+                # TypeScript cast: keep the literal, drop the type
+                return value, self._skip_expression(j)
+            i = self._skip_expression(j)
+            return _Expr(self.src[start:i].strip()), i
+
+    def _parse_array(self, i: int) -> tuple[list[Any], int]:
+        items: list[Any] = []
+        i += 1
+        while True:
+            i = self._skip_ws(i)
+            if i >= self.length:
+                return items, i
+            if self.src[i] == "]":
+                return items, i + 1
+            if self.src[i] == ",":
+                i += 1
+                continue
+            if self.src.startswith("...", i):
+                expr_start = i + 3
+                i = self._skip_expression(expr_start)
+                items.append(_Spread(self.src[expr_start:i].strip()))
+                continue
+            value, i = self.parse_value(i)
+            items.append(value)
+            i = self._skip_ws(i)
+            if i < self.length and self.src[i] not in ",]":
+                # Unparseable remainder; skip to the next element
+                i = self._skip_expression(i)
+
+    def _parse_object(self, i: int) -> tuple[dict[str, Any], int]:
+        obj: dict[str, Any] = {}
+        i += 1
+        while True:
+            i = self._skip_ws(i)
+            if i >= self.length:
+                return obj, i
+            c = self.src[i]
+            if c == "}":
+                return obj, i + 1
+            if c == ",":
+                i += 1
+                continue
+            if self.src.startswith("...", i):
+                expr_start = i + 3
+                i = self._skip_expression(expr_start)
+                obj[f"...{len(obj)}"] = _Spread(self.src[expr_start:i].strip())
+                continue
+
+            key: Optional[str] = None
+            if c in "'\"`":
+                key, i = self._parse_string(i)
+            elif c == "[":
+                end = self._skip_balanced(i)
+                key, i = self.src[i:end], end
+            elif (identifier := _IDENTIFIER.match(self.src, i)) or (identifier := _NUMBER.match(self.src, i)):
+                key, i = identifier.group(0), identifier.end()
+                # Modifiers such as 'async method()' or 'get value()'
+                j = self._skip_ws(i)
+                if key in ("async", "get", "set") and (modified := _IDENTIFIER.match(self.src, j)):
+                    key, i = modified.group(0), modified.end()
+            else:
+                i = self._skip_expression(i + 1)
+                continue
+
+            i = self._skip_ws(i)
+            if i < self.length and self.src[i] == ":":
+                value, i = self.parse_value(i + 1)
+                obj[key] = value
+            elif i < self.length and self.src[i] in "(<":
+                # Method definition: skip parameters, optional return type and body
+                i = self._skip_balanced(i)
+                i = self._skip_ws(i)
+                if i < self.length and self.src[i] == ":":
+                    while i < self.length and self.src[i] != "{":
+                        i += 1
+                i = self._skip_balanced(i)
+                obj[key] = _Expr(f"{key}()")
+            else:
+                # Shorthand property
+                obj[key] = _Expr(key)
+            i = self._skip_ws(i)
+            if i < self.length and self.src[i] not in ",}":
+                i = self._skip_expression(i)
+
+def _parse_declarations(source: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Return (constant declarations by name, node description objects) found in a TypeScript file."""
+    parser = _LiteralParser(source)
+    constants: dict[str, Any] = {}
+    descriptions: list[dict[str, Any]] = []
+    for match in _CONST_DECLARATION.finditer(source):
+        try:
+            value, _ = parser.parse_value(match.end())
+        except (IndexError, RecursionError, ValueError) as e:
+            logging.debug(f"Skipping unparseable declaration {match.group(1)}: {e}")
+            continue
+        constants.setdefault(match.group(1), value)
+    for match in _DESCRIPTION_ASSIGNMENT.finditer(source):
+        try:
+            value, _ = parser.parse_value(match.end())
+        except (IndexError, RecursionError, ValueError) as e:
+            logging.debug(f"Skipping unparseable node description: {e}")
+            continue
+        if isinstance(value, dict):
+            descriptions.append(value)
+    return constants, descriptions
+
+class _Resolver:
+    """Resolves spreads and identifier references against the constants of a node's files."""
+
+    def __init__(self, constants: dict[str, Any]):
+        self.constants = constants
+        self.unresolved: list[str] = []
+
+    def _lookup(self, expr: str, seen: frozenset[str]) -> Any:
+        name = expr.split("(")[0].strip()
+        if name in self.constants and name not in seen:
+            return self.resolve(self.constants[name], seen | {name})
+        if expr not in self.unresolved:
+            self.unresolved.append(expr)
+        return None
+
+    def resolve(self, value: Any, seen: frozenset[str] = frozenset()) -> Any:
+        if isinstance(value, list):
+            resolved: list[Any] = []
+            for item in value:
+                if isinstance(item, _Spread):
+                    spread = self._lookup(item.expr, seen)
+                    if isinstance(spread, list):
+                        resolved.extend(spread)
+                else:
+                    resolved.append(self.resolve(item, seen))
+            return resolved
+        if isinstance(value, dict):
+            merged: dict[str, Any] = {}
+            for key, item in value.items():
+                if isinstance(item, _Spread):
+                    spread = self._lookup(item.expr, seen)
+                    if isinstance(spread, dict):
+                        merged.update(spread)
+                else:
+                    merged[key] = self.resolve(item, seen)
+            return merged
+        if isinstance(value, _Expr) and value.text in self.constants and value.text not in seen:
+            # Bare reference to another declaration, e.g. a shared property object
+            return self.resolve(self.constants[value.text], seen | {value.text})
+        return value
+
+def _plain(value: Any) -> Any:
+    """Convert parser values to JSON-serializable data; unevaluated expressions become their source text."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, _Expr):
+        return value.text
+    if isinstance(value, _Spread):
+        return f"...{value.expr}"
+    return value
+
+def _is_property(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("name"), str) and "type" in value and "displayName" in value
+
+def _compact_property(prop: dict[str, Any], depth: int = 0) -> dict[str, Any]:
+    """Reduce a node property to the fields an agent needs to configure it."""
+    compact: dict[str, Any] = {
+        "name": prop.get("name"),
+        "displayName": _plain(prop.get("displayName")),
+        "type": _plain(prop.get("type"))
+    }
+    if "default" in prop:
+        compact["default"] = _plain(prop["default"])
+    if prop.get("required") is True:
+        compact["required"] = True
+    if prop.get("displayOptions"):
+        compact["displayOptions"] = _plain(prop["displayOptions"])
+    options = prop.get("options")
+    if isinstance(options, list) and options:
+        if compact["type"] in ("options", "multiOptions"):
+            compact["options"] = [
+                _plain(option.get("value")) for option in options if isinstance(option, dict) and "value" in option
+            ]
+        elif depth < 2:
+            nested: list[dict[str, Any]] = []
+            for option in options:
+                if _is_property(option):
+                    nested.append(_compact_property(option, depth + 1))
+                elif isinstance(option, dict) and isinstance(option.get("values"), list):
+                    # fixedCollection groups
+                    nested.append({
+                        "name": option.get("name"),
+                        "displayName": _plain(option.get("displayName")),
+                        "values": [_compact_property(v, depth + 1) for v in option["values"] if _is_property(v)]
+                    })
+            if nested:
+                compact["options"] = nested
+    return compact
+
+def _show_options(prop: dict[str, Any]) -> dict[str, Any]:
+    """Return the displayOptions.show mapping of a property, or {} if absent or unresolved."""
+    display_options = prop.get("displayOptions")
+    show = display_options.get("show") if isinstance(display_options, dict) else None
+    return show if isinstance(show, dict) else {}
+
+def property_shows(prop: dict[str, Any], field: str, value: Optional[str]) -> bool:
+    """Whether a compacted property is visible for the given resource/operation value."""
+    if not value:
+        return True
+    allowed = _show_options(prop).get(field)
+    return not isinstance(allowed, list) or value in allowed
+
+def _select_description(descriptions: list[dict[str, Any]], node_type: str) -> dict[str, Any]:
+    """Merge the description objects that belong to the requested node type."""
+    type_name = node_type.rsplit(".", 1)[-1].lower()
+    matching = [d for d in descriptions if str(d.get("name", "")).lower() == type_name] or descriptions
+    matching.sort(key=lambda d: len(d.get("properties") or []) if isinstance(d.get("properties"), list) else -1, reverse=True)
+    merged: dict[str, Any] = {}
+    for description in matching:
+        for key, value in description.items():
+            merged.setdefault(key, value)
+    return merged
+
+def _version_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+def _extract_schema(
+    node_type: str,
+    sources: dict[str, str],
+    node_json: dict[str, str],
+    version: Optional[str]
+) -> dict[str, Any]:
+    """Build the compact schema of a node from the contents of its source files."""
+    constants: dict[str, Any] = {}
+    descriptions: list[dict[str, Any]] = []
+    for path in sorted(sources):
+        file_constants, file_descriptions = _parse_declarations(sources[path])
+        for name, value in file_constants.items():
+            constants.setdefault(name, value)
+        descriptions.extend(file_descriptions)
+
+    resolver = _Resolver(constants)
+    # Constants that look like node descriptions (e.g. versionDescription, baseDescription)
+    for value in constants.values():
+        if isinstance(value, dict) and "displayName" in value and ("properties" in value or "group" in value or "defaultVersion" in value):
+            descriptions.append(value)
+    resolved_descriptions = [resolver.resolve(d) for d in descriptions]
+    description = _select_description(resolved_descriptions, node_type) if resolved_descriptions else {}
+
+    raw_properties = description.get("properties")
+    if not isinstance(raw_properties, list):
+        # No node description found; fall back to every exported property list
+        raw_properties = []
+        for value in constants.values():
+            resolved = resolver.resolve(value)
+            if isinstance(resolved, list) and resolved and all(_is_property(p) for p in resolved):
+                raw_properties.extend(resolved)
+    properties = [p for p in raw_properties if _is_property(p)]
+
+    resources: dict[str, Any] = {}
+    operations: dict[str, dict[str, Any]] = {}
+    other_properties: list[dict[str, Any]] = []
+    for prop in properties:
+        options = prop.get("options") if isinstance(prop.get("options"), list) else []
+        if prop["name"] == "resource":
+            for option in options:
+                if isinstance(option, dict) and "value" in option:
+                    resources[str(_plain(option["value"]))] = _plain(option.get("name"))
+        elif prop["name"] == "operation":
+            resources_shown = _show_options(prop).get("resource")
+            for resource in resources_shown if isinstance(resources_shown, list) else ["*"]:
+                resource_operations = operations.setdefault(str(_plain(resource)), {})
+                for option in options:
+                    if isinstance(option, dict) and "value" in option:
+                        resource_operations[str(_plain(option["value"]))] = _plain(option.get("action") or option.get("name"))
+        else:
+            other_properties.append(prop)
+
+    node_info = {
+        key: _plain(description[key])
+        for key in ("displayName", "name", "description", "group", "version", "defaultVersion", "defaults", "inputs", "outputs")
+        if key in description
+    }
+    credentials = [
+        {key: _plain(value) for key, value in credential.items() if key in ("name", "required", "displayOptions")}
+        for credential in description.get("credentials") or []
+        if isinstance(credential, dict)
+    ] if isinstance(description.get("credentials"), list) else []
+
+    codex_data: dict[str, Any] = {}
+    for path in sorted(node_json):
+        try:
+            data = json.loads(node_json[path])
+        except ValueError:
+            continue
+        if not codex_data or str(data.get("node", "")).lower() == node_type.lower():
+            codex_data = data
+        if str(data.get("node", "")).lower() == node_type.lower():
+            break
+    codex = {
+        "categories": codex_data.get("categories"),
+        "subcategories": codex_data.get("subcategories"),
+        "alias": codex_data.get("alias"),
+        "documentation": [
+            doc.get("url") for doc in (codex_data.get("resources") or {}).get("primaryDocumentation", [])
+            if isinstance(doc, dict)
+        ]
+    }
+    codex = {key: value for key, value in codex.items() if value}
+
+    schema: dict[str, Any] = {
+        "node": node_info,
+        "version": version,
+        "credentials": credentials,
+        "resources": resources,
+        "operations": operations,
+        "properties": [_compact_property(p) for p in other_properties],
+        "source_files": sorted(sources)
+    }
+    if codex:
+        schema["codex"] = codex
+    if resolver.unresolved:
+        schema["unresolved_references"] = resolver.unresolved
+    return schema
+
+def _read_sources(folder_path: str, paths: list[str]) -> dict[str, str]:
+    contents: dict[str, str] = {}
+    for path in paths:
+        with open(os.path.join(folder_path, *path.split("/")), "r", encoding="utf-8", errors="replace") as f:
+            contents[path] = f.read()
+    return contents
+
+def _content_hash(node_type: str, version: Optional[str], contents: dict[str, str]) -> str:
+    digest = hashlib.sha256(f"{SCHEMA_EXTRACTOR_VERSION}\0{node_type.lower()}\0{version}".encode("utf-8"))
+    for path in sorted(contents):
+        digest.update(b"\0" + path.encode("utf-8") + b"\0" + contents[path].encode("utf-8"))
+    return digest.hexdigest()
+
+def _load_cached(content_hash: str) -> Optional[dict[str, Any]]:
+    cache_file = os.path.join(NODE_SCHEMA_CACHE_PATH, f"{content_hash}.json")
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable node schema cache file {cache_file}: {e}")
+        return None
+
+def _store_cached(content_hash: str, schema: dict[str, Any]) -> None:
+    try:
+        os.makedirs(NODE_SCHEMA_CACHE_PATH, exist_ok=True)
+        cache_file = os.path.join(NODE_SCHEMA_CACHE_PATH, f"{content_hash}.json")
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(schema, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logging.warning(f"Could not write node schema cache for {content_hash}: {e}")
+
+def index_key(node_type: str, version: Optional[str]) -> str:
+    """Key of a node schema in the prebuilt node index."""
+    return f"schema:{node_type.lower()}:{version or ''}"
+
+class NodeSchemaCache:
+    """
+    Two-level cache of extracted node schemas.
+
+    The in-memory level is keyed by (folder, node type, version) and needs no
+    I/O on a hit. On a miss the prebuilt node index is consulted first;
+    failing that, the source files are read and hashed and the hash keys the
+    on-disk level, so a schema is only re-extracted when the node's files
+    actually change. The in-memory level is cleared whenever the node catalog
+    reloads.
+    """
+
+    def __init__(self):
+        self._schemas: dict[tuple[str, str, Optional[str]], dict[str, Any]] = {}
+        self._locks: dict[tuple[str, str, Optional[str]], asyncio.Lock] = {}
+
+    def clear(self) -> None:
+        """Forget the in-memory schemas; they are looked up again on next use."""
+        self._schemas.clear()
+
+    def compute(self, node_type: str, folder_path: str, version: Optional[str], manifest: list[dict[str, Any]]) -> dict[str, Any]:
+        """Read, hash and extract (blocking); used from a worker thread."""
+        source_paths = [
+            entry["path"] for entry in manifest
+            if entry["kind"] in _SOURCE_KINDS
+            and entry["path"].endswith(_SOURCE_EXTENSIONS)
+            and entry["version"] in (None, version)
+        ]
+        node_json_paths = [entry["path"] for entry in manifest if entry["kind"] == "node.json"]
+        sources = _read_sources(folder_path, source_paths)
+        node_json = _read_sources(folder_path, node_json_paths)
+
+        content_hash = _content_hash(node_type, version, {**sources, **node_json})
+        schema = _load_cached(content_hash)
+        if schema is None:
+            schema = _extract_schema(node_type, sources, node_json, version)
+            schema["content_hash"] = content_hash
+            _store_cached(content_hash, schema)
+            logging.info(f"Extracted schema for {node_type} (version {version}) from {len(sources)} files")
+        return schema
+
+    async def get(self, node_type: str, folder_path: str, version: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """
+        Return the schema of a node, defaulting to its latest version subfolder.
+
+        Returns None if the node folder does not exist; raises ValueError for
+        an unknown version.
+        """
+        manifest = await node_manifests.get(folder_path)
+        if manifest is None:
+            return None
+        versions = available_versions(manifest)
+        if version:
+            version = version.lower()
+            if version not in versions:
+                raise ValueError(f"Version '{version}' not found. Available versions: {versions}")
+        elif versions:
+            version = max(versions, key=_version_key)
+
+        key = (folder_path, node_type.lower(), version)
+        schema = self._schemas.get(key)
+        if schema is None:
+            # Concurrent misses for the same node share one extraction
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                schema = self._schemas.get(key)
+                if (
+                    schema is None
+                    and node_index.meta.get("schema_extractor_version") == SCHEMA_EXTRACTOR_VERSION
+                    and await run_blocking(node_index.folder_is_current, folder_path)
+                ):
+                    schema = node_index.get(index_key(node_type, version))
+                if schema is None:
+                    schema = await run_blocking(self.compute, node_type, folder_path, version, manifest)
+                self._schemas[key] = schema
+        return {**schema, "versions": versions}
+
+# Shared schema cache used by the get_node_schema tool
+node_schemas = NodeSchemaCache()
+
+def _clear_node_schemas(catalog: NodeCatalog) -> None:
+    # A reloaded catalog may map node types to other folders, and the in-memory level is not keyed by content
+    node_schemas.clear()
+
+node_catalog.add_reload_hook(_clear_node_schemas)
@@ -0,0 +1,228 @@
+'''
+Full-text search over the local node definitions.
+
+An inverted index is built from each node's display name, type identifier,
+categories, description and resource/operation names (taken from the
+extracted node schemas) and queried with BM25.
+'''
+import asyncio
+import bisect
+import logging
+import math
+import re
+import time
+from typing import Any, Optional
+
+from mcp_components.node_catalog import NodeCatalog
+from mcp_components.node_schema import node_schemas
+
+# Weight of a term occurrence per field when computing term frequencies
+FIELD_WEIGHTS: dict[str, float] = {
+    "display_name": 3.0,
+    "type": 3.0,
+    "categories": 1.5,
+    "description": 1.0,
+    "operations": 1.0
+}
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+_SNIPPET_LENGTH = 160
+
+# Filler words of natural-language queries ("which node can send an SMS")
+_STOP_WORDS: frozenset[str] = frozenset({
+    "a", "an", "and", "are", "can", "do", "doe", "for", "from", "how", "i", "in", "is", "it",
+    "me", "my", "node", "of", "on", "or", "that", "the", "to", "want", "what", "which", "with"
+})
+
+_TOKEN = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+def _normalize(token: str) -> str:
+    """Lowercase a token and strip a plural 's' so 'messages' matches 'message'."""
+    token = token.lower()
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        token = token[:-1]
+    return token
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized terms, breaking camelCase words apart as well."""
+    terms: list[str] = []
+    for word in _TOKEN.findall(text):
+        parts = _CAMEL_BOUNDARY.split(word)
+        if len(parts) > 1:
+            terms.append(_normalize(word))
+        terms.extend(_normalize(part) for part in parts)
+    return terms
+
+def _texts(value: Any) -> list[str]:
+    """Flatten strings out of nested lists and dicts (e.g. codex subcategories)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _texts(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _texts(item)]
+    return []
+
+class NodeSearchIndex:
+    """
+    Inverted index of node types for BM25-ranked search.
+
+    The index is derived from a NodeCatalog and rebuilt whenever the
+    catalog's generation changes.
+    """
+
+    def __init__(self):
+        self.generation: Optional[int] = None
+        self._lock = asyncio.Lock()
+        self._documents: list[dict[str, Any]] = []
+        self._postings: dict[str, dict[int, float]] = {}
+        self._vocabulary: list[str] = []
+        self._lengths: list[float] = []
+        self._average_length = 1.0
+
+    async def _document(self, catalog: NodeCatalog, node_type: str) -> dict[str, Any]:
+        """Collect the searchable fields of one node type."""
+        node_entry, _, _ = catalog.lookup(node_type)
+        categories = list(catalog.type_categories.get(node_type, []))
+        if node_type in catalog.type_class:
+            categories.append(catalog.type_class[node_type])
+        fields: dict[str, list[str]] = {
+            "display_name": [node_entry.get('name') or ""],
+            "type": [node_entry.get('type') or node_type],
+            "categories": categories,
+            "description": [],
+            "operations": []
+        }
+
+        folder = catalog.node_folder(node_type)
+        schema: Optional[dict[str, Any]] = None
+        if folder:
+            try:
+                schema = await node_schemas.get(node_type, folder)
+            except Exception as e:
+                logging.debug(f"Node search: no schema for {node_type}: {e}")
+        if schema:
+            node_info = schema.get("node") or {}
+            codex = schema.get("codex") or {}
+            fields["display_name"] += _texts(node_info.get("displayName"))
+            fields["categories"] += _texts(codex.get("categories")) + _texts(codex.get("subcategories")) + _texts(codex.get("alias"))
+            fields["description"] += _texts(node_info.get("description"))
+            fields["operations"] += _texts(schema.get("resources"))
+            for resource_operations in (schema.get("operations") or {}).values():
+                for operation, action in resource_operations.items():
+                    fields["operations"] += [operation, *_texts(action)]
+
+        return {
+            "type_identifier": node_entry.get('type') or node_type,
+            "display_name": node_entry.get('name'),
+            "fields": {name: [text for text in texts if text] for name, texts in fields.items()}
+        }
+
+    async def ensure(self, catalog: NodeCatalog) -> None:
+        """Build the index for the catalog's current generation if it is not built yet."""
+        if self.generation == catalog.generation:
+            return
+        async with self._lock:
+            if self.generation == catalog.generation:
+                return
+            started = time.monotonic()
+            generation = catalog.generation
+            documents = await asyncio.gather(*(self._document(catalog, node_type) for node_type in catalog.type_origin))
+
+            postings: dict[str, dict[int, float]] = {}
+            lengths: list[float] = []
+            for doc_id, document in enumerate(documents):
+                length = 0.0
+                for field, texts in document["fields"].items():
+                    weight = FIELD_WEIGHTS[field]
+                    for text in texts:
+                        for term in tokenize(text):
+                            doc_postings = postings.setdefault(term, {})
+                            doc_postings[doc_id] = doc_postings.get(doc_id, 0.0) + weight
+                            length += weight
+                lengths.append(length)
+
+            self._documents = documents
+            self._postings = postings
+            self._vocabulary = sorted(postings)
+            self._lengths = lengths
+            self._average_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+            self.generation = generation
+            logging.info(
+                f"Node search index built: {len(documents)} nodes, {len(postings)} terms "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+
+    def _expand(self, term: str, allow_prefix: bool) -> list[str]:
+        """Return the indexed terms for a query term, optionally falling back to prefix matches."""
+        if term in self._postings:
+            return [term]
+        if not allow_prefix or len(term) < 3:
+            return []
+        matches: list[str] = []
+        position = bisect.bisect_left(self._vocabulary, term)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(term):
+            matches.append(self._vocabulary[position])
+            position += 1
+        return matches
+
+    def _snippet(self, document: dict[str, Any], terms: set[str]) -> Optional[str]:
+        """Pick the description or operation text that matches the most query terms."""
+        best_text, best_hits = None, 0
+        for field in ("description", "operations", "categories", "display_name"):
+            for text in document["fields"][field]:
+                hits = len(terms & set(tokenize(text)))
+                if hits > best_hits:
+                    best_text, best_hits = text, hits
+        if best_text and len(best_text) > _SNIPPET_LENGTH:
+            best_text = best_text[:_SNIPPET_LENGTH - 3].rstrip() + "..."
+        return best_text
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        allowed_types: Optional[set[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Rank nodes against a free-text query with BM25.
+
+        allowed_types, if given, restricts results to these lowercased type
+        identifiers. Returns at most `limit` results, best first.
+        """
+        document_count = len(self._documents)
+        scores: dict[int, float] = {}
+        matched_terms: set[str] = set()
+        query_terms = [term for term in dict.fromkeys(tokenize(query)) if term not in _STOP_WORDS]
+        for position, query_term in enumerate(query_terms):
+            # Only the last term may be incomplete, as in search-as-you-type
+            for term in self._expand(query_term, allow_prefix=position == len(query_terms) - 1):
+                doc_postings = self._postings[term]
+                matched_terms.add(term)
+                idf = math.log(1 + (document_count - len(doc_postings) + 0.5) / (len(doc_postings) + 0.5))
+                for doc_id, frequency in doc_postings.items():
+                    norm = _K1 * (1 - _B + _B * self._lengths[doc_id] / self._average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (_K1 + 1) / (frequency + norm)
+
+        if allowed_types is not None:
+            scores = {
+                doc_id: score for doc_id, score in scores.items()
+                if self._documents[doc_id]["type_identifier"].lower() in allowed_types
+            }
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [
+            {
+                "type_identifier": self._documents[doc_id]["type_identifier"],
+                "display_name": self._documents[doc_id]["display_name"],
+                "score": round(score, 4),
+                "snippet": self._snippet(self._documents[doc_id], matched_terms)
+            }
+            for doc_id, score in ranked
+        ]
+
+# Shared search index, built in the background by the lifespan handler in mcp_server.py
+node_search = NodeSearchIndex()
@@ -0,0 +1,108 @@
+'''
+Field projection for tool responses.
+
+A projection is a comma-separated list of dotted paths such as
+"id,name,nodes.name,nodes.type". Lists are projected element-wise, so
+"nodes.name" selects the name of every node; "*" matches every key of a
+mapping (e.g. "connections.*.main").
+'''
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+# Nested selection: key -> True (whole value) or a deeper selection
+FieldTree = dict[str, Union[bool, "FieldTree"]]
+
+def parse_fields(fields: Optional[str]) -> Optional[FieldTree]:
+    """Parse a comma-separated list of dotted paths; None or blank means no projection."""
+    if not fields or not fields.strip():
+        return None
+    tree: FieldTree = {}
+    for path in fields.split(","):
+        keys = [key.strip() for key in path.strip().split(".")]
+        if not keys or any(not key for key in keys):
+            if path.strip():
+                raise ValueError(f"Invalid field path '{path.strip()}'")
+            continue
+        node = tree
+        for key in keys[:-1]:
+            child = node.get(key)
+            if child is True:
+                # A shorter path already selects the whole value
+                break
+            if child is None:
+                child = node[key] = {}
+            node = child
+        else:
+            node[keys[-1]] = True
+    return tree or None
+
+def _merge_include(first: Any, second: Any) -> Any:
+    """Union of two pydantic `include` values."""
+    if first is True or second is True:
+        return True
+    merged = dict(first)
+    for key, value in second.items():
+        merged[key] = _merge_include(merged[key], value) if key in merged else value
+    return merged
+
+def _items_include(items: list[Any], tree: FieldTree) -> Any:
+    """Include for every one of items: elements of one list or mapping may have different keys."""
+    include: Any = None
+    for item in items:
+        if item is not None:
+            item_include = model_include(item, tree)
+            include = item_include if include is None else _merge_include(include, item_include)
+    return include
+
+def model_include(value: Any, tree: FieldTree) -> Any:
+    """
+    Translate a field tree into a pydantic `include` argument for value.
+
+    pydantic needs '__all__' to reach into list elements, so the shape of the
+    actual value decides where it is inserted; keys that do not exist are dropped.
+    The selections of all elements of a list (or values under '*') are merged.
+    """
+    if isinstance(value, (list, tuple)):
+        include = _items_include(list(value), tree)
+        return {"__all__": include if include is not None else tree}
+    include: dict[Any, Any] = {}
+    for key, subtree in tree.items():
+        if key == "*":
+            children = list(value.values()) if isinstance(value, dict) else []
+            child_include = None if subtree is True else _items_include(children, subtree)
+            include["__all__"] = True if child_include is None else child_include
+            continue
+        if isinstance(value, BaseModel):
+            if key not in type(value).model_fields:
+                continue
+            child = getattr(value, key)
+        elif isinstance(value, dict):
+            if key not in value:
+                continue
+            child = value[key]
+        else:
+            continue
+        include[key] = True if subtree is True or child is None else model_include(child, subtree)
+    return include
+
+def dump_projected(model: BaseModel, tree: Optional[FieldTree], **dump_kwargs: Any) -> dict[str, Any]:
+    """model_dump() restricted to the projected fields, so unselected parts are never serialized."""
+    if tree is None:
+        return model.model_dump(**dump_kwargs)
+    return model.model_dump(include=model_include(model, tree), **dump_kwargs)
+
+def project(data: Any, tree: Optional[FieldTree]) -> Any:
+    """Apply a field tree to plain dicts and lists."""
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    result: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        selected = data.items() if key == "*" else ([(key, data[key])] if key in data else [])
+        for name, value in selected:
+            result[name] = value if subtree is True else project(value, subtree)
+    return result
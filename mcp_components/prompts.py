@@ -21,22 +21,30 @@ def general_assistance_prompt() -> list[dict[str, str]]:
                 "```\n"
                 "list_workflows      - Retrieve workflows with optional filtering by activation status, tags, or name\n"
                 "get_workflow        - Obtain complete workflow definition including nodes, connections, and settings\n"
+                "query_workflows     - Find workflows by node type, credential, webhook path or called sub-workflow\n"
                 "create_workflow     - Construct new workflow with custom processing logic and configuration\n"
                 "update_workflow     - Modify existing workflow structure, settings, or metadata\n"
+                "patch_workflow      - Apply node-level edits or a JSON Patch without resending the whole workflow\n"
                 "delete_workflow     - Remove a workflow from the system\n"
                 "activate_workflow   - Enable workflow execution\n"
                 "deactivate_workflow - Disable workflow execution\n"
+                "bulk_workflow_action - Activate, deactivate, delete or re-tag many workflows in one call\n"
                 "```\n\n"
                 "## Node Discovery & Analysis\n\n"
                 "```\n"
                 "list_nodes          - Enumerate available node types by category or classification\n"
+                "search_nodes        - Find node types by capability with ranked full-text search\n"
                 "get_node_info       - Retrieve detailed node definition and configuration specifications\n"
+                "get_node_schema     - Retrieve the compact parameter schema (resources, operations, parameters) of a node\n"
                 "```\n\n"
                 "## Execution Monitoring\n\n"
                 "```\n"
-                "list_workflow_executions - View execution history for a specific workflow with status filtering\n"
+                "list_workflow_executions - View execution history with status and time filters, or aggregate it (counts, error rates, p50/p95/p99)\n"
+                "execution_overview       - Health table (last run, failure rate, avg duration) across many workflows\n"
                 "get_execution            - Inspect detailed execution record including results and diagnostics\n"
+                "summarize_execution      - Per-node runs, item counts, timings, errors and sample items of one execution\n"
                 "delete_execution         - Remove execution history record\n"
+                "prune_executions         - Delete many executions by workflow, status and age (dry run available)\n"
                 "```\n\n"
                 "## Resource Access\n\n"
                 "```\n"
@@ -2,13 +2,13 @@
 Defines MCP resources for accessing n8n data like workflows, node types, and tags.
 '''
 import logging
-import json
-import os
 from typing import Any, Optional
 
 # Import shared configurations and n8n client
-from config import n8n_client, CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH, NODE_DATA_BASE_PATH
+from config import n8n_client, NODE_DATA_BASE_PATH
 from mcp_server import app
+from mcp_components.node_catalog import node_catalog
+from mcp_components.workflow_cache import get_workflow_cached
 from n8n_sdk_python.models.workflows import Workflow
 
 # Note: Resource functions will be registered in main.py using app.resource_manager.add_resource
@@ -49,7 +49,7 @@ async def get_workflow_resource_data(workflow_id: str) -> dict[str, Any]:
         # For simplicity, returning an error dict. The framework might expect an exception.
         return {"error": "n8n_client not initialized", "status_code": 500} 
     try:
-        workflow: Workflow = await n8n_client.get_workflow(workflow_id=workflow_id) 
+        workflow: Workflow = await get_workflow_cached(workflow_id)
         return workflow.model_dump(exclude_none=True)
     except Exception as e:
         logging.error(f"Error fetching workflow resource {workflow_id}: {e}", exc_info=True)
@@ -85,21 +85,9 @@ async def get_node_types_resource_data() -> dict[str, Any]:
     """
     all_nodes: dict[str, dict[str, str]] = {}
     try:
-        category_data: dict[str, Any] = {}
-        class_data: dict[str, Any] = {}
-        if os.path.exists(CATEGORY_CLASSIFICATION_FILE_PATH):
-            with open(CATEGORY_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f:
-                category_data = json.load(f)
-        else:
-            logging.warning(f"Category classification file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}")
-            return {"error": f"Category classification file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}", "status_code": 500}
-            
-        if os.path.exists(CLASS_CLASSIFICATION_FILE_PATH):
-            with open(CLASS_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f:
-                class_data = json.load(f)
-        else:
-            logging.warning(f"Class classification file not found: {CLASS_CLASSIFICATION_FILE_PATH}")
-            return {"error": f"Class classification file not found: {CLASS_CLASSIFICATION_FILE_PATH}", "status_code": 500}
+        catalog = node_catalog.refresh()
+        category_data: dict[str, Any] = catalog.category_data
+        class_data: dict[str, Any] = catalog.class_data
         
         for cat_name, nodes in category_data.get('categories', {}).items():
             for node in nodes:
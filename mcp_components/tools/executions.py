@@ -1,19 +1,94 @@
 '''
 Defines MCP tools for interacting with n8n workflow executions.
 '''
+import json
 import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-from mcp_server import app
-from config import n8n_client
-from n8n_sdk_python.models.executions import ExecutionList, Execution, ExecutionStatus
+from mcp.server.fastmcp import Context
+
+from mcp_server import app, progress_token
+from config import (
+    n8n_client, EXECUTION_LIST_MAX_ITEMS, EXECUTION_CHUNK_ITEMS, EXECUTION_CHUNK_MAX_BYTES,
+    EXECUTION_OVERVIEW_CACHE_TTL_SECONDS, EXECUTION_OVERVIEW_CONCURRENCY, EXECUTION_SUMMARY_CACHE_SIZE,
+    EXECUTION_PRUNE_MAX_ITEMS, EXECUTION_PRUNE_REQUESTS_PER_SECOND,
+    BULK_ACTION_CONCURRENCY, BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS
+)
+from n8n_sdk_python.models.executions import ExecutionList, Execution, ExecutionShort, ExecutionStatus
+from n8n_sdk_python.models.workflows import WorkflowList, WorkflowShort
+from mcp_components.concurrency import call_with_retries, map_bounded
+from mcp_components.execution_cache import execution_cache, get_execution_cached
+from mcp_components.execution_data import (
+    Position, decode_position, encode_position, items_before, read_chunk, run_data_of, run_data_overview,
+    summarize_run_data
+)
+from mcp_components.execution_stats import (
+    ExecutionStats, ExecutionSummary, execution_duration_ms, execution_finished, execution_status, parse_timestamp
+)
+
+# Largest page size accepted by the n8n executions endpoint
+EXECUTION_PAGE_SIZE = 250
+
+# Most execution_overview results kept at once
+OVERVIEW_CACHE_MAX_ENTRIES = 32
+
+# execution_overview results, least recently stored first:
+# (tags, project_id, active_only, runs) -> (expires_at, response)
+_overview_cache: OrderedDict[tuple[Optional[str], Optional[str], bool, int], tuple[float, dict[str, Any]]] = OrderedDict()
+
+# Most samples per node summarize_execution returns
+SUMMARY_MAX_SAMPLE_ITEMS = 50
+
+# summarize_execution results of finished executions, least recently used first:
+# (execution_id, sample_items, include_stack) -> response
+_summary_cache: OrderedDict[tuple[str, int, bool], dict[str, Any]] = OrderedDict()
+
+def _execution_row(execution: Execution | ExecutionShort) -> dict[str, Any]:
+    return {
+        "id": execution.id,
+        "workflow_id": execution.workflowId,
+        "status": execution_status(execution),
+        "started_at": execution.startedAt.isoformat() if execution.startedAt else None,
+        "finished_at": execution.stoppedAt.isoformat() if execution.stoppedAt else None,
+        "duration_ms": execution_duration_ms(execution),
+        "mode": execution.mode
+    }
+
+def _encode_cursor(page_cursor: Optional[str], position: int, page_size: int) -> str:
+    """Cursor for resuming at an item inside a page: '<position>:<page size>:<n8n cursor>'."""
+    return f"{position}:{page_size}:{page_cursor or ''}"
+
+def _decode_cursor(cursor: Optional[str]) -> tuple[Optional[str], int, Optional[int]]:
+    """Split a cursor into (n8n cursor, items to skip, page size); plain n8n cursors pass through."""
+    if not cursor:
+        return None, 0, None
+    parts = cursor.split(":", 2)
+    if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+        return cursor, 0, None
+    return parts[2] or None, int(parts[0]), int(parts[1])
+
+def _in_window(value: Optional[datetime], after: Optional[datetime], before: Optional[datetime]) -> bool:
+    if after is None and before is None:
+        return True
+    if value is None:
+        return False
+    return (after is None or value >= after) and (before is None or value < before)
 
 @app.tool()
 async def list_workflow_executions(
-    workflow_id: str, 
+    workflow_id: Optional[str] = None, 
     status: Optional[str] = None,
-    limit: int = 10,
-    include_data: bool = False
+    limit: Optional[int] = None,
+    include_data: bool = False,
+    cursor: Optional[str] = None,
+    started_after: Optional[str] = None,
+    started_before: Optional[str] = None,
+    stopped_after: Optional[str] = None,
+    stopped_before: Optional[str] = None,
+    summary: bool = False
 ) -> dict[str, Any]:
     """
     Retrieves execution history records for a specified workflow with optional filtering.
@@ -21,50 +96,326 @@ async def list_workflow_executions(
     This operation returns a paginated list of execution records for a given workflow,
     with the ability to filter by execution status(e.g. 'error', 'success', or 'waiting') and limit result size. Each record 
     contains execution metadata such as start/end times, status, and execution mode.
+
+    Pages are followed automatically until `limit` executions matched (default 10 rows, or
+    EXECUTION_LIST_MAX_ITEMS scanned executions in summary mode); `next_cursor` continues the
+    listing. Time windows take ISO 8601 timestamps (after is inclusive, before exclusive).
+    Executions are listed newest first, so paging stops once they start before started_after.
+
+    Args:
+        workflow_id: Workflow to list executions of; all workflows if omitted.
+        status: 'success', 'error', 'waiting' or 'running'.
+        limit: Maximum number of executions to return (or to aggregate in summary mode).
+        include_data: Include the execution data of each row (ignored in summary mode). The list
+                      endpoint only returns metadata, so this costs one request per row for
+                      executions not already in the execution cache; keep `limit` small.
+        cursor: Continue a previous listing from its next_cursor.
+        started_after / started_before: Window on the execution start time.
+        stopped_after / stopped_before: Window on the execution end time.
+        summary: Instead of rows, return counts by status and mode, error rates and
+                 p50/p95/p99 durations, overall and per workflow.
     """
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
         # Convert string status to ExecutionStatus enum if provided
-        execution_status = None
-        if status:
+        execution_status_filter = None
+        status_filter = status.lower() if status else None
+        if status_filter and status_filter != "running":
             try:
-                execution_status = ExecutionStatus(status.lower())
+                execution_status_filter = ExecutionStatus(status_filter)
             except ValueError:
                 logging.warning(f"Invalid execution status: {status}. Using default.")
-        
-        result: ExecutionList = await n8n_client.list_executions(
-            workflow_id=workflow_id,
-            status=execution_status,
-            limit=limit,
-            include_data=include_data
-        )
-        
+                status_filter = None
+
+        try:
+            started_from, started_until = parse_timestamp(started_after), parse_timestamp(started_before)
+            stopped_from, stopped_until = parse_timestamp(stopped_after), parse_timestamp(stopped_before)
+        except ValueError as e:
+            return {"status": "failure", "message": f"Invalid timestamp: {e}"}
+
+        default_limit = EXECUTION_LIST_MAX_ITEMS if summary else 10
+        max_items = min(limit, EXECUTION_LIST_MAX_ITEMS) if limit and limit > 0 else default_limit
+
+        # Filters n8n cannot apply are applied here, so fetch full pages when they are set
+        filters_locally = status_filter == "running" or any((started_until, stopped_from, stopped_until))
+        page_cursor, skip, page_size = _decode_cursor(cursor)
+
         executions: list[dict[str, Any]] = []
-        if result.data:
-            for exec_data in result.data:
-                executions.append({
-                    "id": exec_data.id,
-                    "status": "success" if exec_data.finished and not hasattr(exec_data, "error") 
-                             else ("running" if not exec_data.finished else "error"),
-                    "started_at": exec_data.startedAt.isoformat() if exec_data.startedAt else None,
-                    "finished_at": exec_data.stoppedAt.isoformat() if exec_data.stoppedAt else None,
-                    "mode": exec_data.mode
-                })
-        
-        return {
+        aggregate = ExecutionSummary()
+        matched = 0
+        scanned = 0
+        pages = 0
+        next_cursor: Optional[str] = None
+        while True:
+            if page_size is None:
+                page_size = EXECUTION_PAGE_SIZE if filters_locally else min(EXECUTION_PAGE_SIZE, max_items - matched)
+            result: ExecutionList = await n8n_client.list_executions(
+                workflow_id=workflow_id,
+                status=execution_status_filter,
+                limit=page_size,
+                cursor=page_cursor
+            )
+            pages += 1
+            page = result.data or []
+            done = not result.nextCursor or not page
+            for position in range(skip, len(page)):
+                if matched >= max_items:
+                    # Resume inside this page next time
+                    next_cursor = _encode_cursor(page_cursor, position, page_size)
+                    done = True
+                    break
+                exec_data = page[position]
+                scanned += 1
+                if started_from is not None and exec_data.startedAt < started_from:
+                    # Executions are listed newest first: the rest started even earlier
+                    done = True
+                    break
+                if (
+                    (status_filter == "running" and execution_status(exec_data) != "running")
+                    or not _in_window(exec_data.startedAt, None, started_until)
+                    or not _in_window(exec_data.stoppedAt, stopped_from, stopped_until)
+                ):
+                    continue
+                matched += 1
+                if summary:
+                    aggregate.add(exec_data)
+                else:
+                    executions.append(_execution_row(exec_data))
+            else:
+                if matched >= max_items and not done:
+                    next_cursor = result.nextCursor
+                    done = True
+            if done:
+                break
+            page_cursor, skip, page_size = result.nextCursor, 0, None
+
+        if include_data and not summary:
+            # Listed executions carry no data; fetch it per row through the execution cache
+            async def add_data(row: dict[str, Any]) -> None:
+                try:
+                    execution: Execution = await get_execution_cached(row["id"], include_data=True)
+                    row["data"] = execution.data.model_dump(exclude_none=True) if execution.data else None
+                except Exception as e:
+                    logging.warning(f"list_workflow_executions: failed to fetch data of execution {row['id']}: {e}")
+                    row["data_error"] = str(e)
+
+            await map_bounded(executions, add_data, BULK_ACTION_CONCURRENCY)
+
+        response: dict[str, Any] = {
             "status": "success",
-            "count": len(executions),
-            "executions": executions
+            "count": matched,
+            "scanned": scanned,
+            "pages": pages,
+            "next_cursor": next_cursor
         }
+        if summary:
+            response["summary"] = aggregate.to_dict()
+        else:
+            response["executions"] = executions
+        return response
     except Exception as e:
         logging.error(f"Error listing executions for workflow {workflow_id}: {e}", exc_info=True)
         return {"status": "failure", "message": f"Failed to list workflow executions: {str(e)}"}
 
+async def _select_workflows(tags: Optional[str], project_id: Optional[str], active_only: bool) -> list[WorkflowShort]:
+    """List every workflow matching the filters, following cursors."""
+    params: dict[str, Any] = {"limit": EXECUTION_PAGE_SIZE}
+    if active_only:
+        params["active"] = True
+    if tags:
+        params["tags"] = tags
+    if project_id:
+        params["project_id"] = project_id
+    workflows: list[WorkflowShort] = []
+    cursor: Optional[str] = None
+    while True:
+        page: WorkflowList = await n8n_client.list_workflows(**params, cursor=cursor)
+        workflows.extend(page.data or [])
+        cursor = page.nextCursor
+        if not cursor or not page.data:
+            return workflows
+
+def _health_row(workflow: WorkflowShort, executions: list[ExecutionShort]) -> dict[str, Any]:
+    """One line of the execution overview table."""
+    stats = ExecutionStats()
+    for execution in executions:
+        stats.add(execution)
+    last = max(executions, key=lambda execution: execution.startedAt, default=None)
+    last_error = max(
+        (execution for execution in executions if execution_status(execution) == "error"),
+        key=lambda execution: execution.startedAt, default=None
+    )
+    completed = stats.by_status["success"] + stats.by_status["error"]
+    return {
+        "id": workflow.id,
+        "name": workflow.name,
+        "active": workflow.active,
+        "runs": stats.total,
+        "last_started_at": last.startedAt.isoformat() if last else None,
+        "last_status": execution_status(last) if last else None,
+        "last_error_at": last_error.startedAt.isoformat() if last_error else None,
+        "failure_rate": round(stats.by_status["error"] / completed, 4) if completed else None,
+        "avg_duration_ms": round(sum(stats.durations) / len(stats.durations), 1) if stats.durations else None
+    }
+
+@app.tool()
+async def execution_overview(
+    tags: Optional[str] = None,
+    project_id: Optional[str] = None,
+    active_only: bool = False,
+    runs_per_workflow: int = 20,
+    concurrency: Optional[int] = None,
+    refresh: bool = False
+) -> dict[str, Any]:
+    """
+    Summarizes recent execution health across many workflows in one call.
+    
+    Fetches the most recent executions of every workflow (or of those matching the tag or
+    project filter) concurrently, at most `concurrency` requests at a time, and returns one
+    compact row per workflow: run count, last run and its status, last failure, failure rate
+    and average duration. Workflows with the highest failure rate come first. Results are
+    cached for EXECUTION_OVERVIEW_CACHE_TTL_SECONDS; pass refresh=True to bypass the cache.
+    
+    Args:
+        tags: Comma-separated tag names; only workflows with all of them are included.
+        project_id: Only include workflows of this project.
+        active_only: Only include active workflows.
+        runs_per_workflow: Number of most recent executions considered per workflow (1-250).
+        concurrency: Maximum parallel requests (default from EXECUTION_OVERVIEW_CONCURRENCY).
+        refresh: Ignore a cached overview and fetch again.
+    """
+    if not n8n_client:
+        return {"status": "failure", "message": "n8n_client is not initialized."}
+    runs_per_workflow = max(1, min(runs_per_workflow, EXECUTION_PAGE_SIZE))
+    concurrency = concurrency if concurrency and concurrency > 0 else EXECUTION_OVERVIEW_CONCURRENCY
+    cache_key = (tags or None, project_id or None, active_only, runs_per_workflow)
+    cached = _overview_cache.get(cache_key)
+    if cached is not None and not refresh and cached[0] > time.monotonic():
+        return {**cached[1], "cached": True}
+    try:
+        started = time.monotonic()
+        workflows = await _select_workflows(tags, project_id, active_only)
+
+        async def fetch(workflow: WorkflowShort) -> dict[str, Any]:
+            try:
+                result: ExecutionList = await call_with_retries(
+                    lambda: n8n_client.list_executions(workflow_id=workflow.id, limit=runs_per_workflow),
+                    BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS,
+                    f"Listing executions of workflow {workflow.id}"
+                )
+                return _health_row(workflow, result.data or [])
+            except Exception as e:
+                logging.warning(f"execution_overview: failed to list executions of workflow {workflow.id}: {e}")
+                return {"id": workflow.id, "name": workflow.name, "active": workflow.active, "error": str(e)}
+
+        rows = await map_bounded(workflows, fetch, concurrency)
+        rows.sort(key=lambda row: (-(row.get("failure_rate") or 0), row.get("name") or ""))
+        response = {
+            "status": "success",
+            "generated_at": datetime.now().astimezone().isoformat(),
+            "workflows": len(rows),
+            "failing": sum(1 for row in rows if row.get("last_status") == "error"),
+            "never_run": sum(1 for row in rows if row.get("runs") == 0),
+            "errors": sum(1 for row in rows if "error" in row),
+            "seconds": round(time.monotonic() - started, 2),
+            "rows": rows
+        }
+        if EXECUTION_OVERVIEW_CACHE_TTL_SECONDS > 0:
+            now = time.monotonic()
+            for expired_key in [key for key, (expires_at, _) in _overview_cache.items() if expires_at <= now]:
+                del _overview_cache[expired_key]
+            _overview_cache.pop(cache_key, None)
+            _overview_cache[cache_key] = (now + EXECUTION_OVERVIEW_CACHE_TTL_SECONDS, response)
+            while len(_overview_cache) > OVERVIEW_CACHE_MAX_ENTRIES:
+                _overview_cache.popitem(last=False)
+        return response
+    except Exception as e:
+        logging.error(f"Error in execution_overview: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to build execution overview: {str(e)}"}
+
+def _execution_metadata(execution: Execution) -> dict[str, Any]:
+    """Execution fields without its data."""
+    return {
+        **execution.model_dump(mode="json", exclude_none=True, exclude={"data"}),
+        "status": execution_status(execution),
+        "duration_ms": execution_duration_ms(execution)
+    }
+
+async def _get_execution_chunk(
+    execution_id: str,
+    node_name: Optional[str],
+    cursor: Optional[str],
+    max_items: Optional[int],
+    stream: bool,
+    ctx: Optional[Context]
+) -> dict[str, Any]:
+    """Read one chunk of an execution's runData (or stream all of them); see get_execution."""
+    try:
+        position = decode_position(cursor)
+    except ValueError as e:
+        return {"status": "failure", "message": str(e)}
+    max_items = max(1, max_items) if max_items else EXECUTION_CHUNK_ITEMS
+
+    execution: Execution = await get_execution_cached(execution_id, include_data=True)
+    data = execution.data.root if execution.data is not None else {}
+    run_data = run_data_of(data)
+    if node_name is not None and node_name not in run_data:
+        return {"status": "failure", "message": f"Node '{node_name}' has no run data in execution {execution_id}. Nodes: {list(run_data)}"}
+    overview = run_data_overview(run_data)
+    total_items = sum(
+        node["items"] for node in overview if node_name is None or node["node"] == node_name
+    )
+    response: dict[str, Any] = {"status": "success", "execution": _execution_metadata(execution)}
+    if cursor is None:
+        result_data = data.get("resultData") or {}
+        response["result"] = {
+            key: result_data[key] for key in ("lastNodeExecuted", "error") if result_data.get(key) is not None
+        }
+        response["nodes"] = overview
+
+    def done_before(at: Position) -> int:
+        if node_name is None:
+            return items_before(run_data, at)
+        node_start = (list(run_data).index(node_name), 0, 0, 0)
+        return items_before(run_data, max(at, node_start)) - items_before(run_data, node_start)
+
+    if stream and progress_token(ctx) is not None:
+        chunks = 0
+        next_position: Optional[Position] = position
+        while next_position is not None:
+            groups, count, next_position = read_chunk(run_data, next_position, max_items, EXECUTION_CHUNK_MAX_BYTES, node_name)
+            chunks += 1
+            done = done_before(next_position) if next_position is not None else total_items
+            await ctx.report_progress(
+                done, total_items,
+                message=json.dumps({"chunk": chunks, "items": count, "data": groups}, default=str, ensure_ascii=False)
+            )
+        response.update({"streamed": True, "chunks": chunks, "total_items": total_items})
+        return response
+
+    groups, count, next_position = read_chunk(run_data, position, max_items, EXECUTION_CHUNK_MAX_BYTES, node_name)
+    done = done_before(next_position) if next_position is not None else total_items
+    if ctx is not None and progress_token(ctx) is not None:
+        await ctx.report_progress(done, total_items)
+    response.update({
+        "items": count,
+        "data": groups,
+        "progress": {"items_done": done, "total_items": total_items},
+        "next_cursor": encode_position(next_position) if next_position is not None else None
+    })
+    return response
+
 @app.tool()
 async def get_execution(
     execution_id: str, 
-    include_data: bool = False
+    include_data: bool = False,
+    chunked: bool = False,
+    node_name: Optional[str] = None,
+    cursor: Optional[str] = None,
+    max_items: Optional[int] = None,
+    stream: bool = False,
+    ctx: Context = None
 ) -> dict[str, Any]:
     """
     Retrieves detailed information about a specific workflow execution.
@@ -72,14 +423,35 @@ async def get_execution(
     This operation returns comprehensive execution details including workflow context,
     execution timestamps, state, and optionally the complete execution data containing
     node inputs/outputs and error information.
+
+    Large execution data can be read in bounded chunks instead of one piece: with
+    chunked=True (implied by node_name, cursor or stream) the response carries the
+    execution metadata, a per-node overview and up to `max_items` output items
+    (default EXECUTION_CHUNK_ITEMS, at most about EXECUTION_CHUNK_MAX_BYTES of JSON),
+    walking runData node by node, run by run and item range by item range. Pass
+    `next_cursor` back as `cursor` for the following chunk.
+
+    Finished executions are served from a cache (memory, then a compressed
+    on-disk store); running and waiting executions are always fetched.
+
+    Args:
+        execution_id: The execution to retrieve.
+        include_data: Include the full execution data (non-chunked mode).
+        chunked: Return execution data in chunks.
+        node_name: Only read the run data of this node.
+        cursor: Continuation cursor from a previous chunk.
+        max_items: Items per chunk.
+        stream: If the client supplied a progress token, send every chunk as a progress
+                notification (JSON in the message) in this one call and return only the
+                metadata and overview; otherwise behaves like chunked=True.
     """
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
-        execution: Execution = await n8n_client.get_execution(
-            execution_id=execution_id,
-            include_data=include_data
-        )
+        if chunked or node_name or cursor or stream:
+            return await _get_execution_chunk(execution_id, node_name, cursor, max_items, stream, ctx)
+
+        execution: Execution = await get_execution_cached(execution_id, include_data)
         
         return {
             "status": "success",
@@ -89,6 +461,57 @@ async def get_execution(
         logging.error(f"Error getting execution {execution_id}: {e}", exc_info=True)
         return {"status": "failure", "message": f"Failed to get execution: {str(e)}"}
 
+@app.tool()
+async def summarize_execution(execution_id: str, sample_items: int = 1, include_stack: bool = False) -> dict[str, Any]:
+    """
+    Summarizes one execution per node without returning its full data.
+
+    Computes on the server, for every node that ran: the number of runs, output
+    item counts per connection type and output, total execution time, run
+    statuses, error messages (and stacks with include_stack) and the first
+    `sample_items` output items. Also reports the last node executed, the
+    execution's top-level error and the nodes that failed. Finished executions
+    never change, so their summaries are cached per execution id.
+
+    Args:
+        execution_id: The execution to summarize.
+        sample_items: Output items sampled per node (0-50); binary data is omitted.
+        include_stack: Include error stacks (truncated).
+    """
+    if not n8n_client:
+        return {"status": "failure", "message": "n8n_client is not initialized."}
+    sample_items = max(0, min(sample_items, SUMMARY_MAX_SAMPLE_ITEMS))
+    cache_key = (execution_id, sample_items, include_stack)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        _summary_cache.move_to_end(cache_key)
+        return {**cached, "cached": True}
+    try:
+        execution: Execution = await get_execution_cached(execution_id, include_data=True)
+        data = execution.data.root if execution.data is not None else {}
+        response = {
+            "status": "success",
+            "execution": _execution_metadata(execution),
+            "summary": summarize_run_data(data, sample_items, include_stack),
+            "cached": False
+        }
+        if execution_finished(execution) and EXECUTION_SUMMARY_CACHE_SIZE > 0:
+            _summary_cache[cache_key] = response
+            while len(_summary_cache) > EXECUTION_SUMMARY_CACHE_SIZE:
+                _summary_cache.popitem(last=False)
+        return response
+    except Exception as e:
+        logging.error(f"Error summarizing execution {execution_id}: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to summarize execution: {str(e)}"}
+
+async def _forget_execution(execution_id: str) -> None:
+    """Drop every cached copy of a deleted execution."""
+    await execution_cache.invalidate(execution_id)
+    for cache_key in [key for key in _summary_cache if key[0] == execution_id]:
+        del _summary_cache[cache_key]
+    # Overviews count the execution among the recent runs of its workflow
+    _overview_cache.clear()
+
 @app.tool()
 async def delete_execution(execution_id: str) -> dict[str, Any]:
     """
@@ -102,6 +525,7 @@ async def delete_execution(execution_id: str) -> dict[str, Any]:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
         execution: Execution = await n8n_client.delete_execution(execution_id=execution_id)
+        await _forget_execution(execution_id)
         
         return {
             "status": "success",
@@ -109,4 +533,159 @@ async def delete_execution(execution_id: str) -> dict[str, Any]:
         }
     except Exception as e:
         logging.error(f"Error deleting execution {execution_id}: {e}", exc_info=True)
-        return {"status": "failure", "message": f"Failed to delete execution: {str(e)}"} 
\ No newline at end of file
+        return {"status": "failure", "message": f"Failed to delete execution: {str(e)}"} 
+
+# Failures listed individually in a prune_executions report
+_PRUNE_REPORTED_FAILURES = 50
+
+@app.tool()
+async def prune_executions(
+    workflow_id: Optional[str] = None,
+    status: Optional[str] = None,
+    older_than_days: Optional[float] = None,
+    started_before: Optional[str] = None,
+    max_executions: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    dry_run: bool = False,
+    ctx: Context = None
+) -> dict[str, Any]:
+    """
+    Deletes many executions in one call, selected by workflow, status and age.
+
+    Matching executions are collected by paging through the execution list first
+    (status and workflow are filtered by n8n, age locally), then deleted in parallel
+    with at most `concurrency` requests in flight and at most `requests_per_second`
+    deletions started per second; transient failures are retried. Running executions
+    are never deleted, and waiting ones only when status='waiting'. At least one
+    filter is required, so a call cannot prune everything by accident.
+
+    Args:
+        workflow_id: Only executions of this workflow.
+        status: 'success', 'error' or 'waiting'.
+        older_than_days: Only executions started more than this many days ago.
+        started_before: Only executions started before this ISO 8601 timestamp.
+        max_executions: Most executions deleted in this call (default and upper bound
+                        EXECUTION_PRUNE_MAX_ITEMS); call again to continue.
+        concurrency: Parallel delete requests (default BULK_ACTION_CONCURRENCY).
+        requests_per_second: Delete rate limit (default EXECUTION_PRUNE_REQUESTS_PER_SECOND; 0 for none).
+        max_retries: Retries per execution for transient failures (default BULK_ACTION_MAX_RETRIES).
+        dry_run: Only count and describe the matching executions.
+    """
+    if not n8n_client:
+        return {"status": "failure", "message": "n8n_client is not initialized."}
+    if not any((workflow_id, status, older_than_days is not None, started_before)):
+        return {"status": "failure", "message": "Provide at least one of workflow_id, status, older_than_days or started_before."}
+    status_filter: Optional[ExecutionStatus] = None
+    if status:
+        try:
+            status_filter = ExecutionStatus(status.lower())
+        except ValueError:
+            return {"status": "failure", "message": f"Invalid status '{status}'. Valid statuses: {[s.value for s in ExecutionStatus]}"}
+    try:
+        cutoff = parse_timestamp(started_before)
+    except ValueError as e:
+        return {"status": "failure", "message": f"Invalid timestamp: {e}"}
+    if older_than_days is not None:
+        age_cutoff = datetime.now(timezone.utc) - timedelta(days=max(0.0, older_than_days))
+        cutoff = min(cutoff, age_cutoff) if cutoff is not None else age_cutoff
+    max_items = min(max_executions, EXECUTION_PRUNE_MAX_ITEMS) if max_executions and max_executions > 0 else EXECUTION_PRUNE_MAX_ITEMS
+    concurrency = concurrency if concurrency and concurrency > 0 else BULK_ACTION_CONCURRENCY
+    rate = requests_per_second if requests_per_second is not None and requests_per_second >= 0 else EXECUTION_PRUNE_REQUESTS_PER_SECOND
+    max_retries = max_retries if max_retries is not None and max_retries >= 0 else BULK_ACTION_MAX_RETRIES
+    logging.info(
+        f"prune_executions called (workflow: {workflow_id}, status: {status}, cutoff: {cutoff}, "
+        f"max: {max_items}, dry_run: {dry_run})"
+    )
+
+    try:
+        started = time.monotonic()
+        selected: list[ExecutionShort] = []
+        scanned = 0
+        skipped_unfinished = 0
+        truncated = False
+        cursor: Optional[str] = None
+        while not truncated:
+            result: ExecutionList = await call_with_retries(
+                lambda: n8n_client.list_executions(
+                    workflow_id=workflow_id, status=status_filter, limit=EXECUTION_PAGE_SIZE, cursor=cursor
+                ),
+                BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS, "Execution listing for pruning"
+            )
+            page = result.data or []
+            for execution in page:
+                scanned += 1
+                if cutoff is not None and (execution.startedAt is None or execution.startedAt >= cutoff):
+                    continue
+                # Paused executions are resumable; checked on waitTill directly so a status
+                # misclassification can never turn them into deletable ones
+                if execution.waitTill is not None and status_filter != ExecutionStatus.WAITING:
+                    skipped_unfinished += 1
+                    continue
+                if execution.waitTill is None and execution.stoppedAt is None:
+                    skipped_unfinished += 1
+                    continue
+                if len(selected) >= max_items:
+                    truncated = True
+                    break
+                selected.append(execution)
+            cursor = result.nextCursor
+            if not cursor or not page:
+                break
+
+        by_workflow: dict[str, int] = {}
+        for execution in selected:
+            by_workflow[execution.workflowId] = by_workflow.get(execution.workflowId, 0) + 1
+        started_times = [execution.startedAt for execution in selected if execution.startedAt is not None]
+        report: dict[str, Any] = {
+            "matched": len(selected),
+            "scanned": scanned,
+            "skipped_unfinished": skipped_unfinished,
+            # More executions match than max_executions allowed in this call
+            "truncated": truncated,
+            "by_workflow": by_workflow,
+            "oldest_started_at": min(started_times).isoformat() if started_times else None,
+            "newest_started_at": max(started_times).isoformat() if started_times else None,
+            "cutoff": cutoff.isoformat() if cutoff else None
+        }
+        if dry_run:
+            return {"status": "success", "dry_run": True, **report}
+
+        report_progress = ctx is not None and progress_token(ctx) is not None
+        done = 0
+
+        async def delete(execution: ExecutionShort) -> Optional[str]:
+            nonlocal done
+            try:
+                await call_with_retries(
+                    lambda: n8n_client.delete_execution(execution_id=execution.id),
+                    max_retries, BULK_ACTION_RETRY_BACKOFF_SECONDS, f"Deletion of execution {execution.id}"
+                )
+                await _forget_execution(execution.id)
+                return None
+            except Exception as e:
+                logging.error(f"prune_executions failed to delete execution {execution.id}: {e}")
+                return str(e)
+            finally:
+                done += 1
+                if report_progress:
+                    await ctx.report_progress(done, len(selected))
+
+        errors = await map_bounded(selected, delete, concurrency, 1 / rate if rate > 0 else None)
+        failures = [
+            {"id": execution.id, "message": error}
+            for execution, error in zip(selected, errors) if error is not None
+        ]
+        deleted = len(selected) - len(failures)
+        return {
+            "status": "success" if not failures else ("partial" if deleted else "failure"),
+            **report,
+            "deleted": deleted,
+            "failed": len(failures),
+            "failures": failures[:_PRUNE_REPORTED_FAILURES],
+            "seconds": round(time.monotonic() - started, 2)
+        }
+    except Exception as e:
+        logging.error(f"Error in prune_executions: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to prune executions: {str(e)}"}
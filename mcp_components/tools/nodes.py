@@ -3,41 +3,138 @@ Defines MCP tools for interacting with n8n nodes.
 '''
 import logging
 import json
-import os
 from typing import Any, Optional
 
+from mcp.types import CallToolResult, TextContent
+
 from mcp_server import app
-from config import (
-    n8n_client, CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH, 
-    NODE_DATA_BASE_PATH, NODE_CATEGORIES_PATH_BASE, NODE_CLASSES_PATH_BASE
-)
-
-def _find_class_for_node_type(node_type_to_find: str, class_data_dict: dict[str, Any]) -> Optional[str]:
-    """Find the class name for a given node type."""
-    if not node_type_to_find or not class_data_dict or 'classes' not in class_data_dict:
-        return None
-    for class_key, nodes_in_class in class_data_dict.get('classes', {}).items():
-        for node in nodes_in_class:
-            if node.get('type', '').lower() == node_type_to_find.lower():
-                return class_key
-    return None
-
-def _find_category_for_node_type(node_type_to_find: str, category_data_dict: dict[str, Any]) -> Optional[str]:
-    """Find the category name for a given node type."""
-    if not node_type_to_find or not category_data_dict or 'categories' not in category_data_dict:
-        return None
-    for cat_key, nodes_in_cat in category_data_dict.get('categories', {}).items():
-        for node in nodes_in_cat:
-            if node.get('type', '').lower() == node_type_to_find.lower():
-                return cat_key
-    return None
+from mcp_components.node_catalog import NodeCatalog, node_catalog
+from mcp_components.node_files import NODE_FILE_KINDS, available_versions, node_manifests, read_node_folder
+from mcp_components.node_schema import node_schemas, property_shows
+from mcp_components.node_search import node_search
+
+# Memoized list_nodes results keyed by (category_key, class_key, return_types_only),
+# rebuilt by a node catalog reload hook whenever the classification files change.
+_list_nodes_responses: dict[tuple[Optional[str], Optional[str], bool], CallToolResult] = {}
+
+def _build_list_nodes_response(
+    catalog: NodeCatalog,
+    target_category_key: Optional[str],
+    target_class_key: Optional[str],
+    return_types_only: bool
+) -> dict[str, Any]:
+    """Build the list_nodes response for already-resolved category and class keys."""
+    result_nodes_details: list[dict[str, Any]] = []
+    
+    if target_category_key and target_class_key:
+        class_members = catalog.class_types[target_class_key]
+        for node_info_cat in catalog.categories[target_category_key]:
+            node_type_cat = node_info_cat.get('type')
+            if not node_type_cat: continue
+            if node_type_cat.lower() in class_members:
+                result_nodes_details.append({
+                    "node_name_folder": node_info_cat.get('path'), 
+                    "display_name": node_info_cat.get('name'),
+                    "type_identifier": node_type_cat, 
+                    "source_type": "combined",
+                    "group_name": f"{target_category_key} & {target_class_key}",
+                    "category": target_category_key, 
+                    "class": target_class_key
+                })
+    elif target_category_key:
+        for node_info in catalog.categories[target_category_key]:
+            node_type = node_info.get('type')
+            if not node_type: continue
+            result_nodes_details.append({
+                "node_name_folder": node_info.get('path'), 
+                "display_name": node_info.get('name'),
+                "type_identifier": node_type, 
+                "source_type": "category", 
+                "group_name": target_category_key,
+                "category": target_category_key, 
+                "class": catalog.find_class(node_type)
+            })
+    elif target_class_key:
+        for node_info in catalog.classes[target_class_key]:
+            node_type = node_info.get('type')
+            if not node_type: continue
+            result_nodes_details.append({
+                "node_name_folder": node_info.get('path'), 
+                "display_name": node_info.get('name'),
+                "type_identifier": node_type, 
+                "source_type": "class", 
+                "group_name": target_class_key,
+                "class": target_class_key, 
+                "category": catalog.find_category(node_type)
+            })
+    else: # No filters
+        all_nodes_map: dict[str, dict[str, Any]] = {}
+        for cat_key, nodes_in_cat_list in catalog.categories.items():
+            for node in nodes_in_cat_list:
+                node_type = node.get('type')
+                if node_type and node_type not in all_nodes_map:
+                    all_nodes_map[node_type] = {
+                        "node_name_folder": node.get('path'), 
+                        "display_name": node.get('name'),
+                        "type_identifier": node_type, 
+                        "source_type": "category", 
+                        "group_name": cat_key,
+                        "category": cat_key, 
+                        "class": catalog.find_class(node_type)
+                    }
+        for cls_key, nodes_in_cls_list in catalog.classes.items():
+            for node in nodes_in_cls_list:
+                node_type = node.get('type')
+                if node_type:
+                    if node_type not in all_nodes_map:
+                        all_nodes_map[node_type] = {
+                            "node_name_folder": node.get('path'), 
+                            "display_name": node.get('name'),
+                            "type_identifier": node_type, 
+                            "source_type": "class", 
+                            "group_name": cls_key,
+                            "category": catalog.find_category(node_type), 
+                            "class": cls_key
+                        }
+                    elif not all_nodes_map[node_type].get("class"):
+                        all_nodes_map[node_type]["class"] = cls_key
+        result_nodes_details = list(all_nodes_map.values())
+
+    if return_types_only:
+        node_list_content = [node.get("type_identifier") for node in result_nodes_details if node.get("type_identifier")]
+    else:
+        node_list_content = result_nodes_details
+    
+    return {"status": "success", "count": len(node_list_content), "nodes": node_list_content}
+
+def _serialize_response(response: dict[str, Any]) -> CallToolResult:
+    """Wrap a response so FastMCP sends the pre-encoded JSON text as-is."""
+    return CallToolResult(
+        content=[TextContent(type="text", text=json.dumps(response, ensure_ascii=False, indent=2))],
+        structuredContent=response
+    )
+
+def _precompute_list_nodes_responses(catalog: NodeCatalog) -> None:
+    """Build and serialize the list_nodes response for every filter combination."""
+    responses: dict[tuple[Optional[str], Optional[str], bool], CallToolResult] = {}
+    for category_key in [None, *catalog.categories]:
+        for class_key in [None, *catalog.classes]:
+            for return_types_only in (True, False):
+                responses[(category_key, class_key, return_types_only)] = _serialize_response(
+                    _build_list_nodes_response(catalog, category_key, class_key, return_types_only)
+                )
+    _list_nodes_responses.clear()
+    _list_nodes_responses.update(responses)
+    logging.debug(f"Precomputed {len(responses)} list_nodes responses (catalog generation {catalog.generation})")
+
+node_catalog.add_reload_hook(_precompute_list_nodes_responses)
 
 @app.tool()
 async def list_nodes(
     category: Optional[str] = None,
     node_class: Optional[str] = None, 
     return_types_only: bool = True
-) -> dict[str, Any]:
+) -> CallToolResult:
     """
     Retrieves available node types from the local classification system with optional filtering.
     
@@ -48,131 +145,92 @@ async def list_nodes(
     """
     logging.info(f"list_nodes called with category={category}, node_class={node_class}, return_types_only={return_types_only}")
     try:
-        category_data: dict[str, Any] = {}
-        class_data: dict[str, Any] = {}
+        catalog = node_catalog.refresh()
+        target_category_key = catalog.category_key(category)
+        target_class_key = catalog.class_key(node_class)
+        if (category and not target_category_key) or (node_class and not target_class_key):
+            return _serialize_response({"status": "success", "count": 0, "nodes": []})
 
-        if os.path.exists(CATEGORY_CLASSIFICATION_FILE_PATH):
-            with open(CATEGORY_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f:
-                category_data = json.load(f)
-        else:
-            logging.warning(f"Category classification file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}")
-            return {"status": "failure", "message": f"Category classification file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}", "count": 0, "nodes": []}
-
-        if os.path.exists(CLASS_CLASSIFICATION_FILE_PATH):
-            with open(CLASS_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f:
-                class_data = json.load(f)
-        else:
-            logging.warning(f"Class classification file not found: {CLASS_CLASSIFICATION_FILE_PATH}")
-            return {"status": "failure", "message": f"Class classification file not found: {CLASS_CLASSIFICATION_FILE_PATH}", "count": 0, "nodes": []}
-
-        normalized_category_filter: Optional[str] = category.lower() if category else None
-        normalized_class_filter: Optional[str] = node_class.lower() if node_class else None
-        
-        result_nodes_details: list[dict[str, Any]] = []
-        
-        if normalized_category_filter and normalized_class_filter:
-            target_category_key = next((ck for ck in category_data.get('categories', {}).keys() if ck.lower() == normalized_category_filter), None)
-            target_class_key = next((clk for clk in class_data.get('classes', {}).keys() if clk.lower() == normalized_class_filter), None)
-
-            if target_category_key and target_class_key:
-                nodes_in_category = category_data['categories'][target_category_key]
-                for node_info_cat in nodes_in_category:
-                    node_type_cat = node_info_cat.get('type')
-                    if not node_type_cat: continue
-                    if any(node_info_cls.get('type', '').lower() == node_type_cat.lower() for node_info_cls in class_data['classes'][target_class_key]):
-                        result_nodes_details.append({
-                            "node_name_folder": node_info_cat.get('path'), 
-                            "display_name": node_info_cat.get('name'),
-                            "type_identifier": node_type_cat, 
-                            "source_type": "combined",
-                            "group_name": f"{target_category_key} & {target_class_key}",
-                            "category": target_category_key, 
-                            "class": target_class_key
-                        })
-        elif normalized_category_filter:
-            target_category_key = next((ck for ck in category_data.get('categories', {}).keys() if ck.lower() == normalized_category_filter), None)
-            if target_category_key:
-                for node_info in category_data['categories'][target_category_key]:
-                    node_type = node_info.get('type')
-                    if not node_type: continue
-                    result_nodes_details.append({
-                        "node_name_folder": node_info.get('path'), 
-                        "display_name": node_info.get('name'),
-                        "type_identifier": node_type, 
-                        "source_type": "category", 
-                        "group_name": target_category_key,
-                        "category": target_category_key, 
-                        "class": _find_class_for_node_type(node_type, class_data)
-                    })
-        elif normalized_class_filter:
-            target_class_key = next((clk for clk in class_data.get('classes', {}).keys() if clk.lower() == normalized_class_filter), None)
-            if target_class_key:
-                for node_info in class_data['classes'][target_class_key]:
-                    node_type = node_info.get('type')
-                    if not node_type: continue
-                    result_nodes_details.append({
-                        "node_name_folder": node_info.get('path'), 
-                        "display_name": node_info.get('name'),
-                        "type_identifier": node_type, 
-                        "source_type": "class", 
-                        "group_name": target_class_key,
-                        "class": target_class_key, 
-                        "category": _find_category_for_node_type(node_type, category_data)
-                    })
-        else: # No filters
-            all_nodes_map: dict[str, dict[str, Any]] = {}
-            for cat_key, nodes_in_cat_list in category_data.get('categories', {}).items():
-                for node in nodes_in_cat_list:
-                    node_type = node.get('type')
-                    if node_type and node_type not in all_nodes_map:
-                        all_nodes_map[node_type] = {
-                            "node_name_folder": node.get('path'), 
-                            "display_name": node.get('name'),
-                            "type_identifier": node_type, 
-                            "source_type": "category", 
-                            "group_name": cat_key,
-                            "category": cat_key, 
-                            "class": _find_class_for_node_type(node_type, class_data)
-                        }
-            for cls_key, nodes_in_cls_list in class_data.get('classes', {}).items():
-                for node in nodes_in_cls_list:
-                    node_type = node.get('type')
-                    if node_type:
-                        if node_type not in all_nodes_map:
-                            all_nodes_map[node_type] = {
-                                "node_name_folder": node.get('path'), 
-                                "display_name": node.get('name'),
-                                "type_identifier": node_type, 
-                                "source_type": "class", 
-                                "group_name": cls_key,
-                                "category": _find_category_for_node_type(node_type, category_data), 
-                                "class": cls_key
-                            }
-                        elif not all_nodes_map[node_type].get("class"):
-                            all_nodes_map[node_type]["class"] = cls_key
-            result_nodes_details = list(all_nodes_map.values())
-
-        if return_types_only:
-            node_list_content = [node.get("type_identifier") for node in result_nodes_details if node.get("type_identifier")]
-        else:
-            node_list_content = result_nodes_details
-        
-        final_response = {"status": "success", "count": len(node_list_content), "nodes": node_list_content}
-        logging.debug(f"list_nodes response: {json.dumps(final_response, ensure_ascii=False, indent=2)[:500]}...")
-        return final_response
+        response = _list_nodes_responses.get((target_category_key, target_class_key, return_types_only))
+        if response is None:
+            response = _serialize_response(
+                _build_list_nodes_response(catalog, target_category_key, target_class_key, return_types_only)
+            )
+        return response
 
     except FileNotFoundError as e:
         logging.error(f"Node classification file not found during list_nodes: {e.filename}", exc_info=True)
-        return {"status": "failure", "message": f"Error: A required node classification file was not found ({e.filename}).", "count": 0, "nodes": []}
+        return _serialize_response({"status": "failure", "message": f"Error: A required node classification file was not found ({e.filename}).", "count": 0, "nodes": []})
     except json.JSONDecodeError as e:
         logging.error(f"Error decoding JSON from a node classification file during list_nodes: {e}", exc_info=True)
-        return {"status": "failure", "message": "Error: Failed to parse a node classification file. File might be corrupted.", "count": 0, "nodes": []}
+        return _serialize_response({"status": "failure", "message": "Error: Failed to parse a node classification file. File might be corrupted.", "count": 0, "nodes": []})
     except Exception as e:
         logging.error(f"Unexpected error in list_nodes: {e}", exc_info=True)
-        return {"status": "failure", "message": f"Failed to list nodes: {str(e)}", "count": 0, "nodes": []}
+        return _serialize_response({"status": "failure", "message": f"Failed to list nodes: {str(e)}", "count": 0, "nodes": []})
+
+@app.tool()
+async def search_nodes(
+    query: str,
+    limit: int = 10,
+    category: Optional[str] = None,
+    node_class: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Searches node types by what they do, ranked by relevance.
+
+    Use this to answer questions like "which node can send an SMS" without fetching node
+    definitions one by one. The query is matched against node display names, type identifiers,
+    categories, descriptions and resource/operation names using a BM25-ranked inverted index
+    built from the local node definitions. Follow up with get_node_schema or get_node_info on
+    the best match.
+
+    Args:
+        query: Free-text description of the desired capability (e.g., 'send sms', 'google sheets append row').
+        limit: Maximum number of results to return (default 10, max 50).
+        category: Only return nodes in this category (case-insensitive).
+        node_class: Only return nodes of this class (case-insensitive).
+    """
+    logging.info(f"search_nodes called with query: {query!r}, limit: {limit}, category: {category}, node_class: {node_class}")
+    try:
+        if not query or not query.strip():
+            return {"status": "failure", "message": "query must not be empty."}
+        limit = max(1, min(limit, 50))
+
+        catalog = node_catalog.refresh()
+        allowed_types: Optional[set[str]] = None
+        if category:
+            category_key = catalog.category_key(category)
+            if not category_key:
+                return {"status": "success", "query": query, "count": 0, "results": []}
+            allowed_types = set(catalog.category_types[category_key])
+        if node_class:
+            class_key = catalog.class_key(node_class)
+            if not class_key:
+                return {"status": "success", "query": query, "count": 0, "results": []}
+            class_types = catalog.class_types[class_key]
+            allowed_types = class_types if allowed_types is None else allowed_types & class_types
+
+        await node_search.ensure(catalog)
+        results = node_search.search(query, limit=limit, allowed_types=allowed_types)
+        return {"status": "success", "query": query, "count": len(results), "results": results}
+
+    except FileNotFoundError as e:
+        logging.error(f"A classification file was not found during search_nodes: {e.filename}", exc_info=True)
+        return {"status": "failure", "message": f"Error: Node classification file missing ({e.filename})."}
+    except Exception as e:
+        logging.error(f"Unexpected error in search_nodes: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to search nodes: {str(e)}"}
 
 @app.tool()
-async def get_node_info(node_type: str) -> dict[str, Any]:
+async def get_node_info(
+    node_type: str,
+    include: Optional[list[str]] = None,
+    kinds: Optional[list[str]] = None,
+    max_bytes: Optional[int] = None,
+    include_binary: bool = False,
+    version: Optional[str] = None,
+    manifest_only: bool = False
+) -> dict[str, Any]:
     """
     Retrieves comprehensive definition information for a specific node type.
     
@@ -182,7 +240,8 @@ async def get_node_info(node_type: str) -> dict[str, Any]:
     analysis of node capabilities and required configuration.
     
     The operation queries local node definition files rather than the n8n API directly,
-    accessing the complete set of files that define the node's behavior and interface.
+    accessing the complete set of files that define the node's behavior and interface,
+    including versioned subfolders (e.g. 'V1/', 'V2/') and 'descriptions/' directories.
     
     Note:
         The returned files typically include:
@@ -190,45 +249,40 @@ async def get_node_info(node_type: str) -> dict[str, Any]:
         - '*.description.ts' or '/descriptions/*.ts': Parameter definitions and UI schema
         - '*.node.ts' or '*.node.js': Implementation code
         - Test files and examples when available
+    
+    Args:
+        node_type: Type identifier of the node (e.g., 'n8n-nodes-base.httpRequest').
+        include: Glob patterns selecting which files to return (e.g., ['*.node.json', '*Description.ts']).
+                If omitted, all files are considered.
+        kinds: File kinds to return: 'node.json', 'description', 'implementation', 'other',
+               'tests' or 'binary'. If omitted, all kinds are considered.
+        max_bytes: Maximum total bytes of file content to return. Files are served in kind order
+                   (node.json, description, implementation, other, tests); a file that does not fit
+                   is truncated with a marker and later files are listed in skipped_files.
+        include_binary: If True, non-text files are returned base64-encoded instead of skipped; they count
+                        against max_bytes at their encoded size.
+        version: Restrict the files to one version subfolder (e.g. 'v2', case-insensitive). The available versions
+                 are listed in the 'versions' field of every response.
+        manifest_only: If True, return only the file manifest (path, size, kind, version of each
+                       file) without file contents. Useful to decide what to fetch.
     """
     logging.info(f"get_node_info called for node_type: {node_type}")
     try:
-        normalized_node_type: str = node_type.lower()
-        category_data: dict[str, Any] = {}
-        class_data: dict[str, Any] = {}
-
-        if os.path.exists(CATEGORY_CLASSIFICATION_FILE_PATH):
-            with open(CATEGORY_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f: 
-                category_data = json.load(f)
-        else: 
-            return {"status": "failure", "message": f"Category file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}"}
-        
-        if os.path.exists(CLASS_CLASSIFICATION_FILE_PATH):
-            with open(CLASS_CLASSIFICATION_FILE_PATH, 'r', encoding='utf-8') as f: 
-                class_data = json.load(f)
-        else: 
-            return {"status": "failure", "message": f"Class file not found: {CLASS_CLASSIFICATION_FILE_PATH}"}
+        if kinds:
+            invalid_kinds = [kind for kind in kinds if kind not in NODE_FILE_KINDS]
+            if invalid_kinds:
+                return {"status": "failure", "message": f"Invalid file kinds {invalid_kinds}. Valid kinds: {list(NODE_FILE_KINDS)}"}
+        if max_bytes is not None and max_bytes < 0:
+            return {"status": "failure", "message": "max_bytes must not be negative."}
 
         found_node_info: Optional[dict[str, Any]] = None
         source_type_origin: Optional[str] = None
         group_name_origin: Optional[str] = None
 
-        for cat_name, nodes in category_data.get('categories', {}).items():
-            for node_detail in nodes:
-                if node_detail.get('type', '').lower() == normalized_node_type:
-                    found_node_info, source_type_origin, group_name_origin = node_detail, 'category', cat_name
-                    break
-            if found_node_info: 
-                break
-        
-        if not found_node_info:
-            for class_name, nodes in class_data.get('classes', {}).items():
-                for node_detail in nodes:
-                    if node_detail.get('type', '').lower() == normalized_node_type:
-                        found_node_info, source_type_origin, group_name_origin = node_detail, 'class', class_name
-                        break
-                if found_node_info: 
-                    break
+        catalog = node_catalog.refresh()
+        origin = catalog.lookup(node_type)
+        if origin:
+            found_node_info, source_type_origin, group_name_origin = origin
 
         if not found_node_info:
             logging.warning(f"Node type '{node_type}' not found in classification files.")
@@ -239,28 +293,42 @@ async def get_node_info(node_type: str) -> dict[str, Any]:
             logging.error(f"Node '{node_type}' found but 'path' (node_name_folder) is missing.")
             return {"status": "failure", "message": f"Node path (node_name_folder) not found for {node_type}"}
 
-        base_path_for_node: str = NODE_CATEGORIES_PATH_BASE if source_type_origin == 'category' else NODE_CLASSES_PATH_BASE
         if not group_name_origin or not isinstance(group_name_origin, str):
             logging.error(f"Invalid group name '{group_name_origin}' for node {node_type}")
             return {"status": "failure", "message": f"Invalid group for node {node_type}"}
             
-        node_folder_full_path: str = os.path.join(base_path_for_node, group_name_origin, node_name_folder)
+        node_folder_full_path: Optional[str] = catalog.node_folder(node_type)
+        if not node_folder_full_path:
+            logging.error(f"No node data folder resolved for node {node_type} (path '{node_name_folder}')")
+            return {"status": "failure", "message": f"Node data folder not found for {node_type} (path '{node_name_folder}')"}
         
         logging.info(f"Attempting to read node files from: {node_folder_full_path}")
-        if not os.path.exists(node_folder_full_path) or not os.path.isdir(node_folder_full_path):
+        manifest: Optional[list[dict[str, Any]]] = await node_manifests.get(node_folder_full_path)
+        if manifest is None:
             logging.error(f"Node data folder does not exist or is not a directory: {node_folder_full_path}")
             return {"status": "failure", "message": f"Node data folder not found: {node_folder_full_path}"}
-            
-        file_contents_map: dict[str, str] = {}
-        for item_in_folder in os.listdir(node_folder_full_path):
-            item_path = os.path.join(node_folder_full_path, item_in_folder)
-            if os.path.isfile(item_path):
-                try:
-                    with open(item_path, 'r', encoding='utf-8') as f_content:
-                        file_contents_map[item_in_folder] = f_content.read()
-                except Exception as e_read:
-                    logging.warning(f"Error reading file {item_path}: {e_read}")
-                    file_contents_map[item_in_folder] = f"Error reading file: {str(e_read)}"
+
+        versions = available_versions(manifest)
+        if version and version.lower() not in versions:
+            return {"status": "failure", "message": f"Version '{version}' not found for {node_type}. Available versions: {versions}"}
+
+        if manifest_only:
+            folder_contents: dict[str, Any] = {
+                "manifest": [
+                    entry for entry in manifest
+                    if not version or entry["version"] == version.lower()
+                ],
+                "versions": versions
+            }
+        else:
+            folder_contents = await read_node_folder(
+                node_folder_full_path,
+                include=include,
+                kinds=kinds,
+                max_bytes=max_bytes,
+                include_binary=include_binary,
+                version=version
+            )
         
         return {
             "status": "success",
@@ -269,7 +337,7 @@ async def get_node_info(node_type: str) -> dict[str, Any]:
             "source_type": source_type_origin,
             "group_name": group_name_origin,
             "node_name_folder": node_name_folder,
-            "files": file_contents_map
+            **folder_contents
         }
 
     except FileNotFoundError as e:
@@ -280,4 +348,72 @@ async def get_node_info(node_type: str) -> dict[str, Any]:
         return {"status": "failure", "message": "Error: Failed to parse a node classification file. File might be corrupted."}
     except Exception as e:
         logging.error(f"Unexpected error in get_node_info for {node_type}: {e}", exc_info=True)
-        return {"status": "failure", "message": f"Failed to get node info: {str(e)}"} 
\ No newline at end of file
+        return {"status": "failure", "message": f"Failed to get node info: {str(e)}"}
+
+@app.tool()
+async def get_node_schema(
+    node_type: str,
+    version: Optional[str] = None,
+    resource: Optional[str] = None,
+    operation: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Retrieves the compact parameter schema of a specific node type.
+
+    Instead of returning the raw definition files like get_node_info, this operation
+    parses the node's description and returns only what is needed to configure it:
+    node metadata, credentials, resources, operations per resource and the parameter
+    list (name, type, default, required, options and display conditions). Schemas are
+    extracted once and cached in memory and on disk until the node's files change.
+
+    Args:
+        node_type: Type identifier of the node (e.g., 'n8n-nodes-base.slack').
+        version: Version subfolder to describe (e.g. 'v2', case-insensitive). Defaults to the
+                 latest version; the available versions are listed in the 'versions' field.
+        resource: Only return the operations and parameters shown for this resource value.
+        operation: Only return the parameters shown for this operation value.
+    """
+    logging.info(f"get_node_schema called for node_type: {node_type}")
+    try:
+        catalog = node_catalog.refresh()
+        origin = catalog.lookup(node_type)
+        if not origin:
+            logging.warning(f"Node type '{node_type}' not found in classification files.")
+            return {"status": "failure", "message": f"Node type not found: {node_type}"}
+        found_node_info, _, _ = origin
+
+        node_folder_full_path: Optional[str] = catalog.node_folder(node_type)
+        if not node_folder_full_path:
+            logging.error(f"No node data folder resolved for node {node_type}")
+            return {"status": "failure", "message": f"Node data folder not found for {node_type}"}
+
+        try:
+            schema = await node_schemas.get(node_type, node_folder_full_path, version)
+        except ValueError as e:
+            return {"status": "failure", "message": f"{e} (node {node_type})"}
+        if schema is None:
+            logging.error(f"Node data folder does not exist or is not a directory: {node_folder_full_path}")
+            return {"status": "failure", "message": f"Node data folder not found: {node_folder_full_path}"}
+
+        operations = schema["operations"]
+        if resource:
+            operations = {key: value for key, value in operations.items() if key in (resource, "*")}
+        properties = [
+            prop for prop in schema["properties"]
+            if property_shows(prop, "resource", resource) and property_shows(prop, "operation", operation)
+        ]
+
+        return {
+            "status": "success",
+            "type_identifier": found_node_info.get('type'),
+            **schema,
+            "operations": operations,
+            "properties": properties
+        }
+
+    except FileNotFoundError as e:
+        logging.error(f"A classification file was not found during get_node_schema for {node_type}: {e.filename}", exc_info=True)
+        return {"status": "failure", "message": f"Error: Node classification file missing ({e.filename})."}
+    except Exception as e:
+        logging.error(f"Unexpected error in get_node_schema for {node_type}: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to get node schema: {str(e)}"}
@@ -1,15 +1,137 @@
 '''
 Defines MCP tools for interacting with n8n workflows.
 '''
+import json
 import logging
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Optional
 
-from mcp_server import app
-from config import n8n_client
+from mcp.server.fastmcp import Context
+
+from mcp_server import app, progress_token
+from config import (
+    n8n_client, LIST_WORKFLOWS_MAX_ITEMS,
+    BULK_ACTION_CONCURRENCY, BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS
+)
 from n8n_sdk_python.models.workflows import (
-    Workflow, WorkflowList, Node, Connection, 
+    Workflow, WorkflowList, WorkflowShort, Node, Connection, 
     WorkflowSettings, WorkflowStaticData
 )
+from mcp_components.workflow_cache import workflow_cache, get_workflow_cached
+from mcp_components.workflow_index import DIMENSIONS as WORKFLOW_INDEX_DIMENSIONS, workflow_index
+from mcp_components.workflow_mirror import workflow_mirror
+from mcp_components.projection import FieldTree, dump_projected, parse_fields, project
+from mcp_components.workflow_patch import WorkflowPatchError, apply_json_patch, apply_node_operations
+from mcp_components.concurrency import call_with_retries, map_bounded
+from mcp_components.execution_stats import parse_timestamp
+
+# Largest page size accepted by the n8n workflows endpoint
+WORKFLOW_PAGE_SIZE = 250
+
+BULK_WORKFLOW_ACTIONS: tuple[str, ...] = ("activate", "deactivate", "delete", "set_tags", "add_tags", "remove_tags")
+_WORKFLOW_FILTER_KEYS: tuple[str, ...] = ("active", "tags", "name", "project_id")
+
+def _version_summary(workflow: Workflow) -> dict[str, Any]:
+    """Identify a workflow and the version it is at, for optimistic concurrency checks."""
+    return {
+        "id": workflow.id,
+        "name": workflow.name,
+        "active": workflow.active,
+        "version_id": workflow.versionId,
+        "updated_at": workflow.updatedAt.isoformat() if workflow.updatedAt else None
+    }
+
+def _parse_expected_updated_at(expected_updated_at: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp ('Z' accepted, naive values are UTC, like n8n's updatedAt); raises ValueError."""
+    return parse_timestamp(expected_updated_at)
+
+def _version_conflict(
+    workflow: Workflow,
+    expected_version_id: Optional[str],
+    expected_updated_at: Optional[datetime]
+) -> Optional[dict[str, Any]]:
+    """Return a conflict response if the workflow is not at the expected version, else None."""
+    if (
+        (expected_version_id is not None and workflow.versionId != expected_version_id)
+        or (expected_updated_at is not None and workflow.updatedAt != expected_updated_at)
+    ):
+        logging.warning(f"Write to workflow {workflow.id} rejected: version conflict")
+        return {
+            "status": "failure",
+            "conflict": True,
+            "message": "Workflow was modified since the expected version; re-read it and retry.",
+            "workflow": _version_summary(workflow)
+        }
+    return None
+
+async def _iter_workflow_pages(params: dict[str, Any], cursor: Optional[str] = None) -> AsyncIterator[WorkflowList]:
+    """Yield pages of list_workflows results, following nextCursor until the last page."""
+    while True:
+        page: WorkflowList = await n8n_client.list_workflows(**params, cursor=cursor)
+        yield page
+        cursor = page.nextCursor
+        if not cursor:
+            return
+
+def _invalidate_workflow(workflow_id: str) -> None:
+    """Forget cached and mirrored copies of a workflow after a write."""
+    workflow_cache.invalidate(workflow_id)
+    workflow_mirror.mark_stale(workflow_id)
+
+_MIRROR_CURSOR_PREFIX = "mirror:"
+
+def _list_from_mirror(
+    active_only: bool,
+    tags: Optional[str],
+    name: Optional[str],
+    offset: int,
+    max_items: int
+) -> tuple[list[WorkflowShort], Optional[str]]:
+    """Filter the mirrored workflow summaries like the n8n API does; returns a page and its next cursor."""
+    tag_names = {tag.strip() for tag in tags.split(",") if tag.strip()} if tags else set()
+    name_filter = name.lower() if name else None
+    matches = [
+        wf for wf in sorted(workflow_mirror.summaries(), key=lambda wf: wf.id)
+        if (not active_only or wf.active)
+        and (not name_filter or name_filter in (wf.name or "").lower())
+        and tag_names <= {tag.name for tag in wf.tags or []}
+    ]
+    page = matches[offset:offset + max_items]
+    next_offset = offset + len(page)
+    return page, (f"{_MIRROR_CURSOR_PREFIX}{next_offset}" if next_offset < len(matches) else None)
+
+async def _current_workflow(workflow_id: str) -> Workflow:
+    """
+    Read the current workflow from n8n for a read-modify-write.
+
+    The whole document is written back, so it must not be based on a cached
+    copy that misses edits made outside this server; the result refreshes the cache.
+    """
+    workflow = await n8n_client.get_workflow(workflow_id=workflow_id, exclude_pinned_data=True)
+    workflow_cache.put((workflow_id, True), workflow)
+    return workflow
+
+def _workflow_summary(wf: Any) -> dict[str, Any]:
+    """Summarize a Workflow or WorkflowShort for listings."""
+    return {
+        "id": wf.id,
+        "name": wf.name,
+        "active": wf.active,
+        "created_at": wf.createdAt.isoformat() if wf.createdAt else None,
+        "updated_at": wf.updatedAt.isoformat() if wf.updatedAt else None,
+        "tags": [{"id": tag.id, "name": tag.name} for tag in wf.tags] if wf.tags else []
+    }
+
+_WORKFLOW_SUMMARY_FIELDS: tuple[str, ...] = ("id", "name", "active", "created_at", "updated_at", "tags")
+
+def _parse_projection(fields: Optional[str], valid: Iterable[str]) -> Optional[FieldTree]:
+    """Parse a fields argument, rejecting unknown top-level fields."""
+    tree = parse_fields(fields)
+    if tree:
+        unknown = sorted(set(tree) - set(valid))
+        if unknown:
+            raise ValueError(f"Unknown fields {unknown}. Valid top-level fields: {sorted(valid)}")
+    return tree
 
 @app.tool()
 async def list_workflows(
@@ -17,7 +139,12 @@ async def list_workflows(
     tags: Optional[str] = None,
     name: Optional[str] = None,
     project_id: Optional[str] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    fields: Optional[str] = None,
+    source: str = "api",
+    ctx: Context = None
 ) -> dict[str, Any]:
     """
     Retrieves a filtered list of workflows from the n8n instance.
@@ -25,10 +152,32 @@ async def list_workflows(
     This operation returns a collection of workflow summaries matching the specified filter criteria.
     Each workflow summary includes basic metadata such as ID, name, active status, and associated tags,
     but not the complete workflow definition (use get_workflow for full details).
+
+    Pages are fetched and followed automatically until `limit` workflows have been collected
+    (default and upper bound: LIST_WORKFLOWS_MAX_ITEMS). When more workflows remain, the
+    response includes `next_cursor`; pass it back as `cursor` to continue where it stopped.
+
+    Args:
+        active_only: Only return active workflows.
+        tags: Comma-separated tag names to filter by.
+        name: Filter workflows by name.
+        project_id: Filter workflows by project.
+        limit: Maximum number of workflows to return across all pages.
+        cursor: Continue a previous listing from its next_cursor.
+        stream: If True and the client supplied a progress token, each page is sent as a
+                progress notification (JSON in the message) as soon as it arrives instead of
+                being collected, so the first results arrive quickly and memory stays bounded;
+                the final response then carries only counts and next_cursor.
+        fields: Comma-separated summary fields to return, e.g. "id,name" or "id,tags.name".
+                Available: id, name, active, created_at, updated_at, tags. Default: all.
+        source: "api" (default) lists from n8n; "mirror" lists from the local workflow mirror
+                without calling the API (falls back to the API if the mirror is not synced or
+                project_id is given).
     """
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
+        projection = _parse_projection(fields, _WORKFLOW_SUMMARY_FIELDS)
         params: dict[str, Any] = {}
         if active_only:
             params["active"] = True
@@ -38,28 +187,62 @@ async def list_workflows(
             params["name"] = name
         if project_id:
             params["project_id"] = project_id
-        if limit:
-            params["limit"] = limit
-        
-        result: WorkflowList = await n8n_client.list_workflows(**params)
-        
+        max_items = min(limit, LIST_WORKFLOWS_MAX_ITEMS) if limit and limit > 0 else LIST_WORKFLOWS_MAX_ITEMS
+        if source not in ("api", "mirror"):
+            return {"status": "failure", "message": f"Invalid source '{source}'. Use 'api' or 'mirror'."}
+
+        mirror_cursor = cursor is not None and cursor.startswith(_MIRROR_CURSOR_PREFIX)
+        if (source == "mirror" or mirror_cursor) and workflow_mirror.ready and not project_id:
+            offset = int(cursor[len(_MIRROR_CURSOR_PREFIX):]) if mirror_cursor else 0
+            mirrored, next_cursor = _list_from_mirror(active_only, tags, name, offset, max_items)
+            workflows = [project(_workflow_summary(wf), projection) for wf in mirrored]
+            return {
+                "status": "success",
+                "source": "mirror",
+                "synced_at": workflow_mirror.last_synced_at.isoformat(),
+                "count": len(workflows),
+                "next_cursor": next_cursor,
+                "workflows": workflows
+            }
+        if mirror_cursor:
+            return {"status": "failure", "message": "The workflow mirror is not available; list again without the cursor."}
+
+        streaming = stream and progress_token(ctx) is not None
         workflows: list[dict[str, Any]] = []
-        if result.data:
-            for wf in result.data:
-                workflows.append({
-                    "id": wf.id,
-                    "name": wf.name,
-                    "active": wf.active,
-                    "created_at": wf.createdAt.isoformat() if wf.createdAt else None,
-                    "updated_at": wf.updatedAt.isoformat() if wf.updatedAt else None,
-                    "tags": [{"id": tag.id, "name": tag.name} for tag in wf.tags] if wf.tags else []
-                })
+        count = 0
+        pages = 0
+        next_cursor: Optional[str] = cursor
+        while count < max_items:
+            # Never request more than still fits, so next_cursor cannot skip items of a partial page
+            page: WorkflowList = await n8n_client.list_workflows(
+                **params, limit=min(WORKFLOW_PAGE_SIZE, max_items - count), cursor=next_cursor
+            )
+            pages += 1
+            page_workflows = [project(_workflow_summary(wf), projection) for wf in page.data or []]
+            count += len(page_workflows)
+            next_cursor = page.nextCursor
+            if streaming:
+                await ctx.report_progress(
+                    count,
+                    message=json.dumps({"page": pages, "workflows": page_workflows, "next_cursor": next_cursor}, ensure_ascii=False)
+                )
+            else:
+                workflows.extend(page_workflows)
+            if not next_cursor or not page_workflows:
+                next_cursor = None
+                break
                 
-        return {
+        response: dict[str, Any] = {
             "status": "success",
-            "count": len(workflows),
-            "workflows": workflows
+            "count": count,
+            "pages": pages,
+            "next_cursor": next_cursor
         }
+        if streaming:
+            response["streamed"] = True
+        else:
+            response["workflows"] = workflows
+        return response
     except Exception as e:
         logging.error(f"Error in list_workflows: {e}", exc_info=True)
         return {"status": "failure", "message": str(e)}
@@ -67,7 +250,9 @@ async def list_workflows(
 @app.tool()
 async def get_workflow(
     workflow_id: str,
-    exclude_pinned_data: bool = True
+    exclude_pinned_data: bool = True,
+    fields: Optional[str] = None,
+    source: str = "api"
 ) -> dict[str, Any]:
     """
     Retrieves the complete definition of a specific workflow.
@@ -82,20 +267,86 @@ async def get_workflow(
         - Analysis of workflow structure and functionality
         - Extraction of configuration patterns
         - Cloning or modification via the update_workflow operation
+
+    Large workflows can be trimmed with `fields`, a comma-separated list of dotted paths
+    (e.g. "id,name,nodes.name,nodes.type"); only the selected parts are serialized.
+    Lists are projected per element and "*" matches any key (e.g. "connections.*.main").
+
+    With source="mirror" the workflow is read from the local workflow mirror when it holds a
+    current copy (pinned data is not mirrored); otherwise it is fetched from the API.
     """
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
-        workflow: Workflow = await n8n_client.get_workflow(
-            workflow_id=workflow_id,
-            exclude_pinned_data=exclude_pinned_data
-        )
+        projection = _parse_projection(fields, Workflow.model_fields)
+        if source not in ("api", "mirror"):
+            return {"status": "failure", "message": f"Invalid source '{source}'. Use 'api' or 'mirror'."}
+        workflow: Optional[Workflow] = None
+        if source == "mirror" and exclude_pinned_data:
+            workflow = await workflow_mirror.get(workflow_id)
+        response: dict[str, Any] = {"status": "success"}
+        if workflow is not None:
+            response["source"] = "mirror"
+            response["synced_at"] = workflow_mirror.last_synced_at.isoformat()
+        else:
+            workflow = await get_workflow_cached(workflow_id, exclude_pinned_data)
+        response["workflow"] = dump_projected(workflow, projection, exclude_none=True)
+        return response
+    except Exception as e:
+        logging.error(f"Error in get_workflow for ID {workflow_id}: {e}", exc_info=True)
+        return {"status": "failure", "message": str(e)}
+
+@app.tool()
+async def query_workflows(
+    node_type: Optional[str] = None,
+    credential_id: Optional[str] = None,
+    webhook_path: Optional[str] = None,
+    sub_workflow_id: Optional[str] = None,
+    active_only: bool = False
+) -> dict[str, Any]:
+    """
+    Finds workflows by what they contain, without fetching every workflow.
+
+    Answers questions such as "which workflows use the Slack node", "which use credential 12",
+    "which listen on webhook path orders/new" or "which call workflow abc" from an index over
+    the local workflow mirror. Criteria are combined with AND; at least one is required.
+
+    Args:
+        node_type: Full node type ('n8n-nodes-base.slack') or its short name ('slack'), case-insensitive.
+        credential_id: Credential identifier used by a node.
+        webhook_path: Path of a Webhook, Form Trigger or MCP Trigger node (leading/trailing '/' ignored).
+        sub_workflow_id: Workflow called by an Execute Workflow or Call Workflow Tool node.
+        active_only: Only return active workflows.
+
+    Returns:
+        Matching workflows with id, name, active and the names of the nodes that matched.
+        Results reflect the mirror's last sync plus writes made through this server.
+    """
+    criteria = {
+        dimension: value for dimension, value in zip(
+            WORKFLOW_INDEX_DIMENSIONS, (node_type, credential_id, webhook_path, sub_workflow_id)
+        ) if value and value.strip()
+    }
+    if not criteria:
+        return {"status": "failure", "message": f"Provide at least one of: {', '.join(WORKFLOW_INDEX_DIMENSIONS)}."}
+    try:
+        if not await workflow_index.ensure():
+            return {
+                "status": "failure",
+                "message": "The workflow mirror has not completed a sync yet (or is disabled with "
+                           "WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS=0); retry shortly."
+            }
+        workflows = workflow_index.query(criteria)
+        if active_only:
+            workflows = [wf for wf in workflows if wf["active"]]
         return {
             "status": "success",
-            "workflow": workflow.model_dump(exclude_none=True)
+            "synced_at": workflow_mirror.last_synced_at.isoformat() if workflow_mirror.last_synced_at else None,
+            "count": len(workflows),
+            "workflows": workflows
         }
     except Exception as e:
-        logging.error(f"Error in get_workflow for ID {workflow_id}: {e}", exc_info=True)
+        logging.error(f"Error in query_workflows: {e}", exc_info=True)
         return {"status": "failure", "message": str(e)}
 
 @app.tool()
@@ -162,12 +413,14 @@ async def create_workflow(
             settings=settings,
             static_data=static_data
         )
+        workflow_index.update(workflow)
         # NOTE: N8n API is not allow to activate workflow immediately after creation.
         #       We need to activate it manually.
         
         if active and workflow and hasattr(workflow, 'id'):
             activated_workflow: Workflow = await n8n_client.activate_workflow(workflow_id=workflow.id)
             workflow.active = activated_workflow.active
+            workflow_index.set_status(workflow.id, workflow.name, workflow.active)
         
         return {
             "status": "success",
@@ -190,16 +443,19 @@ async def update_workflow(
     connections: Optional[dict[str, Any]] = None,
     active: Optional[bool] = None,
     settings: Optional[dict[str, Any]] = None,
-    static_data: Optional[dict[str, Any]] = None
+    static_data: Optional[dict[str, Any]] = None,
+    expected_version_id: Optional[str] = None,
+    expected_updated_at: Optional[str] = None
 ) -> dict[str, Any]:
     """
     Modifies an existing workflow with the specified configuration changes.
     
     This operation updates a workflow's structure, settings, or activation state.
     Only the parameters provided will be modified; omitted parameters retain their
-    current values. The operation follows an atomic update pattern - retrieving
-    the current workflow, applying changes, and submitting the complete updated
-    workflow.
+    current values. When some of name, nodes, connections, settings or static_data
+    are omitted, the current workflow is read from n8n first to fill them in; when
+    all of them are provided (and no version check is requested) the workflow is
+    written directly without reading it.
     
     Args:
         workflow_id: The unique identifier of the workflow to modify.
@@ -213,23 +469,48 @@ async def update_workflow(
                  Partial updates are applied to the existing settings object.
         static_data: New persistent state storage. If provided, replaces the entire static data object.
                     To update specific fields, retrieve current static data first, then modify.
+        expected_version_id: Optimistic concurrency check. If provided, the update is rejected
+                             with a conflict when the workflow's current versionId differs
+                             (i.e. someone else changed it since you read it).
+        expected_updated_at: Same as expected_version_id, compared against the workflow's
+                             updatedAt timestamp (ISO 8601).
     
     Returns:
         A structured response containing:
         - status: Operation result ('success' or 'failure')
         - message: Success confirmation or error description
-        - workflow: Basic information about the updated workflow (only present on success)
+        - conflict: True when an expected_version_id/expected_updated_at check failed
+        - workflow: Basic information about the updated workflow (on success, or the current
+          version on conflict)
           - id: Workflow identifier
           - name: Current display name (updated if changed)
           - active: Current activation status (updated if changed)
+          - version_id: Version identifier after the update, for the next expected_version_id
+          - updated_at: Last update time after the update
     """
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     logging.info(f"Attempting to update workflow ID: {workflow_id}")
     
     try:
-        original_workflow: Workflow = await n8n_client.get_workflow(workflow_id=workflow_id)
-        logging.info(f"Fetched original workflow: {original_workflow.name}, Active: {original_workflow.active}")
+        try:
+            expected_updated_at_value = _parse_expected_updated_at(expected_updated_at)
+        except ValueError:
+            return {"status": "failure", "message": f"Invalid expected_updated_at: {expected_updated_at}"}
+
+        fields_missing = any(value is None for value in (name, nodes, connections, settings, static_data))
+        concurrency_check = expected_version_id is not None or expected_updated_at_value is not None
+
+        # Only read the current workflow when it is needed to fill omitted fields or check versions.
+        # The whole document is written back and a version check must see concurrent writers,
+        # so it is never based on a cached copy
+        original_workflow: Optional[Workflow] = None
+        if fields_missing or concurrency_check:
+            original_workflow = await _current_workflow(workflow_id)
+            logging.info(f"Using current workflow: {original_workflow.name}, Active: {original_workflow.active}")
+            conflict = _version_conflict(original_workflow, expected_version_id, expected_updated_at_value)
+            if conflict:
+                return conflict
         
         update_name = name if name is not None else original_workflow.name
         update_nodes = nodes if nodes is not None else original_workflow.nodes
@@ -246,35 +527,256 @@ async def update_workflow(
             static_data=update_static_data
         )
         logging.info(f"Workflow '{updated_workflow.name}' data updated via API.")
+        workflow_index.update(updated_workflow)
 
-        final_active_status = original_workflow.active
-        if hasattr(updated_workflow, 'active'):
-             final_active_status = updated_workflow.active
-
+        final_active_status = updated_workflow.active
         if active is not None and active != final_active_status:
             if active:
                 logging.info(f"Activating workflow {workflow_id}...")
-                activated_workflow: Workflow = await n8n_client.activate_workflow(workflow_id=workflow_id)
-                final_active_status = activated_workflow.active
+                updated_workflow = await n8n_client.activate_workflow(workflow_id=workflow_id)
                 logging.info(f"Workflow {workflow_id} activated.")
             else:
                 logging.info(f"Deactivating workflow {workflow_id}...")
-                deactivated_workflow: Workflow = await n8n_client.deactivate_workflow(workflow_id=workflow_id)
-                final_active_status = deactivated_workflow.active
+                updated_workflow = await n8n_client.deactivate_workflow(workflow_id=workflow_id)
                 logging.info(f"Workflow {workflow_id} deactivated.")
+            final_active_status = updated_workflow.active
+            workflow_index.set_status(workflow_id, updated_workflow.name, final_active_status)
         
         return {
             "status": "success",
             "message": f"Workflow '{update_name}' updated successfully.",
-            "workflow": {
-                "id": updated_workflow.id,
-                "name": updated_workflow.name,
-                "active": final_active_status
-            }
+            "workflow": {**_version_summary(updated_workflow), "active": final_active_status}
         }
     except Exception as e:
         logging.error(f"Error updating workflow {workflow_id}: {e}", exc_info=True)
         return {"status": "failure", "message": f"Failed to update workflow: {str(e)}"}
+    finally:
+        _invalidate_workflow(workflow_id)
+
+@app.tool()
+async def patch_workflow(
+    workflow_id: str,
+    operations: Optional[list[dict[str, Any]]] = None,
+    json_patch: Optional[list[dict[str, Any]]] = None,
+    expected_version_id: Optional[str] = None,
+    expected_updated_at: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Applies small, targeted edits to a workflow without resending its full definition.
+    
+    The edits are applied server-side to the current version of the workflow, always read
+    from n8n, and the result is saved. Either format can be used; if both are
+    given, operations are applied first. The whole patch is rejected if any step fails.
+    
+    Args:
+        workflow_id: The unique identifier of the workflow to modify.
+        operations: Node-level operations, each an object with an 'op' field:
+            - {"op": "add_node", "node": {"name", "type", "typeVersion", "position", "parameters", ...}}
+            - {"op": "remove_node", "name": str} (also removes its connections)
+            - {"op": "update_node", "name": str, "set": {"parameters.url": "...", "disabled": true},
+               "unset": ["parameters.options.timeout"]} (dotted paths inside the node)
+            - {"op": "rename_node", "name": str, "new_name": str} (connections are updated)
+            - {"op": "add_connection" | "remove_connection", "from": str, "to": str,
+               "output": 0, "input": 0, "type": "main"}
+            - {"op": "set_setting", "key": str, "value": any}
+            - {"op": "set_name", "value": str}
+        json_patch: RFC 6902 JSON Patch operations (add, remove, replace, move, copy, test) applied
+                    to the document {"name", "nodes", "connections", "settings", "staticData"},
+                    e.g. [{"op": "replace", "path": "/nodes/2/parameters/url", "value": "https://..."}].
+        expected_version_id: Reject the patch with a conflict if the workflow's current versionId differs.
+        expected_updated_at: Reject the patch with a conflict if the workflow's current updatedAt differs.
+    
+    Returns:
+        A structured response containing:
+        - status: Operation result ('success' or 'failure')
+        - message: Success confirmation or error description
+        - conflict: True when a version check failed
+        - workflow: id, name, active, version_id and updated_at after the patch
+        - node_count: Number of nodes after the patch
+    """
+    if not n8n_client:
+        return {"status": "failure", "message": "n8n_client is not initialized."}
+    if not operations and not json_patch:
+        return {"status": "failure", "message": "Provide operations and/or json_patch."}
+    logging.info(f"Attempting to patch workflow ID: {workflow_id} ({len(operations or [])} operations, {len(json_patch or [])} JSON Patch operations)")
+    
+    try:
+        try:
+            expected_updated_at_value = _parse_expected_updated_at(expected_updated_at)
+        except ValueError:
+            return {"status": "failure", "message": f"Invalid expected_updated_at: {expected_updated_at}"}
+
+        # The whole document is written back, so it must not be based on a cached copy
+        current_workflow = await _current_workflow(workflow_id)
+        conflict = _version_conflict(current_workflow, expected_version_id, expected_updated_at_value)
+        if conflict:
+            return conflict
+
+        document: dict[str, Any] = current_workflow.model_dump(
+            mode="json", include={"name", "nodes", "connections", "settings", "staticData"}, exclude_none=True
+        )
+        try:
+            if operations:
+                document = apply_node_operations(document, operations)
+            if json_patch:
+                document = apply_json_patch(document, json_patch)
+        except WorkflowPatchError as e:
+            return {"status": "failure", "message": f"Patch not applied: {e}"}
+
+        if not isinstance(document.get("name"), str) or not isinstance(document.get("nodes"), list):
+            return {"status": "failure", "message": "Patch not applied: the workflow must keep a 'name' and a 'nodes' list."}
+
+        updated_workflow: Workflow = await n8n_client.update_workflow(
+            workflow_id=workflow_id,
+            name=document["name"],
+            nodes=document["nodes"],
+            connections=document.get("connections") or {},
+            settings=document.get("settings") or {},
+            static_data=document.get("staticData")
+        )
+        logging.info(f"Workflow '{updated_workflow.name}' patched via API.")
+        workflow_index.update(updated_workflow)
+        return {
+            "status": "success",
+            "message": f"Workflow '{updated_workflow.name}' patched successfully.",
+            "workflow": _version_summary(updated_workflow),
+            "node_count": len(updated_workflow.nodes)
+        }
+    except Exception as e:
+        logging.error(f"Error patching workflow {workflow_id}: {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to patch workflow: {str(e)}"}
+    finally:
+        _invalidate_workflow(workflow_id)
+
+@app.tool()
+async def bulk_workflow_action(
+    action: str,
+    workflow_ids: Optional[list[str]] = None,
+    workflow_filter: Optional[dict[str, Any]] = None,
+    tag_ids: Optional[list[str]] = None,
+    concurrency: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    dry_run: bool = False
+) -> dict[str, Any]:
+    """
+    Applies one action to many workflows at once, with bounded concurrency and retries.
+    
+    Workflows are selected by explicit ids and/or by a list_workflows filter. The action
+    runs against each selected workflow in parallel (at most `concurrency` requests in
+    flight); transient failures (network errors, 429, 5xx) are retried with exponential
+    backoff. One failing workflow does not stop the others.
+    
+    Args:
+        action: One of 'activate', 'deactivate', 'delete', 'set_tags' (replace all tags),
+                'add_tags' or 'remove_tags'.
+        workflow_ids: Identifiers of the workflows to act on.
+        workflow_filter: Select workflows like list_workflows does. Supported keys:
+                         'active' (bool), 'tags' (comma-separated tag names), 'name', 'project_id'.
+                         At least one key is required, so an empty filter cannot select everything.
+        tag_ids: Tag identifiers for the tag actions.
+        concurrency: Maximum number of workflows processed at once (default from BULK_ACTION_CONCURRENCY).
+        max_retries: Retries per workflow for transient failures (default from BULK_ACTION_MAX_RETRIES).
+        dry_run: If True, only resolve and return the selected workflows without changing them.
+    
+    Returns:
+        A structured response containing:
+        - status: 'success' if every workflow succeeded, 'partial' if some failed, 'failure' otherwise
+        - action: The action performed
+        - total / succeeded / failed: Item counts
+        - results: Per-workflow results with id, status, and name/active/tags or message
+    """
+    if not n8n_client:
+        return {"status": "failure", "message": "n8n_client is not initialized."}
+    if action not in BULK_WORKFLOW_ACTIONS:
+        return {"status": "failure", "message": f"Invalid action '{action}'. Valid actions: {list(BULK_WORKFLOW_ACTIONS)}"}
+    if action in ("set_tags", "add_tags", "remove_tags") and tag_ids is None:
+        return {"status": "failure", "message": f"Action '{action}' requires tag_ids."}
+    if not workflow_ids and not workflow_filter:
+        return {"status": "failure", "message": "Provide workflow_ids and/or workflow_filter."}
+    if workflow_filter is not None:
+        unknown_keys = [key for key in workflow_filter if key not in _WORKFLOW_FILTER_KEYS]
+        if unknown_keys or not any(workflow_filter.get(key) is not None for key in _WORKFLOW_FILTER_KEYS):
+            return {"status": "failure", "message": f"workflow_filter needs at least one of {list(_WORKFLOW_FILTER_KEYS)}; unknown keys: {unknown_keys}"}
+    concurrency = concurrency if concurrency and concurrency > 0 else BULK_ACTION_CONCURRENCY
+    max_retries = max_retries if max_retries is not None and max_retries >= 0 else BULK_ACTION_MAX_RETRIES
+    logging.info(f"bulk_workflow_action '{action}' called (ids: {len(workflow_ids or [])}, filter: {workflow_filter}, dry_run: {dry_run})")
+
+    try:
+        # Resolve the selection; tags seen in listings save a lookup for add/remove_tags
+        selected: dict[str, Optional[str]] = {workflow_id: None for workflow_id in workflow_ids or []}
+        known_tags: dict[str, list[str]] = {}
+        if workflow_filter:
+            params = {key: workflow_filter[key] for key in _WORKFLOW_FILTER_KEYS if workflow_filter.get(key) is not None}
+            params["limit"] = WORKFLOW_PAGE_SIZE
+            async for page in _iter_workflow_pages(params):
+                for wf in page.data:
+                    selected[wf.id] = wf.name
+                    if wf.tags is not None:
+                        known_tags[wf.id] = [tag.id for tag in wf.tags]
+
+        if dry_run:
+            return {
+                "status": "success",
+                "action": action,
+                "dry_run": True,
+                "total": len(selected),
+                "workflows": [{"id": workflow_id, "name": name} for workflow_id, name in selected.items()]
+            }
+
+        async def perform(workflow_id: str) -> dict[str, Any]:
+            if action == "activate":
+                workflow: Workflow = await n8n_client.activate_workflow(workflow_id=workflow_id)
+                workflow_index.set_status(workflow_id, workflow.name, workflow.active)
+                return {"name": workflow.name, "active": workflow.active}
+            if action == "deactivate":
+                workflow = await n8n_client.deactivate_workflow(workflow_id=workflow_id)
+                workflow_index.set_status(workflow_id, workflow.name, workflow.active)
+                return {"name": workflow.name, "active": workflow.active}
+            if action == "delete":
+                workflow = await n8n_client.delete_workflow(workflow_id=workflow_id)
+                workflow_index.remove(workflow_id)
+                return {"name": workflow.name}
+            new_tag_ids = list(tag_ids or [])
+            if action != "set_tags":
+                current_tag_ids = known_tags.get(workflow_id)
+                if current_tag_ids is None:
+                    current_tag_ids = [tag.id for tag in await n8n_client.get_workflow_tags(workflow_id=workflow_id)]
+                if action == "add_tags":
+                    new_tag_ids = list(dict.fromkeys(current_tag_ids + new_tag_ids))
+                else:
+                    new_tag_ids = [tag_id for tag_id in current_tag_ids if tag_id not in tag_ids]
+            tags = await n8n_client.update_workflow_tags(workflow_id=workflow_id, tags=[{"id": tag_id} for tag_id in new_tag_ids])
+            return {"tags": [{"id": tag.id, "name": tag.name} for tag in tags]}
+
+        async def run_item(workflow_id: str) -> dict[str, Any]:
+            try:
+                details = await call_with_retries(
+                    lambda: perform(workflow_id),
+                    max_retries,
+                    BULK_ACTION_RETRY_BACKOFF_SECONDS,
+                    f"{action} of workflow {workflow_id}"
+                )
+                return {"id": workflow_id, "status": "success", **details}
+            except Exception as e:
+                logging.error(f"bulk_workflow_action '{action}' failed for workflow {workflow_id}: {e}")
+                return {"id": workflow_id, "status": "failure", "message": str(e)}
+            finally:
+                _invalidate_workflow(workflow_id)
+
+        results = await map_bounded(list(selected), run_item, concurrency)
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        failed = len(results) - succeeded
+        return {
+            "status": "success" if not failed else ("partial" if succeeded else "failure"),
+            "action": action,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": failed,
+            "results": results
+        }
+    except Exception as e:
+        logging.error(f"Error in bulk_workflow_action '{action}': {e}", exc_info=True)
+        return {"status": "failure", "message": f"Failed to run bulk action: {str(e)}"}
 
 @app.tool()
 async def delete_workflow(workflow_id: str) -> dict[str, Any]:
@@ -298,11 +800,12 @@ async def delete_workflow(workflow_id: str) -> dict[str, Any]:
     if not n8n_client:
         return {"status": "failure", "message": "n8n_client is not initialized."}
     try:
-        workflow: Workflow = await n8n_client.get_workflow(workflow_id=workflow_id)
+        workflow: Workflow = await get_workflow_cached(workflow_id)
         workflow_name = workflow.name
         
         deleted_workflow: Workflow = await n8n_client.delete_workflow(workflow_id=workflow_id)
         logging.info(f"Workflow '{deleted_workflow.name}' (ID: {workflow_id}) deleted successfully.")
+        workflow_index.remove(workflow_id)
         return {
             "status": "success",
             "message": f"Workflow '{workflow_name}' (ID: {workflow_id}) deleted successfully."
@@ -310,6 +813,8 @@ async def delete_workflow(workflow_id: str) -> dict[str, Any]:
     except Exception as e:
         logging.error(f"Error deleting workflow {workflow_id}: {e}", exc_info=True)
         return {"status": "failure", "message": f"Failed to delete workflow: {str(e)}"}
+    finally:
+        _invalidate_workflow(workflow_id)
 
 @app.tool()
 async def activate_workflow(workflow_id: str) -> dict[str, Any]:
@@ -339,6 +844,7 @@ async def activate_workflow(workflow_id: str) -> dict[str, Any]:
     try:
         workflow: Workflow = await n8n_client.activate_workflow(workflow_id=workflow_id)
         logging.info(f"Workflow '{workflow.name}' activated successfully.")
+        workflow_index.set_status(workflow_id, workflow.name, workflow.active)
         return {
             "status": "success",
             "message": f"Workflow '{workflow.name}' activated successfully.",
@@ -351,6 +857,8 @@ async def activate_workflow(workflow_id: str) -> dict[str, Any]:
     except Exception as e:
         logging.error(f"Error activating workflow {workflow_id}: {e}", exc_info=True)
         return {"status": "failure", "message": f"Failed to activate workflow: {str(e)}"}
+    finally:
+        _invalidate_workflow(workflow_id)
 
 @app.tool()
 async def deactivate_workflow(workflow_id: str) -> dict[str, Any]:
@@ -382,6 +890,7 @@ async def deactivate_workflow(workflow_id: str) -> dict[str, Any]:
     try:
         workflow: Workflow = await n8n_client.deactivate_workflow(workflow_id=workflow_id)
         logging.info(f"Workflow '{workflow.name}' deactivated successfully.")
+        workflow_index.set_status(workflow_id, workflow.name, workflow.active)
         return {
             "status": "success",
             "message": f"Workflow '{workflow.name}' deactivated successfully.",
@@ -393,4 +902,6 @@ async def deactivate_workflow(workflow_id: str) -> dict[str, Any]:
         }
     except Exception as e:
         logging.error(f"Error deactivating workflow {workflow_id}: {e}", exc_info=True)
-        return {"status": "failure", "message": f"Failed to deactivate workflow: {str(e)}"} 
\ No newline at end of file
+        return {"status": "failure", "message": f"Failed to deactivate workflow: {str(e)}"}
+    finally:
+        _invalidate_workflow(workflow_id) 
\ No newline at end of file
@@ -0,0 +1,127 @@
+'''
+Short-lived, size-bounded cache of workflows fetched from the n8n API.
+'''
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from n8n_sdk_python.models.workflows import Workflow
+
+from config import n8n_client, WORKFLOW_CACHE_TTL_SECONDS, WORKFLOW_CACHE_MAX_BYTES
+
+# (workflow_id, exclude_pinned_data) as passed to n8n_client.get_workflow
+CacheKey = tuple[str, Optional[bool]]
+
+class WorkflowCache:
+    """
+    Async-safe LRU cache of Workflow models with a TTL and a byte budget.
+
+    Entries are keyed on workflow id and the exclude_pinned_data flag, and
+    sized by their serialized JSON length; the least recently used entries
+    are evicted once the total exceeds max_bytes. Concurrent misses for the
+    same key share a single upstream request. Writers must call
+    invalidate() so later reads do not serve a stale copy; a fetch that was
+    already in flight when its workflow was invalidated is not cached.
+
+    Cached models are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, ttl_seconds: float, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, tuple[Workflow, int, float]] = OrderedDict()
+        self._size = 0
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        # Bumped by invalidate() so in-flight fetches of an old version are discarded
+        self._epochs: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_bytes > 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def peek(self, key: CacheKey) -> Optional[Workflow]:
+        """Return a fresh cached workflow without fetching, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        workflow, _, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return workflow
+
+    def put(self, key: CacheKey, workflow: Workflow) -> None:
+        """Store a workflow, evicting least recently used entries beyond the byte budget."""
+        if not self.enabled:
+            return
+        size = len(workflow.model_dump_json(exclude_none=True))
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (workflow, size, time.monotonic() + self.ttl_seconds)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    async def get(self, key: CacheKey, fetch: Callable[[], Awaitable[Workflow]]) -> Workflow:
+        """Return the cached workflow for key, calling fetch() once on a miss."""
+        if not self.enabled:
+            return await fetch()
+        workflow = self.peek(key)
+        if workflow is not None:
+            self.hits += 1
+            return workflow
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            epoch = self._epochs.get(key[0], 0)
+            pending = asyncio.ensure_future(fetch())
+            self._inflight[key] = pending
+
+            def _done(future: asyncio.Future) -> None:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+                if not future.cancelled() and future.exception() is None and self._epochs.get(key[0], 0) == epoch:
+                    self.put(key, future.result())
+
+            pending.add_done_callback(_done)
+        else:
+            self.hits += 1
+        # Shield the shared fetch so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(pending)
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Drop every cached variant of a workflow after it was modified or deleted."""
+        self._epochs[workflow_id] = self._epochs.get(workflow_id, 0) + 1
+        for key in [key for key in self._entries if key[0] == workflow_id]:
+            self._remove(key)
+        for key in [key for key in self._inflight if key[0] == workflow_id]:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+# Shared cache used by the workflow tools and the n8n:/workflow resource
+workflow_cache = WorkflowCache(WORKFLOW_CACHE_TTL_SECONDS, WORKFLOW_CACHE_MAX_BYTES)
+
+async def get_workflow_cached(workflow_id: str, exclude_pinned_data: Optional[bool] = None) -> Workflow:
+    """Fetch a workflow through the shared cache; raises like n8n_client.get_workflow."""
+    if not n8n_client:
+        raise RuntimeError("n8n_client is not initialized.")
+    return await workflow_cache.get(
+        (workflow_id, exclude_pinned_data),
+        lambda: n8n_client.get_workflow(workflow_id=workflow_id, exclude_pinned_data=exclude_pinned_data)
+    )
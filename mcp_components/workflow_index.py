@@ -0,0 +1,215 @@
+'''
+Inverted index over workflow contents for cross-workflow queries.
+
+Maps node types, credential ids, webhook paths and called sub-workflow ids
+to the workflows (and node names) that use them. The index is built from
+the local workflow mirror, follows each mirror sync, and is updated
+directly when workflows are written through this server.
+'''
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from n8n_sdk_python.models.workflows import Node, Workflow
+
+from mcp_components.workflow_mirror import workflow_mirror
+
+# Index dimensions, as accepted by query()
+DIMENSIONS: tuple[str, ...] = ("node_type", "credential_id", "webhook_path", "sub_workflow_id")
+
+# Nodes whose 'path' parameter is the webhook path they listen on
+_WEBHOOK_NODE_TYPES: frozenset[str] = frozenset({
+    "n8n-nodes-base.webhook",
+    "n8n-nodes-base.formtrigger",
+    "@n8n/n8n-nodes-langchain.mcptrigger"
+})
+
+# Nodes whose 'workflowId' parameter names the workflow they call
+_SUB_WORKFLOW_NODE_TYPES: frozenset[str] = frozenset({
+    "n8n-nodes-base.executeworkflow",
+    "@n8n/n8n-nodes-langchain.toolworkflow"
+})
+
+def normalize_key(dimension: str, value: str) -> str:
+    """Normalize a query or index value: node types are case-insensitive, paths ignore surrounding slashes."""
+    value = value.strip()
+    if dimension == "node_type":
+        return value.lower()
+    if dimension == "webhook_path":
+        return value.strip("/")
+    return value
+
+def _locator_value(value: Any) -> Optional[str]:
+    """Read a plain id or an n8n resource locator ({"__rl": true, "value": ...})."""
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(value, (str, int)) and str(value).strip() and not str(value).startswith("="):
+        return str(value).strip()
+    return None
+
+def node_keys(node: Node) -> list[tuple[str, str]]:
+    """Return the (dimension, key) pairs a node contributes to the index."""
+    keys = [("node_type", normalize_key("node_type", node.type))]
+    for credential in (node.credentials or {}).values():
+        if credential.id:
+            keys.append(("credential_id", normalize_key("credential_id", credential.id)))
+    node_type = node.type.lower()
+    parameters = node.parameters or {}
+    if node_type in _WEBHOOK_NODE_TYPES:
+        path = parameters.get("path") or node.webhookId
+        if isinstance(path, str) and path.strip("/ "):
+            keys.append(("webhook_path", normalize_key("webhook_path", path)))
+    if node_type in _SUB_WORKFLOW_NODE_TYPES and parameters.get("source", "database") == "database":
+        sub_workflow_id = _locator_value(parameters.get("workflowId"))
+        if sub_workflow_id:
+            keys.append(("sub_workflow_id", sub_workflow_id))
+    return keys
+
+class WorkflowIndex:
+    """
+    In-memory inverted index: (dimension, key) -> {workflow id: matching node names}.
+
+    The first query builds it from the mirror; afterwards it is kept current
+    incrementally through the mirror's sync listener and update()/remove().
+    """
+
+    def __init__(self):
+        self._postings: dict[tuple[str, str], dict[str, list[str]]] = {}
+        # Keys contributed by each workflow, to unindex it on update or removal
+        self._workflow_keys: dict[str, set[tuple[str, str]]] = {}
+        self._names: dict[str, tuple[Optional[str], Optional[bool]]] = {}
+        # Short node type ('slack') -> full lowercased types ('n8n-nodes-base.slack')
+        self._short_types: dict[str, set[str]] = {}
+        self._lock = asyncio.Lock()
+        self.built = False
+
+    def remove(self, workflow_id: str) -> None:
+        """Unindex a workflow."""
+        for key in self._workflow_keys.pop(workflow_id, set()):
+            workflows = self._postings.get(key)
+            if workflows is None:
+                continue
+            workflows.pop(workflow_id, None)
+            if not workflows:
+                del self._postings[key]
+                if key[0] == "node_type":
+                    short = key[1].rsplit(".", 1)[-1]
+                    types = self._short_types.get(short)
+                    if types is not None:
+                        types.discard(key[1])
+                        if not types:
+                            del self._short_types[short]
+        self._names.pop(workflow_id, None)
+
+    def update(self, workflow: Workflow) -> None:
+        """(Re)index a workflow; a no-op until the index is built, since the build reads the mirror."""
+        if not self.built or not workflow.id:
+            return
+        self._add(workflow)
+
+    def set_status(self, workflow_id: str, name: Optional[str], active: Optional[bool]) -> None:
+        """Record an activation change, which leaves the indexed contents as they are."""
+        if workflow_id in self._names:
+            self._names[workflow_id] = (name, active)
+
+    def _add(self, workflow: Workflow) -> None:
+        self.remove(workflow.id)
+        keys: set[tuple[str, str]] = set()
+        for node in workflow.nodes or []:
+            for key in node_keys(node):
+                keys.add(key)
+                nodes = self._postings.setdefault(key, {}).setdefault(workflow.id, [])
+                if node.name not in nodes:
+                    nodes.append(node.name)
+                if key[0] == "node_type":
+                    self._short_types.setdefault(key[1].rsplit(".", 1)[-1], set()).add(key[1])
+        self._workflow_keys[workflow.id] = keys
+        self._names[workflow.id] = (workflow.name, workflow.active)
+
+    def apply(self, updated: list[Workflow], removed: list[str]) -> None:
+        """Mirror listener: fold the changes of one sync into the index."""
+        if not self.built:
+            return
+        for workflow_id in removed:
+            self.remove(workflow_id)
+        for workflow in updated:
+            self._add(workflow)
+
+    async def ensure(self) -> bool:
+        """Build the index from the mirror if needed; returns False while the mirror is not synced."""
+        if self.built:
+            return True
+        if not workflow_mirror.ready:
+            return False
+        async with self._lock:
+            while not self.built:
+                started = time.monotonic()
+                generation = workflow_mirror.generation
+                workflows = await workflow_mirror.workflows()
+                if generation != workflow_mirror.generation:
+                    # A sync landed while reading; read again so its changes are not lost
+                    continue
+                self._postings.clear()
+                self._workflow_keys.clear()
+                self._names.clear()
+                self._short_types.clear()
+                for workflow in workflows:
+                    if workflow.id:
+                        self._add(workflow)
+                self.built = True
+                logging.info(
+                    f"Workflow index built: {len(workflows)} workflows, {len(self._postings)} keys "
+                    f"in {time.monotonic() - started:.2f}s"
+                )
+        return True
+
+    def _matches(self, dimension: str, value: str) -> dict[str, list[str]]:
+        key = normalize_key(dimension, value)
+        keys = [(dimension, key)]
+        if dimension == "node_type" and "." not in key:
+            keys = [(dimension, full_type) for full_type in self._short_types.get(key, ())]
+        matches: dict[str, list[str]] = {}
+        for index_key in keys:
+            for workflow_id, nodes in self._postings.get(index_key, {}).items():
+                matches.setdefault(workflow_id, []).extend(nodes)
+        return matches
+
+    def query(self, criteria: dict[str, str]) -> list[dict[str, Any]]:
+        """
+        Return the workflows matching every given criterion (dimension -> value).
+
+        Node types match case-insensitively, either in full ('n8n-nodes-base.slack')
+        or by their short name ('slack'). Each result lists the matching node names.
+        """
+        result: Optional[dict[str, list[str]]] = None
+        for dimension, value in criteria.items():
+            matches = self._matches(dimension, value)
+            if result is None:
+                result = matches
+            else:
+                result = {
+                    workflow_id: list(dict.fromkeys(result[workflow_id] + nodes))
+                    for workflow_id, nodes in matches.items() if workflow_id in result
+                }
+            if not result:
+                return []
+        return [
+            {
+                "id": workflow_id,
+                "name": self._names.get(workflow_id, (None, None))[0],
+                "active": self._names.get(workflow_id, (None, None))[1],
+                "nodes": nodes
+            }
+            for workflow_id, nodes in sorted((result or {}).items())
+        ]
+
+    def stats(self) -> dict[str, int]:
+        counts = {dimension: 0 for dimension in DIMENSIONS}
+        for dimension, _ in self._postings:
+            counts[dimension] += 1
+        return {"workflows": len(self._names), **counts}
+
+# Shared index, fed by the workflow mirror's syncs and by the workflow write tools
+workflow_index = WorkflowIndex()
+workflow_mirror.subscribe(workflow_index.apply)
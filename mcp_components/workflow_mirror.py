@@ -0,0 +1,277 @@
+'''
+Local mirror of the n8n instance's workflow definitions.
+
+A background task started by the lifespan handler in mcp_server.py lists
+all workflows periodically, fetches only those whose updatedAt changed
+since the last sync and stores them in a SQLite file, so the mirror
+survives restarts and cross-workflow reads do not go to the n8n API.
+Pinned data is not mirrored. The file records the n8n base URL it was
+synced from and is emptied when opened for a different instance.
+'''
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from n8n_sdk_python.models.workflows import Workflow, WorkflowList, WorkflowShort
+
+from config import (
+    n8n_client, N8N_BASE_URL,
+    WORKFLOW_MIRROR_PATH, WORKFLOW_MIRROR_SYNC_CONCURRENCY,
+    BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS
+)
+from mcp_components.concurrency import call_with_retries, map_bounded
+from mcp_components.node_files import run_blocking
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    updated_at TEXT,
+    synced_at TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_LIST_PAGE_SIZE = 250
+# Stay below SQLite's limit on bound parameters per statement
+_READ_BATCH_SIZE = 500
+
+# Called after each sync with the fetched workflows and the ids of removed ones
+MirrorListener = Callable[[list[Workflow], list[str]], None]
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+class WorkflowMirror:
+    """
+    SQLite-backed copy of every workflow, kept current by incremental syncs.
+
+    Workflow summaries are held in memory for listings; full definitions are
+    read from SQLite on demand. Write tools call mark_stale() so a changed
+    workflow is not served from the mirror until the next sync refetched it.
+    """
+
+    def __init__(self, path: str, base_url: str):
+        self.path = path
+        # n8n instance the mirrored workflows must come from
+        self.base_url = base_url.strip().rstrip("/")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._sync_lock = asyncio.Lock()
+        self._summaries: dict[str, WorkflowShort] = {}
+        self._updated_at: dict[str, Optional[str]] = {}
+        self._stale: set[str] = set()
+        self.last_synced_at: Optional[datetime] = None
+        # Bumped whenever the mirrored set of workflows changes
+        self.generation = 0
+        self._listeners: list[MirrorListener] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the mirror holds a completed sync (from this run or a previous one)."""
+        return self.is_open and self.last_synced_at is not None
+
+    def open(self) -> None:
+        """Open (or create) the SQLite file and load the stored summaries (blocking)."""
+        if self._connection is not None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.executescript(_SCHEMA)
+        stored = connection.execute("SELECT value FROM meta WHERE key = 'base_url'").fetchone()
+        if stored is None or stored[0] != self.base_url:
+            if stored is not None:
+                logging.info(f"Workflow mirror: discarding workflows of {stored[0]}, now mirroring {self.base_url}")
+            with connection:
+                connection.execute("DELETE FROM workflows")
+                connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('base_url', ?)", (self.base_url,))
+        rows = connection.execute("SELECT id, updated_at, synced_at, summary FROM workflows").fetchall()
+        for workflow_id, updated_at, synced_at, summary in rows:
+            self._summaries[workflow_id] = WorkflowShort.model_validate_json(summary)
+            self._updated_at[workflow_id] = updated_at
+        synced = [row[2] for row in rows]
+        self.last_synced_at = datetime.fromisoformat(max(synced)) if synced else None
+        self._connection = connection
+        self.generation += 1
+        logging.info(f"Workflow mirror opened: {self.path} ({len(rows)} workflows)")
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def subscribe(self, listener: MirrorListener) -> None:
+        """Register a callback that receives the changes of every sync."""
+        self._listeners.append(listener)
+
+    def mark_stale(self, workflow_id: str) -> None:
+        """Stop serving a workflow from the mirror until the next sync refetched it."""
+        self._stale.add(workflow_id)
+
+    def summaries(self) -> list[WorkflowShort]:
+        """Summaries of all mirrored workflows, including stale ones."""
+        return list(self._summaries.values())
+
+    def _read(self, workflow_ids: list[str]) -> dict[str, str]:
+        rows: dict[str, str] = {}
+        with self._db_lock:
+            if self._connection is None:
+                return rows
+            for start in range(0, len(workflow_ids), _READ_BATCH_SIZE):
+                batch = workflow_ids[start:start + _READ_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.update(self._connection.execute(
+                    f"SELECT id, data FROM workflows WHERE id IN ({placeholders})", batch
+                ).fetchall())
+        return rows
+
+    async def get(self, workflow_id: str) -> Optional[Workflow]:
+        """Return the mirrored workflow, or None if it is not mirrored or stale."""
+        if not self.is_open or workflow_id in self._stale or workflow_id not in self._summaries:
+            return None
+        data = (await run_blocking(self._read, [workflow_id])).get(workflow_id)
+        return Workflow.model_validate_json(data) if data else None
+
+    async def workflows(self, workflow_ids: Optional[list[str]] = None) -> list[Workflow]:
+        """Load mirrored workflows (all of them by default) in one query."""
+        if not self.is_open:
+            return []
+        ids = list(self._summaries) if workflow_ids is None else [i for i in workflow_ids if i in self._summaries]
+        if not ids:
+            return []
+        rows = await run_blocking(self._read, ids)
+        return [Workflow.model_validate_json(rows[i]) for i in ids if i in rows]
+
+    def _write(self, upserts: list[tuple[str, Optional[str], str, str, str]], deletes: list[str]) -> None:
+        with self._db_lock:
+            if self._connection is None:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO workflows (id, updated_at, synced_at, summary, data) VALUES (?, ?, ?, ?, ?)",
+                    upserts
+                )
+                self._connection.executemany("DELETE FROM workflows WHERE id = ?", [(i,) for i in deletes])
+
+    async def _list_all(self) -> dict[str, WorkflowShort]:
+        listed: dict[str, WorkflowShort] = {}
+        cursor: Optional[str] = None
+        while True:
+            page: WorkflowList = await call_with_retries(
+                lambda: n8n_client.list_workflows(limit=_LIST_PAGE_SIZE, cursor=cursor),
+                BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS, "Mirror workflow listing"
+            )
+            for workflow in page.data or []:
+                listed[workflow.id] = workflow
+            cursor = page.nextCursor
+            if not cursor:
+                return listed
+
+    async def sync(self) -> dict[str, Any]:
+        """List all workflows and fetch the ones whose updatedAt changed; returns a sync report."""
+        if not n8n_client:
+            raise RuntimeError("n8n_client is not initialized.")
+        if not self.is_open:
+            raise RuntimeError("Workflow mirror is not open.")
+        async with self._sync_lock:
+            started = time.monotonic()
+            listed = await self._list_all()
+            changed = [
+                workflow_id for workflow_id, summary in listed.items()
+                if workflow_id in self._stale
+                or workflow_id not in self._updated_at
+                or summary.updatedAt is None
+                or self._updated_at[workflow_id] != _timestamp(summary.updatedAt)
+            ]
+            removed = [workflow_id for workflow_id in self._summaries if workflow_id not in listed]
+
+            async def fetch(workflow_id: str) -> Optional[Workflow]:
+                # A write during the fetch marks the workflow stale again
+                self._stale.discard(workflow_id)
+                try:
+                    return await call_with_retries(
+                        lambda: n8n_client.get_workflow(workflow_id=workflow_id, exclude_pinned_data=True),
+                        BULK_ACTION_MAX_RETRIES, BULK_ACTION_RETRY_BACKOFF_SECONDS,
+                        f"Mirror fetch of workflow {workflow_id}"
+                    )
+                except Exception as e:
+                    logging.warning(f"Workflow mirror: failed to fetch {workflow_id}: {e}")
+                    self._stale.add(workflow_id)
+                    return None
+
+            fetched = await map_bounded(changed, fetch, WORKFLOW_MIRROR_SYNC_CONCURRENCY)
+            synced_at = datetime.now(timezone.utc)
+            upserts: list[tuple[str, Optional[str], str, str, str]] = []
+            summaries: dict[str, WorkflowShort] = {}
+            updated: list[Workflow] = []
+            for workflow in fetched:
+                if workflow is None or workflow.id is None:
+                    continue
+                updated.append(workflow)
+                summary = WorkflowShort(
+                    id=workflow.id, name=workflow.name, active=workflow.active,
+                    createdAt=workflow.createdAt, updatedAt=workflow.updatedAt, tags=workflow.tags
+                )
+                summaries[workflow.id] = summary
+                upserts.append((
+                    workflow.id, _timestamp(workflow.updatedAt), synced_at.isoformat(),
+                    summary.model_dump_json(exclude_none=True), workflow.model_dump_json(exclude_none=True)
+                ))
+            await run_blocking(self._write, upserts, removed)
+
+            for workflow_id in removed:
+                self._summaries.pop(workflow_id, None)
+                self._updated_at.pop(workflow_id, None)
+                self._stale.discard(workflow_id)
+            for workflow_id, summary in summaries.items():
+                self._summaries[workflow_id] = summary
+                self._updated_at[workflow_id] = _timestamp(summary.updatedAt)
+            if upserts or removed:
+                self.generation += 1
+                for listener in self._listeners:
+                    try:
+                        listener(updated, removed)
+                    except Exception as e:
+                        logging.error(f"Workflow mirror listener failed: {e}", exc_info=True)
+            self.last_synced_at = synced_at
+            report = {
+                "listed": len(listed),
+                "fetched": len(upserts),
+                "failed": len(changed) - len(upserts),
+                "removed": len(removed),
+                "seconds": round(time.monotonic() - started, 2)
+            }
+            logging.info(f"Workflow mirror synced: {json.dumps(report)}")
+            return report
+
+    async def run(self, interval_seconds: float) -> None:
+        """Sync forever, every interval_seconds; errors are logged and retried next round."""
+        while True:
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Workflow mirror sync failed: {e}", exc_info=True)
+            await asyncio.sleep(interval_seconds)
+
+# Shared mirror, synced in the background by the lifespan handler
+# (every WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS; 0 disables it)
+workflow_mirror = WorkflowMirror(WORKFLOW_MIRROR_PATH, N8N_BASE_URL)
@@ -0,0 +1,279 @@
+'''
+Server-side editing of workflow definitions through small patches.
+
+Two patch formats are supported on a workflow document with the keys
+name, nodes, connections, settings and staticData:
+
+- node-level operations (add/remove/update/rename a node, add/remove a
+  connection, set a workflow setting or the workflow name), addressed by
+  node name;
+- RFC 6902 JSON Patch operations with RFC 6901 JSON Pointers.
+'''
+import copy
+from typing import Any, Optional
+
+NODE_OPERATIONS: tuple[str, ...] = (
+    "add_node", "remove_node", "update_node", "rename_node",
+    "add_connection", "remove_connection", "set_setting", "set_name"
+)
+
+class WorkflowPatchError(ValueError):
+    """Raised when a patch operation is malformed or does not apply to the workflow."""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(f"Operation {index}: {message}")
+        self.index = index
+
+# --- node-level operations ---
+
+def _find_node(document: dict[str, Any], name: str) -> Optional[dict[str, Any]]:
+    return next((node for node in document["nodes"] if node.get("name") == name), None)
+
+def _set_path(target: dict[str, Any], path: str, value: Any) -> None:
+    """Set a dotted path such as 'parameters.options.timeout', creating objects on the way."""
+    keys = path.split(".")
+    for key in keys[:-1]:
+        child = target.get(key)
+        if not isinstance(child, dict):
+            child = target[key] = {}
+        target = child
+    target[keys[-1]] = value
+
+def _unset_path(target: dict[str, Any], path: str) -> None:
+    keys = path.split(".")
+    for key in keys[:-1]:
+        target = target.get(key)
+        if not isinstance(target, dict):
+            return
+    target.pop(keys[-1], None)
+
+def _connection_slots(document: dict[str, Any], source: str, connection_type: str, output: int) -> list[dict[str, Any]]:
+    """Return the target list of one output of a node, creating it if needed."""
+    outputs = document["connections"].setdefault(source, {}).setdefault(connection_type, [])
+    while len(outputs) <= output:
+        outputs.append([])
+    return outputs[output]
+
+def _remove_node_connections(document: dict[str, Any], name: str) -> None:
+    """Drop every connection from or to a node."""
+    connections = document["connections"]
+    connections.pop(name, None)
+    for by_type in connections.values():
+        for outputs in by_type.values():
+            for index, targets in enumerate(outputs):
+                outputs[index] = [target for target in targets if target.get("node") != name]
+
+def _rename_node_connections(document: dict[str, Any], old_name: str, new_name: str) -> None:
+    connections = document["connections"]
+    if old_name in connections:
+        connections[new_name] = connections.pop(old_name)
+    for by_type in connections.values():
+        for outputs in by_type.values():
+            for targets in outputs:
+                for target in targets:
+                    if target.get("node") == old_name:
+                        target["node"] = new_name
+
+def _apply_node_operation(document: dict[str, Any], index: int, operation: dict[str, Any]) -> None:
+    op = operation.get("op")
+    if op == "add_node":
+        node = operation.get("node")
+        if not isinstance(node, dict) or not node.get("name") or not node.get("type"):
+            raise WorkflowPatchError(index, "add_node requires a 'node' object with 'name' and 'type'")
+        if _find_node(document, node["name"]) is not None:
+            raise WorkflowPatchError(index, f"a node named '{node['name']}' already exists")
+        node = copy.deepcopy(node)
+        node.setdefault("parameters", {})
+        node.setdefault("position", [0, 0])
+        node.setdefault("typeVersion", 1)
+        document["nodes"].append(node)
+
+    elif op in ("remove_node", "update_node", "rename_node"):
+        name = operation.get("name")
+        node = _find_node(document, name) if isinstance(name, str) else None
+        if node is None:
+            raise WorkflowPatchError(index, f"node '{name}' not found")
+        if op == "remove_node":
+            document["nodes"].remove(node)
+            _remove_node_connections(document, name)
+        elif op == "rename_node":
+            new_name = operation.get("new_name")
+            if not isinstance(new_name, str) or not new_name:
+                raise WorkflowPatchError(index, "rename_node requires 'new_name'")
+            if new_name != name and _find_node(document, new_name) is not None:
+                raise WorkflowPatchError(index, f"a node named '{new_name}' already exists")
+            node["name"] = new_name
+            _rename_node_connections(document, name, new_name)
+        else:
+            changes = operation.get("set") or {}
+            removals = operation.get("unset") or []
+            if not isinstance(changes, dict) or not isinstance(removals, list) or not (changes or removals):
+                raise WorkflowPatchError(index, "update_node requires a 'set' object and/or an 'unset' list of dotted paths")
+            for path, value in changes.items():
+                if path == "name":
+                    raise WorkflowPatchError(index, "use rename_node to change a node's name")
+                _set_path(node, path, copy.deepcopy(value))
+            for path in removals:
+                _unset_path(node, path)
+
+    elif op in ("add_connection", "remove_connection"):
+        source, target = operation.get("from"), operation.get("to")
+        connection_type = operation.get("type", "main")
+        output, input_index = operation.get("output", 0), operation.get("input", 0)
+        for node_name in (source, target):
+            if not isinstance(node_name, str) or _find_node(document, node_name) is None:
+                raise WorkflowPatchError(index, f"node '{node_name}' not found")
+        if not isinstance(output, int) or not isinstance(input_index, int) or output < 0 or input_index < 0:
+            raise WorkflowPatchError(index, "'output' and 'input' must be non-negative integers")
+        connection = {"node": target, "type": connection_type, "index": input_index}
+        if op == "add_connection":
+            targets = _connection_slots(document, source, connection_type, output)
+            if connection not in targets:
+                targets.append(connection)
+        else:
+            outputs = document["connections"].get(source, {}).get(connection_type, [])
+            if output >= len(outputs) or connection not in outputs[output]:
+                raise WorkflowPatchError(index, f"no {connection_type} connection from '{source}' output {output} to '{target}' input {input_index}")
+            outputs[output].remove(connection)
+
+    elif op == "set_setting":
+        key = operation.get("key")
+        if not isinstance(key, str) or "value" not in operation:
+            raise WorkflowPatchError(index, "set_setting requires 'key' and 'value'")
+        settings = document.get("settings")
+        if not isinstance(settings, dict):
+            settings = document["settings"] = {}
+        settings[key] = copy.deepcopy(operation["value"])
+
+    elif op == "set_name":
+        value = operation.get("value")
+        if not isinstance(value, str) or not value:
+            raise WorkflowPatchError(index, "set_name requires a non-empty 'value'")
+        document["name"] = value
+
+    else:
+        raise WorkflowPatchError(index, f"unknown op '{op}'. Valid ops: {list(NODE_OPERATIONS)}")
+
+def apply_node_operations(document: dict[str, Any], operations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply node-level operations to a copy of a workflow document and return it."""
+    document = copy.deepcopy(document)
+    document.setdefault("nodes", [])
+    document.setdefault("connections", {})
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise WorkflowPatchError(index, "each operation must be an object")
+        _apply_node_operation(document, index, operation)
+    return document
+
+# --- RFC 6902 JSON Patch ---
+
+def _parse_pointer(index: int, pointer: Any) -> list[str]:
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise WorkflowPatchError(index, f"invalid JSON pointer {pointer!r}")
+    if pointer == "":
+        return []
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+def _array_index(index: int, container: list[Any], token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise WorkflowPatchError(index, f"invalid array index '{token}'")
+    position = int(token)
+    if position > len(container) or (position == len(container) and not allow_end):
+        raise WorkflowPatchError(index, f"array index {position} out of range")
+    return position
+
+def _resolve_parent(index: int, document: Any, tokens: list[str]) -> Any:
+    current = document
+    for token in tokens[:-1]:
+        if isinstance(current, dict) and token in current:
+            current = current[token]
+        elif isinstance(current, list):
+            current = current[_array_index(index, current, token, allow_end=False)]
+        else:
+            raise WorkflowPatchError(index, f"path segment '{token}' not found")
+    return current
+
+def _get(index: int, document: Any, tokens: list[str]) -> Any:
+    if not tokens:
+        return document
+    parent = _resolve_parent(index, document, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise WorkflowPatchError(index, f"path segment '{token}' not found")
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_array_index(index, parent, token, allow_end=False)]
+    raise WorkflowPatchError(index, f"path segment '{token}' not found")
+
+def _add(index: int, document: Any, tokens: list[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve_parent(index, document, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(index, parent, token, allow_end=True), value)
+    else:
+        raise WorkflowPatchError(index, f"cannot add to a non-container at '{token}'")
+    return document
+
+def _remove(index: int, document: Any, tokens: list[str]) -> Any:
+    if not tokens:
+        raise WorkflowPatchError(index, "cannot remove the whole document")
+    parent = _resolve_parent(index, document, tokens)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise WorkflowPatchError(index, f"path segment '{token}' not found")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(index, parent, token, allow_end=False))
+    raise WorkflowPatchError(index, f"path segment '{token}' not found")
+
+def apply_json_patch(document: dict[str, Any], patch: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply an RFC 6902 JSON Patch to a copy of a document and return it; the patch is atomic."""
+    document = copy.deepcopy(document)
+    for index, operation in enumerate(patch):
+        if not isinstance(operation, dict):
+            raise WorkflowPatchError(index, "each operation must be an object")
+        op = operation.get("op")
+        tokens = _parse_pointer(index, operation.get("path"))
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise WorkflowPatchError(index, f"'{op}' requires 'value'")
+        if op == "add":
+            document = _add(index, document, tokens, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(index, document, tokens)
+        elif op == "replace":
+            _get(index, document, tokens)
+            value = copy.deepcopy(operation["value"])
+            if not tokens:
+                document = value
+            else:
+                parent = _resolve_parent(index, document, tokens)
+                if isinstance(parent, list):
+                    parent[_array_index(index, parent, tokens[-1], allow_end=False)] = value
+                else:
+                    parent[tokens[-1]] = value
+        elif op in ("move", "copy"):
+            from_tokens = _parse_pointer(index, operation.get("from"))
+            if op == "move" and tokens[:len(from_tokens)] == from_tokens and tokens != from_tokens:
+                raise WorkflowPatchError(index, "cannot move a value into one of its children")
+            value = _get(index, document, from_tokens)
+            if op == "move":
+                _remove(index, document, from_tokens)
+            else:
+                value = copy.deepcopy(value)
+            document = _add(index, document, tokens, value)
+        elif op == "test":
+            if _get(index, document, tokens) != operation["value"]:
+                raise WorkflowPatchError(index, f"test failed at {operation.get('path')!r}")
+        else:
+            raise WorkflowPatchError(index, f"unknown op '{op}'")
+    if not isinstance(document, dict):
+        raise WorkflowPatchError(len(patch) - 1, "the patched workflow must remain an object")
+    return document
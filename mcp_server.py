@@ -2,27 +2,41 @@
 Centralized FastMCP application instance creation.
 """
 import os
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 from contextlib import asynccontextmanager
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 # Import configurations needed for lifespan and app setup
 from config import (
     N8N_BASE_URL, N8N_API_KEY,
     CATEGORY_CLASSIFICATION_FILE_PATH, CLASS_CLASSIFICATION_FILE_PATH,
+    WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS,
     n8n_client
 )
+from mcp_components.node_catalog import node_catalog
+from mcp_components.node_index import node_index
+from mcp_components.node_search import node_search
+from mcp_components.workflow_mirror import workflow_mirror
+from mcp_components.http_pool import n8n_http_pool
+from mcp_components import node_files
 
-# Lifespan handler now resides here to be bundled with app creation
-@asynccontextmanager
-async def lifespan_handler(app_instance: FastMCP) -> Any:
-    """Lifespan handler for the MCP server application."""
-    logging.info(f"MCP Server ({app_instance.name}) starting up via lifespan...")
+# Process-wide resources (node index and catalog, search index, workflow mirror sync,
+# HTTP pool) are shared by all sessions. FastMCP enters the lifespan once per client
+# session on the SSE and streamable HTTP transports, so the first session starts them
+# and the last one to end stops them.
+_active_sessions = 0
+_sessions_lock = asyncio.Lock()
+_background_tasks: list[asyncio.Task] = []
+
+async def _start_shared_resources() -> None:
     if not n8n_client:
         logging.error("Lifespan: n8n_client is not initialized. MCP server might not function correctly.")
     else:
         logging.info(f"Lifespan: n8n_client confirmed initialized for {N8N_BASE_URL}")
+        # All tools share one pool of keep-alive connections to n8n
+        n8n_http_pool.install(n8n_client)
 
     if not os.path.exists(CATEGORY_CLASSIFICATION_FILE_PATH):
         logging.error(f"Lifespan: Category classification file not found: {CATEGORY_CLASSIFICATION_FILE_PATH}")
@@ -33,10 +47,59 @@ async def lifespan_handler(app_instance: FastMCP) -> Any:
         logging.error(f"Lifespan: Class classification file not found: {CLASS_CLASSIFICATION_FILE_PATH}")
     else:
         logging.info(f"Lifespan: Class classification file found: {CLASS_CLASSIFICATION_FILE_PATH}")
-    
-    yield
-    
-    logging.info(f"MCP Server ({app_instance.name}) shutting down via lifespan...")
+
+    try:
+        node_index.open()
+        node_catalog.load()
+        if not node_index.is_open:
+            # No usable prebuilt index: walk the node folders once instead
+            await node_files.run_blocking(node_files.node_manifests.build, node_catalog.node_folders())
+    except Exception as e:
+        logging.error(f"Lifespan: Failed to load node catalog: {e}", exc_info=True)
+
+    # Build the node search index in the background; search_nodes waits for it if needed
+    _background_tasks.append(asyncio.create_task(node_search.ensure(node_catalog)))
+
+    # Keep the local workflow mirror in sync in the background
+    if n8n_client and WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS > 0:
+        try:
+            workflow_mirror.open()
+            _background_tasks.append(asyncio.create_task(workflow_mirror.run(WORKFLOW_MIRROR_SYNC_INTERVAL_SECONDS)))
+        except Exception as e:
+            logging.error(f"Lifespan: Failed to open workflow mirror: {e}", exc_info=True)
+
+async def _stop_shared_resources() -> None:
+    for task in _background_tasks:
+        task.cancel()
+    for task in _background_tasks:
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    _background_tasks.clear()
+    workflow_mirror.close()
+    await n8n_http_pool.aclose()
+    node_files.shutdown_executor()
+    node_index.close()
+
+# Lifespan handler now resides here to be bundled with app creation
+@asynccontextmanager
+async def lifespan_handler(app_instance: FastMCP) -> Any:
+    """Lifespan handler for the MCP server application; runs once per client session."""
+    global _active_sessions
+    async with _sessions_lock:
+        _active_sessions += 1
+        if _active_sessions == 1:
+            logging.info(f"MCP Server ({app_instance.name}) starting up via lifespan...")
+            await _start_shared_resources()
+    try:
+        yield
+    finally:
+        async with _sessions_lock:
+            _active_sessions -= 1
+            if _active_sessions == 0:
+                logging.info(f"MCP Server ({app_instance.name}) shutting down via lifespan...")
+                await _stop_shared_resources()
 
 # Create the global FastMCP application instance
 app = FastMCP(
@@ -47,4 +110,13 @@ app = FastMCP(
     log_level=os.getenv("LOG_LEVEL", "INFO").upper()
 )
 
-logging.info(f"FastMCP app instance created: {app.name}") 
\ No newline at end of file
+logging.info(f"FastMCP app instance created: {app.name}") 
+
+def progress_token(ctx: Optional[Context]) -> Any:
+    """Return the client's progress token for the current tool call, or None."""
+    try:
+        meta = ctx.request_context.meta if ctx else None
+    except ValueError:
+        # Context used outside of a request
+        return None
+    return meta.progressToken if meta else None
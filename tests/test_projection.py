@@ -0,0 +1,37 @@
+'''
+Tests for mcp_components/projection.py.
+'''
+from n8n_sdk_python.models.workflows import Workflow
+
+from mcp_components.projection import dump_projected, parse_fields
+
+def _workflow() -> Workflow:
+    return Workflow.model_validate({
+        "id": "1",
+        "name": "Fetch",
+        "active": False,
+        "nodes": [
+            {
+                "id": "a", "name": "Start", "type": "n8n-nodes-base.manualTrigger",
+                "typeVersion": 1, "position": [0, 0], "parameters": {}
+            },
+            {
+                "id": "b", "name": "Fetch", "type": "n8n-nodes-base.httpRequest",
+                "typeVersion": 4, "position": [200, 0],
+                "parameters": {"url": "https://example.com", "method": "GET"}
+            }
+        ],
+        "connections": {
+            "Start": {"main": [[{"node": "Fetch", "type": "main", "index": 0}]]},
+            "Fetch": {"other": []}
+        },
+        "settings": {}
+    })
+
+def test_list_projection_keeps_keys_missing_from_first_element():
+    projected = dump_projected(_workflow(), parse_fields("nodes.parameters.url"), exclude_none=True)
+    assert projected == {"nodes": [{"parameters": {}}, {"parameters": {"url": "https://example.com"}}]}
+
+def test_wildcard_projection_keeps_keys_missing_from_first_value():
+    projected = dump_projected(_workflow(), parse_fields("connections.*.other"), exclude_none=True)
+    assert projected == {"connections": {"Start": {}, "Fetch": {"other": []}}}
@@ -0,0 +1,31 @@
+'''
+Tests for the optimistic concurrency helpers in mcp_components/tools/workflows.py.
+'''
+from datetime import datetime, timezone
+
+from n8n_sdk_python.models.workflows import Workflow
+
+from mcp_components.tools.workflows import _parse_expected_updated_at, _version_conflict
+
+def _workflow() -> Workflow:
+    return Workflow.model_validate({
+        "id": "1",
+        "name": "Fetch",
+        "active": False,
+        "nodes": [],
+        "connections": {},
+        "settings": {},
+        "versionId": "v1",
+        "updatedAt": "2024-01-01T00:00:00.000Z"
+    })
+
+def test_naive_expected_updated_at_is_utc():
+    assert _parse_expected_updated_at("2024-01-01T00:00:00") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def test_naive_expected_updated_at_matches_current_version():
+    expected = _parse_expected_updated_at("2024-01-01T00:00:00")
+    assert _version_conflict(_workflow(), None, expected) is None
+
+def test_other_expected_updated_at_conflicts():
+    expected = _parse_expected_updated_at("2024-01-01T00:00:01Z")
+    assert _version_conflict(_workflow(), None, expected)["conflict"] is True